@@ -0,0 +1,146 @@
+"""
+Shared plotting helpers for the chart scripts
+"""
+
+from collections import namedtuple
+from functools import lru_cache
+import numpy as np
+from matplotlib.collections import PolyCollection
+
+try:
+    from fast_histogram import histogram1d
+except ImportError:
+    histogram1d = None
+
+
+def cap(values, limit):
+    """Drop values above limit, skipping the mask and copy when none exceed it"""
+    if values.max() <= limit:
+        return values
+    return values[values <= limit]
+
+
+def histogram(values, bins, range=None):
+    """Bin values into uniform bins over range (default: their min/max), returning (counts, edges)"""
+    values = np.asarray(values)
+    lo, hi = range if range is not None else (values.min(), values.max())
+    if lo == hi:
+        lo, hi = lo - 0.5, hi + 0.5
+    edges = np.linspace(lo, hi, bins + 1)
+
+    if histogram1d is None:
+        counts, _ = np.histogram(values, bins=edges)
+        return counts, edges
+
+    # fast-histogram treats the upper bound as exclusive, so nudge it to keep the max
+    counts = histogram1d(values, bins=bins, range=(lo, np.nextafter(hi, np.inf)))
+    return counts, edges
+
+
+def bucket(values, bins):
+    """Index of the right-closed bin each value falls in (as pd.cut), or -1 where pd.cut gives NaN"""
+    codes = np.searchsorted(bins, values, side='left') - 1
+    codes[codes >= len(bins) - 1] = -1
+    return codes
+
+
+def top_counts(column, top):
+    """Labels and counts of a categorical column's `top` most common values, as dropna().value_counts().head(top)"""
+    # bincount over the category codes; code -1 marks a missing value
+    codes = column.cat.codes.to_numpy()
+    counts = np.bincount(codes[codes >= 0], minlength=len(column.cat.categories))
+
+    keep = np.arange(len(counts))
+    if len(counts) > top:
+        # Only categories counting at least the top-th largest count can make the cut (ties included)
+        kth = np.partition(counts, -top)[-top]
+        keep = np.flatnonzero(counts >= kth)
+
+    # Stable, so count ties keep category order as value_counts does
+    keep = keep[np.argsort(-counts[keep], kind='stable')[:top]]
+    return column.cat.categories[keep], counts[keep]
+
+
+Stats = namedtuple('Stats', 'n mean median std min max')
+
+
+def describe(values):
+    """Summary statistics for a stats box, matching pandas (sample std, midpoint median)"""
+    values = np.asarray(values)
+    n = values.size
+
+    # Accumulate in float64 so float32/int16 inputs keep full precision
+    mean = values.sum(dtype=np.float64) / n
+    std = np.sqrt(np.square(values - mean).sum() / (n - 1)) if n > 1 else np.nan
+
+    # Partial sort around the middle instead of a full sort
+    mid = n // 2
+    if n % 2:
+        median = np.partition(values, mid)[mid]
+    else:
+        lower, upper = np.partition(values, [mid - 1, mid])[mid - 1:mid + 1]
+        median = (float(lower) + float(upper)) / 2
+
+    return Stats(n, mean, median, std, values.min(), values.max())
+
+
+def gradient_bars(ax, counts, edges, cmap, values, clim, **kwargs):
+    """Draw histogram bars as one PolyCollection whose face colours come from cmap"""
+    left, right = edges[:-1], edges[1:]
+    bottom = np.zeros_like(counts, dtype=float)
+    verts = np.stack([np.column_stack([left, bottom]), np.column_stack([left, counts]),
+                      np.column_stack([right, counts]), np.column_stack([right, bottom])], axis=1)
+
+    bars = PolyCollection(verts, cmap=cmap, **kwargs)
+    bars.set_array(np.asarray(values))
+    bars.set_clim(*clim)
+    # Keep the bars sitting on the x-axis, as ax.bar does
+    bars.sticky_edges.y.append(0)
+    ax.add_collection(bars)
+    ax.autoscale_view()
+    return bars
+
+
+# Tick formatters. Matplotlib re-formats the same handful of tick values on
+# every layout pass, so the label strings are cached per value.
+@lru_cache(maxsize=256)
+def _price_label(x):
+    if x >= 1000000:
+        return f'{x/1000000:.1f}M'
+    elif x >= 1000:
+        return f'{int(x/1000)}K'
+    return f'{int(x)}'
+
+
+@lru_cache(maxsize=256)
+def _thousands_label(x):
+    if x >= 1000:
+        return f'{int(x/1000)}K'
+    return f'{int(x)}'
+
+
+@lru_cache(maxsize=256)
+def _count_label(x):
+    return f'{int(x):,}'
+
+
+def label_ticks(axis, formatter):
+    """Fix an axis' final ticks and label them once with a tick formatter, instead of on every draw"""
+    lo, hi = sorted(axis.get_view_interval())
+    locs = [x for x in axis.get_ticklocs() if lo <= x <= hi]
+    axis.set_ticks(locs, [formatter(x, pos) for pos, x in enumerate(locs)])
+
+
+def format_price(x, pos):
+    """Format prices with K/M suffixes"""
+    return _price_label(x)
+
+
+def format_thousands(x, pos):
+    """Format numbers with K suffix"""
+    return _thousands_label(x)
+
+
+def format_count(x, pos):
+    """Format counts with thousands separators"""
+    return _count_label(x)
@@ -0,0 +1,141 @@
+"""
+Shared data loading for the chart scripts
+Cleans the combined dataset once and caches the result as Parquet; the caches
+are rebuilt whenever the CSV is newer than them
+"""
+
+import os
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pv
+
+DATA_FILE = 'data/combined_real_estate_bina_format.csv'
+CLEAN_FILE = 'data/combined_real_estate_bina_format.clean.parquet'
+RAW_FILE = 'data/combined_real_estate_bina_format.parquet'
+
+# Only the columns the charts use, with narrow dtypes
+# (floor/floors/rooms stay float32 because they contain missing values)
+DTYPES = {
+    'price_value': 'float32',
+    'area_value': 'float32',
+    'floor': 'float32',
+    'floors': 'float32',
+    'rooms': 'float32',
+    'city_name': 'category',
+    'location_name': 'category',
+    'has_repair': 'boolean',
+    'has_mortgage': 'boolean',
+    'has_bill_of_sale': 'boolean',
+    'vipped': 'boolean',
+    'featured': 'boolean',
+}
+
+# The same columns as Arrow types for the streaming CSV reader
+ARROW_TYPES = {
+    column: {
+        'float32': pa.float32(),
+        'boolean': pa.bool_(),
+        'category': pa.dictionary(pa.int32(), pa.string()),
+    }[dtype]
+    for column, dtype in DTYPES.items()
+}
+
+# Uncleaned columns for the full-dataset charts (the flag-count chart also needs is_business)
+RAW_DTYPES = {**DTYPES, 'is_business': 'boolean'}
+RAW_ARROW_TYPES = {**ARROW_TYPES, 'is_business': pa.bool_()}
+
+# Missing-value markers as read_csv has them ('None' and '<NA>' are not in Arrow's list)
+NULL_VALUES = pv.ConvertOptions().null_values + ['None', '<NA>']
+
+# Bytes of CSV parsed per streamed batch
+BLOCK_SIZE = 16 << 20
+
+# Quoted text fields may span lines; without this Arrow's parallel chunker can
+# split a block inside one and fail
+PARSE_OPTIONS = pv.ParseOptions(newlines_in_values=True)
+
+
+def _to_pandas(table):
+    """Convert an Arrow table to pandas with the dtypes read_csv would give"""
+    df = table.unify_dictionaries().to_pandas(types_mapper={pa.bool_(): pd.BooleanDtype()}.get)
+    for column in df.columns:
+        if isinstance(df[column].dtype, pd.CategoricalDtype):
+            # Match read_csv, which sorts the categories
+            df[column] = df[column].cat.set_categories(sorted(df[column].cat.categories))
+    return df
+
+
+def _stream_clean(path):
+    """Read the CSV in batches, keeping only rows that can survive cleaning"""
+    reader = pv.open_csv(
+        path,
+        read_options=pv.ReadOptions(block_size=BLOCK_SIZE),
+        parse_options=PARSE_OPTIONS,
+        convert_options=pv.ConvertOptions(include_columns=list(DTYPES), column_types=ARROW_TYPES,
+                                          null_values=NULL_VALUES, strings_can_be_null=True),
+    )
+
+    # The 99th-percentile cut-offs need price/area of every priced row, so keep
+    # those two columns separately; full rows are kept only when they pass the
+    # threshold-free filters
+    priced_price, priced_area, candidates = [], [], []
+    for batch in reader:
+        price = batch.column('price_value').to_numpy(zero_copy_only=False)
+        area = batch.column('area_value').to_numpy(zero_copy_only=False)
+        floor = batch.column('floor').to_numpy(zero_copy_only=False)
+
+        priced = price > 0
+        priced_price.append(price[priced])
+        priced_area.append(area[priced])
+        candidates.append(batch.filter(pa.array(priced & (area > 0) & (floor > 0) & (floor < 50))))
+
+    # Each cut-off is taken over the rows that pass the filters before it
+    price = np.concatenate(priced_price)
+    area = np.concatenate(priced_area)
+    price_p99 = np.percentile(price, 99)
+    area_p99 = np.percentile(area[(price < price_p99) & (area > 0)], 99, overwrite_input=True)
+
+    df = _to_pandas(pa.Table.from_batches(candidates, schema=reader.schema))
+    price = df['price_value'].to_numpy()
+    area = df['area_value'].to_numpy()
+    return df.loc[(price < price_p99) & (area < area_p99)].reset_index(drop=True)
+
+
+def _is_fresh(cache):
+    """Whether a cache file exists and is at least as new as the CSV"""
+    return os.path.exists(cache) and os.path.getmtime(cache) >= os.path.getmtime(DATA_FILE)
+
+
+def load_clean():
+    """Load the cleaned dataset, building the Parquet cache on first use"""
+    if _is_fresh(CLEAN_FILE):
+        print(f"Loading cached clean data: {CLEAN_FILE}")
+        return pd.read_parquet(CLEAN_FILE)
+
+    print("Loading data...")
+    df_clean = _stream_clean(DATA_FILE)
+
+    df_clean.to_parquet(CLEAN_FILE, engine='pyarrow', compression='zstd')
+    print(f"Cached clean data: {CLEAN_FILE}")
+    return df_clean
+
+
+def load_raw():
+    """Load the charted columns of the full, uncleaned dataset through a Parquet cache"""
+    if _is_fresh(RAW_FILE):
+        print(f"Loading cached data: {RAW_FILE}")
+        return pd.read_parquet(RAW_FILE)
+
+    print("Loading combined dataset...")
+    table = pv.read_csv(
+        DATA_FILE,
+        parse_options=PARSE_OPTIONS,
+        convert_options=pv.ConvertOptions(include_columns=list(RAW_DTYPES), column_types=RAW_ARROW_TYPES,
+                                          null_values=NULL_VALUES, strings_can_be_null=True),
+    )
+    df = _to_pandas(table)
+
+    df.to_parquet(RAW_FILE, engine='pyarrow', compression='zstd')
+    print(f"Cached data: {RAW_FILE}")
+    return df
@@ -0,0 +1,82 @@
+"""
+Shared source-file reading, scrape timestamp and Excel output for the transform scripts
+CSVs are parsed by Arrow with the values pd.read_csv would give; workbooks are
+read through a Parquet copy next to them (<file>.xlsx.parquet), which every
+script shares and which is rebuilt whenever the workbook is newer
+"""
+
+import os
+from datetime import datetime
+import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pv
+
+try:
+    import xlsxwriter
+except ImportError:
+    xlsxwriter = None
+
+# Scrape time stamped on the rows of every source without one of its own, taken
+# when this module is first imported: pool workers started by fork (the Linux
+# default) inherit the parent's, while under spawn each worker imports the
+# module again and takes its own
+SCRAPED_AT = datetime.now().isoformat()
+
+# Rows an Excel sheet can hold, header included
+EXCEL_MAX_ROWS = 1_048_576
+
+# Missing-value markers as pd.read_csv has them ('None' and '<NA>' are not in Arrow's list)
+NULL_VALUES = pv.ConvertOptions().null_values + ['None', '<NA>']
+
+
+def read_csv(file_path, columns=None):
+    """Read a source CSV (optionally just some columns) with Arrow's parser, keeping the text of every column as pd.read_csv would"""
+    def read(column_types):
+        return pv.read_csv(
+            file_path,
+            # Quoted text fields may span lines
+            parse_options=pv.ParseOptions(newlines_in_values=True),
+            convert_options=pv.ConvertOptions(include_columns=columns, column_types=column_types,
+                                              null_values=NULL_VALUES, strings_can_be_null=True),
+        )
+
+    table = read({})
+    # Arrow infers dates and times that pandas leaves as text and would write back
+    # in its own format, so those columns are read again as strings
+    temporal = {field.name: pa.string() for field in table.schema if pa.types.is_temporal(field.type)}
+    if temporal:
+        table = read(temporal)
+    return table.to_pandas()
+
+
+def _is_fresh(cache, source):
+    """Whether a cache file exists and is at least as new as its source file"""
+    return os.path.exists(cache) and os.path.getmtime(cache) >= os.path.getmtime(source)
+
+
+def read_excel(file_path, columns=None):
+    """Read a source workbook (optionally just some columns) through its Parquet copy"""
+    cache = file_path + '.parquet'
+    if _is_fresh(cache, file_path):
+        return pd.read_parquet(cache, columns=columns)
+
+    # The copy always holds the whole sheet, so any script can read any columns from it
+    df = pd.read_excel(file_path)
+    try:
+        df.to_parquet(cache, engine='pyarrow', compression='zstd')
+    except pa.ArrowException:
+        # A column mixing numbers and text has no Arrow type; such a workbook is parsed every run
+        pass
+    return df if columns is None else df[columns]
+
+
+def write_excel(df, file_path):
+    """Write a frame to a workbook, through xlsxwriter's constant-memory mode when it is installed"""
+    # That mode flushes each row as it is written, where openpyxl keeps every
+    # cell of the workbook in memory
+    if xlsxwriter is not None:
+        with pd.ExcelWriter(file_path, engine='xlsxwriter',
+                            engine_kwargs={'options': {'constant_memory': True}}) as writer:
+            df.to_excel(writer, index=False)
+    else:
+        df.to_excel(file_path, index=False, engine='openpyxl')
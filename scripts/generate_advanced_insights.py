@@ -3,508 +3,611 @@
 Advanced Real Estate Market Insights - Additional Charts
 """
 
+import os
+from multiprocessing import Pool
 import pandas as pd
 import numpy as np
 import matplotlib.pyplot as plt
 import seaborn as sns
-from matplotlib.ticker import FuncFormatter, MaxNLocator
+from matplotlib.ticker import MaxNLocator
+from _data import load_clean
+from _charts import bucket, label_ticks, format_price, format_count
 import warnings
 warnings.filterwarnings('ignore')
 
 plt.style.use('default')
+plt.rcParams['figure.constrained_layout.use'] = True
+
+
+def group_stats(codes, values, ngroups):
+    """Per-group mean, median, sample std and count (as pandas groupby) from bincounts and one sort"""
+    count = np.bincount(codes, minlength=ngroups)
+    mean = np.bincount(codes, weights=values, minlength=ngroups) / count
+    std = np.sqrt(np.bincount(codes, weights=np.square(values - mean[codes]), minlength=ngroups) / (count - 1))
+
+    # Sorting by group then value lines each group up, so its median is a pair of lookups
+    ordered = values[np.lexsort((values, codes))]
+    start = np.cumsum(count) - count
+    median = (ordered[start + (count - 1) // 2] + ordered[start + count // 2]) / 2
+    return mean, median, std, count
+
+
+def top_mean_prices(column, prices, min_count, top):
+    """Mean price of the `top` most common categories with at least min_count rows, ordered by mean price"""
+    # bincount over the category codes; code -1 marks a missing value
+    codes = column.cat.codes.to_numpy()
+    known = codes >= 0
+    counts = np.bincount(codes[known], minlength=len(column.cat.categories))
+    sums = np.bincount(codes[known], weights=prices[known], minlength=len(counts))
+
+    keep = np.flatnonzero(counts >= min_count)
+    if len(keep) > top:
+        # Only groups counting at least the top-th largest count can make the cut (ties included)
+        kth = np.partition(counts[keep], -top)[-top]
+        keep = keep[counts[keep] >= kth]
+
+    # Stable, so count ties keep category order as nlargest does; means only for the winners
+    keep = keep[np.argsort(-counts[keep], kind='stable')[:top]]
+    means = sums[keep] / counts[keep]
+    order = np.argsort(means, kind='stable')
+    return column.cat.categories[keep[order]], means[order], counts[keep[order]]
+
+
+def aggregate(df_clean):
+    """Small per-chart tables, computed once in the parent so the workers only draw"""
+    prices = df_clean['price_value'].to_numpy(dtype=np.float64)
+
+    # Chart 13: top 12 cities by count (at least 100 properties) and their mean price
+    city_names, city_means, city_counts = top_mean_prices(df_clean['city_name'], prices, 100, 12)
+    city_data = pd.DataFrame({
+        'city_name': city_names,
+        'mean_price': city_means,
+        'count': city_counts
+    })
 
-print("Loading data...")
-df = pd.read_csv('data/combined_real_estate_bina_format.csv')
-
-# Clean data
-df_clean = df.copy()
-df_clean = df_clean[df_clean['price_value'] > 0]
-df_clean = df_clean[df_clean['price_value'] < df_clean['price_value'].quantile(0.99)]
-df_clean = df_clean[df_clean['area_value'] > 0]
-df_clean = df_clean[df_clean['area_value'] < df_clean['area_value'].quantile(0.99)]
-df_clean = df_clean[df_clean['floor'] > 0]
-df_clean = df_clean[df_clean['floor'] < 50]
-df_clean = df_clean[df_clean['rooms'] > 0]
-df_clean = df_clean[df_clean['rooms'] <= 10]
-
-print(f"Clean data: {len(df_clean):,} records\n")
+    # Chart 14: average prices for properties with/without features
+    features = [
+        ('has_repair', 'Has Repair'),
+        ('has_mortgage', 'Has Mortgage'),
+        ('has_bill_of_sale', 'Bill of Sale'),
+        ('vipped', 'VIP Listing'),
+        ('featured', 'Featured')
+    ]
+    flags = df_clean[[feature for feature, _ in features]]
+
+    # One matrix-vector product per side instead of a masked mean per feature;
+    # a missing flag counts towards neither side
+    has_feature = flags.to_numpy(dtype=bool, na_value=False)
+    lacks_feature = (~flags).to_numpy(dtype=bool, na_value=False)
+    with_feature = prices @ has_feature / has_feature.sum(axis=0)
+    without_feature = prices @ lacks_feature / lacks_feature.sum(axis=0)
+
+    # Five rows, so the chart gets the arrays themselves, ordered by price difference
+    order = np.argsort(with_feature - without_feature, kind='stable')
+    feature_impact = {
+        'feature': [features[i][1] for i in order],
+        'with': with_feature[order],
+        'without': without_feature[order]
+    }
+
+    # Charts 15 and 20: area and area per room, grouped once on the sorted room values
+    rooms = df_clean['rooms'].to_numpy()
+    room_values, room_codes = np.unique(rooms, return_inverse=True)
+    area = df_clean['area_value'].to_numpy()
+    area_per_room = np.divide(area, rooms)
+
+    mean_area, median_area, std_area, room_counts = group_stats(room_codes, area, len(room_values))
+    mean_apr, median_apr, std_apr, _ = group_stats(room_codes, area_per_room, len(room_values))
+    room_stats = pd.DataFrame({
+        'mean_area': mean_area,
+        'median_area': median_area,
+        'std_area': std_area,
+        'count': room_counts,
+        'mean_area_per_room': mean_apr,
+        'median_area_per_room': median_apr,
+        'std_area_per_room': std_apr
+    }, index=pd.Index(room_values, name='rooms'))
+
+    # Chart 16: define market segments and count properties in each
+    segment_labels = ['Budget\n(<80K)', 'Mid-Range\n(80K-200K)', 'Luxury\n(>200K)']
+    segment_codes = bucket(prices, [0, 80000, 200000, np.inf])
+    segment_counts = pd.Series(np.bincount(segment_codes[segment_codes >= 0], minlength=len(segment_labels)),
+                               index=segment_labels)
+
+    # Chart 17: categorize floors
+    floor_labels = ['Ground\n(1st)', 'Low\n(2-3)',
+                    'Mid\n(4-6)', 'High\n(7-10)', 'Very High\n(11+)']
+    floor_codes = bucket(df_clean['floor'].to_numpy(), [0, 1, 3, 6, 10, 50])
+    known = floor_codes >= 0
+    floor_counts = np.bincount(floor_codes[known], minlength=len(floor_labels))
+    floor_sums = np.bincount(floor_codes[known], weights=prices[known], minlength=len(floor_labels))
+
+    floor_stats = pd.DataFrame({
+        'floor_category': floor_labels,
+        'mean_price': floor_sums / np.maximum(floor_counts, 1),
+        'count': floor_counts
+    })
+    floor_stats = floor_stats[floor_stats['count'] > 0]
+
+    # Chart 18: categorize building types
+    building_labels = ['Low-Rise\n(≤5 floors)',
+                       'Mid-Rise\n(6-10 floors)',
+                       'High-Rise\n(11-16 floors)',
+                       'Skyscraper\n(>16 floors)']
+    building_codes = bucket(df_clean['floors'].to_numpy(), [0, 5, 10, 16, 100])
+    known = building_codes >= 0
+    building_counts = np.bincount(building_codes[known], minlength=len(building_labels))
+    building_price_sums = np.bincount(building_codes[known], weights=prices[known],
+                                      minlength=len(building_labels))
+    building_area_sums = np.bincount(building_codes[known],
+                                     weights=df_clean['area_value'].to_numpy()[known],
+                                     minlength=len(building_labels))
+
+    building_stats = pd.DataFrame({
+        'building_type': building_labels,
+        'mean_price': building_price_sums / np.maximum(building_counts, 1),
+        'count': building_counts,
+        'mean_area': building_area_sums / np.maximum(building_counts, 1)
+    })
+    building_stats = building_stats[building_stats['count'] > 0]
+
+    # Chart 19: top 15 locations by property count (at least 200 properties)
+    location_names, location_means, location_counts = top_mean_prices(df_clean['location_name'], prices, 200, 15)
+    location_stats = pd.DataFrame({
+        'location': location_names,
+        'mean_price': location_means,
+        'count': location_counts
+    })
 
-def format_price(x, p):
-    if x >= 1000000:
-        return f'{x/1000000:.1f}M'
-    elif x >= 1000:
-        return f'{int(x/1000)}K'
-    return f'{int(x)}'
+    return {
+        'city_data': city_data,
+        'feature_impact': feature_impact,
+        'room_stats': room_stats,
+        'segment_counts': segment_counts,
+        'floor_stats': floor_stats,
+        'building_stats': building_stats,
+        'location_stats': location_stats,
+    }
 
-def format_count(x, p):
-    return f'{int(x):,}'
 
 # =============================================================================
 # CHART 13: Average Price by Top 10 Cities
 # =============================================================================
-print("Generating Chart 13: Average Price by Top Cities...")
-
-fig = plt.figure(figsize=(16, 10))
-ax = plt.subplot(111)
-
-# Get top cities by count and calculate mean price
-city_data = df_clean.groupby('city_name').agg({
-    'price_value': ['mean', 'count']
-}).reset_index()
-city_data.columns = ['city_name', 'mean_price', 'count']
-city_data = city_data[city_data['count'] >= 100]  # At least 100 properties
-city_data = city_data.nlargest(12, 'count')
-city_data = city_data.sort_values('mean_price', ascending=True)
-
-# Create horizontal bar chart
-colors = plt.cm.viridis(np.linspace(0.2, 0.9, len(city_data)))
-bars = ax.barh(range(len(city_data)), city_data['mean_price'],
-               color=colors, edgecolor='white', linewidth=2, alpha=0.9)
-
-# Add value labels
-for i, (bar, value, count) in enumerate(zip(bars, city_data['mean_price'], city_data['count'])):
-    ax.text(value + max(city_data['mean_price'])*0.02, i,
-            f'{value:,.0f} AZN\n({count:,} props)',
-            va='center', fontsize=11, fontweight='bold')
-
-ax.set_yticks(range(len(city_data)))
-ax.set_yticklabels(city_data['city_name'], fontsize=12)
-ax.set_xlabel('Average Price (AZN)', fontsize=16, fontweight='bold', labelpad=15)
-ax.set_ylabel('City', fontsize=16, fontweight='bold', labelpad=15)
-ax.set_title('Average Property Price by City (Top 12 Cities)',
-             fontsize=20, fontweight='bold', pad=25)
-
-ax.xaxis.set_major_formatter(FuncFormatter(format_price))
-ax.grid(True, alpha=0.3, axis='x', linestyle='-', linewidth=1)
-ax.set_axisbelow(True)
-ax.tick_params(axis='both', which='major', labelsize=12, length=8, width=2)
-
-for spine in ax.spines.values():
-    spine.set_linewidth(2)
-    spine.set_edgecolor('#2c3e50')
-
-plt.tight_layout(pad=2)
-plt.savefig('charts/13_avg_price_by_city.png', dpi=300, bbox_inches='tight',
-            facecolor='white', edgecolor='none')
-plt.close()
-print("✓ Saved: charts/13_avg_price_by_city.png\n")
+def chart_13(city_data):
+    """Average Price by Top 10 Cities"""
+    print("Generating Chart 13: Average Price by Top Cities...")
+
+    fig = plt.figure(figsize=(16, 10))
+    ax = plt.subplot(111)
+
+    # Create horizontal bar chart
+    colors = plt.cm.viridis(np.linspace(0.2, 0.9, len(city_data)))
+    bars = ax.barh(range(len(city_data)), city_data['mean_price'],
+                   color=colors, edgecolor='white', linewidth=2, alpha=0.9)
+
+    # Add value labels
+    offset = city_data['mean_price'].max()*0.02
+    for i, (bar, value, count) in enumerate(zip(bars, city_data['mean_price'], city_data['count'])):
+        ax.text(value + offset, i,
+                f'{value:,.0f} AZN\n({count:,} props)',
+                va='center', fontsize=11, fontweight='bold')
+
+    ax.set_yticks(range(len(city_data)))
+    ax.set_yticklabels(city_data['city_name'], fontsize=12)
+    ax.set_xlabel('Average Price (AZN)', fontsize=16, fontweight='bold', labelpad=15)
+    ax.set_ylabel('City', fontsize=16, fontweight='bold', labelpad=15)
+    ax.set_title('Average Property Price by City (Top 12 Cities)',
+                 fontsize=20, fontweight='bold', pad=25)
+
+    label_ticks(ax.xaxis, format_price)
+    ax.grid(True, alpha=0.3, axis='x', linestyle='-', linewidth=1)
+    ax.set_axisbelow(True)
+    ax.tick_params(axis='both', which='major', labelsize=12, length=8, width=2)
+
+    for spine in ax.spines.values():
+        spine.set_linewidth(2)
+        spine.set_edgecolor('#2c3e50')
+
+    plt.savefig('charts/13_avg_price_by_city.png', dpi=300, bbox_inches='tight',
+                facecolor='white', edgecolor='none',
+                pil_kwargs={'compress_level': 1})
+    plt.close()
+    print("✓ Saved: charts/13_avg_price_by_city.png\n")
+
 
 # =============================================================================
 # CHART 14: Impact of Features on Price
 # =============================================================================
-print("Generating Chart 14: Feature Impact on Price...")
-
-fig = plt.figure(figsize=(16, 10))
-ax = plt.subplot(111)
-
-# Calculate average prices for properties with/without features
-features_impact = []
-
-for feature, name in [
-    ('has_repair', 'Has Repair'),
-    ('has_mortgage', 'Has Mortgage'),
-    ('has_bill_of_sale', 'Bill of Sale'),
-    ('vipped', 'VIP Listing'),
-    ('featured', 'Featured')
-]:
-    with_feature = df_clean[df_clean[feature] == True]['price_value'].mean()
-    without_feature = df_clean[df_clean[feature] == False]['price_value'].mean()
-
-    features_impact.append({
-        'feature': name,
-        'with': with_feature,
-        'without': without_feature,
-        'diff': with_feature - without_feature,
-        'diff_pct': ((with_feature - without_feature) / without_feature) * 100
-    })
+def chart_14(feature_impact):
+    """Impact of Features on Price"""
+    print("Generating Chart 14: Feature Impact on Price...")
+
+    fig = plt.figure(figsize=(16, 10))
+    ax = plt.subplot(111)
+
+    x = np.arange(len(feature_impact['feature']))
+    width = 0.35
+
+    bars1 = ax.barh(x - width/2, feature_impact['without'], width,
+                    label='Without Feature', color='#e74c3c', alpha=0.9,
+                    edgecolor='white', linewidth=2)
+    bars2 = ax.barh(x + width/2, feature_impact['with'], width,
+                    label='With Feature', color='#2ecc71', alpha=0.9,
+                    edgecolor='white', linewidth=2)
+
+    # Add value labels
+    offset = feature_impact['with'].max()*0.01
+    for bars in [bars1, bars2]:
+        for bar in bars:
+            width_val = bar.get_width()
+            ax.text(width_val + offset,
+                    bar.get_y() + bar.get_height()/2,
+                    f'{width_val/1000:.0f}K',
+                    ha='left', va='center', fontsize=11, fontweight='bold')
+
+    ax.set_yticks(x)
+    ax.set_yticklabels(feature_impact['feature'], fontsize=12)
+    ax.set_xlabel('Average Price (AZN)', fontsize=16, fontweight='bold', labelpad=15)
+    ax.set_ylabel('Feature', fontsize=16, fontweight='bold', labelpad=15)
+    ax.set_title('Impact of Property Features on Average Price',
+                 fontsize=20, fontweight='bold', pad=25)
+
+    label_ticks(ax.xaxis, format_price)
+    ax.legend(fontsize=14, framealpha=0.98, edgecolor='#2c3e50',
+             fancybox=True, shadow=True, loc='lower right')
+    ax.grid(True, alpha=0.3, axis='x', linestyle='-', linewidth=1)
+    ax.set_axisbelow(True)
+    ax.tick_params(axis='both', which='major', labelsize=12, length=8, width=2)
+
+    for spine in ax.spines.values():
+        spine.set_linewidth(2)
+        spine.set_edgecolor('#2c3e50')
+
+    plt.savefig('charts/14_feature_impact_on_price.png', dpi=300, bbox_inches='tight',
+                facecolor='white', edgecolor='none',
+                pil_kwargs={'compress_level': 1})
+    plt.close()
+    print("✓ Saved: charts/14_feature_impact_on_price.png\n")
 
-features_df = pd.DataFrame(features_impact).sort_values('diff', ascending=True)
-
-x = np.arange(len(features_df))
-width = 0.35
-
-bars1 = ax.barh(x - width/2, features_df['without'], width,
-                label='Without Feature', color='#e74c3c', alpha=0.9,
-                edgecolor='white', linewidth=2)
-bars2 = ax.barh(x + width/2, features_df['with'], width,
-                label='With Feature', color='#2ecc71', alpha=0.9,
-                edgecolor='white', linewidth=2)
-
-# Add value labels
-for bars in [bars1, bars2]:
-    for bar in bars:
-        width_val = bar.get_width()
-        ax.text(width_val + max(features_df['with'])*0.01,
-                bar.get_y() + bar.get_height()/2,
-                f'{width_val/1000:.0f}K',
-                ha='left', va='center', fontsize=11, fontweight='bold')
-
-ax.set_yticks(x)
-ax.set_yticklabels(features_df['feature'], fontsize=12)
-ax.set_xlabel('Average Price (AZN)', fontsize=16, fontweight='bold', labelpad=15)
-ax.set_ylabel('Feature', fontsize=16, fontweight='bold', labelpad=15)
-ax.set_title('Impact of Property Features on Average Price',
-             fontsize=20, fontweight='bold', pad=25)
-
-ax.xaxis.set_major_formatter(FuncFormatter(format_price))
-ax.legend(fontsize=14, framealpha=0.98, edgecolor='#2c3e50',
-         fancybox=True, shadow=True, loc='lower right')
-ax.grid(True, alpha=0.3, axis='x', linestyle='-', linewidth=1)
-ax.set_axisbelow(True)
-ax.tick_params(axis='both', which='major', labelsize=12, length=8, width=2)
-
-for spine in ax.spines.values():
-    spine.set_linewidth(2)
-    spine.set_edgecolor('#2c3e50')
-
-plt.tight_layout(pad=2)
-plt.savefig('charts/14_feature_impact_on_price.png', dpi=300, bbox_inches='tight',
-            facecolor='white', edgecolor='none')
-plt.close()
-print("✓ Saved: charts/14_feature_impact_on_price.png\n")
 
 # =============================================================================
 # CHART 15: Average Area per Room Count
 # =============================================================================
-print("Generating Chart 15: Average Area per Room Count...")
-
-fig = plt.figure(figsize=(16, 10))
-ax = plt.subplot(111)
-
-room_area = df_clean.groupby('rooms').agg({
-    'area_value': ['mean', 'median', 'std', 'count']
-}).reset_index()
-room_area.columns = ['rooms', 'mean_area', 'median_area', 'std_area', 'count']
-room_area = room_area[(room_area['rooms'] <= 6) & (room_area['count'] >= 50)]
-
-x = room_area['rooms'].values
-mean_vals = room_area['mean_area'].values
-median_vals = room_area['median_area'].values
-
-width = 0.35
-
-bars1 = ax.bar(x - width/2, mean_vals, width, label='Mean Area',
-               color='#3498db', alpha=0.9, edgecolor='white', linewidth=2)
-bars2 = ax.bar(x + width/2, median_vals, width, label='Median Area',
-               color='#f39c12', alpha=0.9, edgecolor='white', linewidth=2)
-
-# Add value labels
-for bars in [bars1, bars2]:
-    for bar in bars:
-        height = bar.get_height()
-        ax.text(bar.get_x() + bar.get_width()/2., height,
-                f'{height:.0f}m²',
-                ha='center', va='bottom', fontsize=12, fontweight='bold')
-
-ax.set_xlabel('Number of Rooms', fontsize=16, fontweight='bold', labelpad=15)
-ax.set_ylabel('Area (m²)', fontsize=16, fontweight='bold', labelpad=15)
-ax.set_title('Average Property Area by Number of Rooms',
-             fontsize=20, fontweight='bold', pad=25)
-ax.set_xticks(x)
-ax.set_xticklabels([f'{int(r)} Room{"s" if r > 1 else ""}' for r in x])
-ax.legend(fontsize=14, framealpha=0.98, edgecolor='#2c3e50',
-         fancybox=True, shadow=True)
-ax.grid(True, alpha=0.3, axis='y', linestyle='-', linewidth=1)
-ax.set_axisbelow(True)
-ax.tick_params(axis='both', which='major', labelsize=12, length=8, width=2)
-
-for spine in ax.spines.values():
-    spine.set_linewidth(2)
-    spine.set_edgecolor('#2c3e50')
-
-plt.tight_layout(pad=2)
-plt.savefig('charts/15_area_by_rooms.png', dpi=300, bbox_inches='tight',
-            facecolor='white', edgecolor='none')
-plt.close()
-print("✓ Saved: charts/15_area_by_rooms.png\n")
+def chart_15(room_stats):
+    """Average Area per Room Count"""
+    print("Generating Chart 15: Average Area per Room Count...")
+
+    fig = plt.figure(figsize=(16, 10))
+    ax = plt.subplot(111)
+
+    room_area = room_stats[['mean_area', 'median_area', 'std_area', 'count']].reset_index()
+    room_area = room_area[(room_area['rooms'] <= 6) & (room_area['count'] >= 50)]
+
+    x = room_area['rooms'].values
+    mean_vals = room_area['mean_area'].values
+    median_vals = room_area['median_area'].values
+
+    width = 0.35
+
+    bars1 = ax.bar(x - width/2, mean_vals, width, label='Mean Area',
+                   color='#3498db', alpha=0.9, edgecolor='white', linewidth=2)
+    bars2 = ax.bar(x + width/2, median_vals, width, label='Median Area',
+                   color='#f39c12', alpha=0.9, edgecolor='white', linewidth=2)
+
+    # Add value labels
+    for bars in [bars1, bars2]:
+        ax.bar_label(bars, fmt='{:.0f}m²', fontsize=12, fontweight='bold')
+
+    ax.set_xlabel('Number of Rooms', fontsize=16, fontweight='bold', labelpad=15)
+    ax.set_ylabel('Area (m²)', fontsize=16, fontweight='bold', labelpad=15)
+    ax.set_title('Average Property Area by Number of Rooms',
+                 fontsize=20, fontweight='bold', pad=25)
+    ax.set_xticks(x)
+    ax.set_xticklabels([f'{int(r)} Room{"s" if r > 1 else ""}' for r in x])
+    ax.legend(fontsize=14, framealpha=0.98, edgecolor='#2c3e50',
+             fancybox=True, shadow=True)
+    ax.grid(True, alpha=0.3, axis='y', linestyle='-', linewidth=1)
+    ax.set_axisbelow(True)
+    ax.tick_params(axis='both', which='major', labelsize=12, length=8, width=2)
+
+    for spine in ax.spines.values():
+        spine.set_linewidth(2)
+        spine.set_edgecolor('#2c3e50')
+
+    plt.savefig('charts/15_area_by_rooms.png', dpi=300, bbox_inches='tight',
+                facecolor='white', edgecolor='none',
+                pil_kwargs={'compress_level': 1})
+    plt.close()
+    print("✓ Saved: charts/15_area_by_rooms.png\n")
+
 
 # =============================================================================
 # CHART 16: Market Segmentation (Budget, Mid, Luxury)
 # =============================================================================
-print("Generating Chart 16: Market Segmentation...")
-
-fig = plt.figure(figsize=(16, 10))
-ax = plt.subplot(111)
-
-# Define market segments
-df_clean['segment'] = pd.cut(df_clean['price_value'],
-                             bins=[0, 80000, 200000, float('inf')],
-                             labels=['Budget\n(<80K)', 'Mid-Range\n(80K-200K)', 'Luxury\n(>200K)'])
-
-# Count properties in each segment
-segment_counts = df_clean['segment'].value_counts().sort_index()
-
-# Create pie chart with better aesthetics
-colors = ['#3498db', '#2ecc71', '#e74c3c']
-explode = (0.05, 0.05, 0.1)
-
-wedges, texts, autotexts = ax.pie(segment_counts.values,
-                                   labels=segment_counts.index,
-                                   autopct='%1.1f%%',
-                                   colors=colors,
-                                   explode=explode,
-                                   startangle=90,
-                                   textprops={'fontsize': 14, 'fontweight': 'bold'},
-                                   pctdistance=0.85)
-
-# Enhance text
-for text in texts:
-    text.set_fontsize(16)
-    text.set_fontweight('bold')
-
-for autotext in autotexts:
-    autotext.set_color('white')
-    autotext.set_fontsize(15)
-    autotext.set_fontweight('bold')
-
-# Add center circle for donut effect
-centre_circle = plt.Circle((0, 0), 0.70, fc='white', linewidth=3, edgecolor='#2c3e50')
-ax.add_artist(centre_circle)
-
-# Add title
-ax.set_title('Real Estate Market Segmentation by Price',
-             fontsize=20, fontweight='bold', pad=25)
-
-# Add legend with counts
-legend_labels = [f'{label}\n{count:,} properties'
-                for label, count in zip(segment_counts.index, segment_counts.values)]
-ax.legend(legend_labels, loc='upper left', bbox_to_anchor=(1, 0, 0.3, 1),
-         fontsize=13, framealpha=0.98, edgecolor='#2c3e50', fancybox=True)
-
-plt.tight_layout(pad=2)
-plt.savefig('charts/16_market_segmentation.png', dpi=300, bbox_inches='tight',
-            facecolor='white', edgecolor='none')
-plt.close()
-print("✓ Saved: charts/16_market_segmentation.png\n")
+def chart_16(segment_counts):
+    """Market Segmentation (Budget, Mid, Luxury)"""
+    print("Generating Chart 16: Market Segmentation...")
+
+    fig = plt.figure(figsize=(16, 10))
+    ax = plt.subplot(111)
+
+    # Create pie chart with better aesthetics
+    colors = ['#3498db', '#2ecc71', '#e74c3c']
+    explode = (0.05, 0.05, 0.1)
+
+    wedges, texts, autotexts = ax.pie(segment_counts.values,
+                                       labels=segment_counts.index,
+                                       autopct='%1.1f%%',
+                                       colors=colors,
+                                       explode=explode,
+                                       startangle=90,
+                                       textprops={'fontsize': 14, 'fontweight': 'bold'},
+                                       pctdistance=0.85)
+
+    # Enhance text
+    for text in texts:
+        text.set_fontsize(16)
+        text.set_fontweight('bold')
+
+    for autotext in autotexts:
+        autotext.set_color('white')
+        autotext.set_fontsize(15)
+        autotext.set_fontweight('bold')
+
+    # Add center circle for donut effect
+    centre_circle = plt.Circle((0, 0), 0.70, fc='white', linewidth=3, edgecolor='#2c3e50')
+    ax.add_artist(centre_circle)
+
+    # Add title
+    ax.set_title('Real Estate Market Segmentation by Price',
+                 fontsize=20, fontweight='bold', pad=25)
+
+    # Add legend with counts
+    legend_labels = [f'{label}\n{count:,} properties'
+                    for label, count in zip(segment_counts.index, segment_counts.values)]
+    ax.legend(legend_labels, loc='upper left', bbox_to_anchor=(1, 0, 0.3, 1),
+             fontsize=13, framealpha=0.98, edgecolor='#2c3e50', fancybox=True)
+
+    plt.savefig('charts/16_market_segmentation.png', dpi=300, bbox_inches='tight',
+                facecolor='white', edgecolor='none',
+                pil_kwargs={'compress_level': 1})
+    plt.close()
+    print("✓ Saved: charts/16_market_segmentation.png\n")
+
 
 # =============================================================================
 # CHART 17: Floor Preference (Ground vs Higher Floors)
 # =============================================================================
-print("Generating Chart 17: Floor Preference Analysis...")
-
-fig = plt.figure(figsize=(16, 10))
-ax = plt.subplot(111)
-
-# Categorize floors
-df_clean['floor_category'] = pd.cut(df_clean['floor'],
-                                    bins=[0, 1, 3, 6, 10, 50],
-                                    labels=['Ground\n(1st)', 'Low\n(2-3)',
-                                           'Mid\n(4-6)', 'High\n(7-10)', 'Very High\n(11+)'])
-
-floor_stats = df_clean.groupby('floor_category').agg({
-    'price_value': ['mean', 'count']
-}).reset_index()
-floor_stats.columns = ['floor_category', 'mean_price', 'count']
-floor_stats = floor_stats.dropna()
-
-x = range(len(floor_stats))
-colors = ['#e67e22', '#3498db', '#2ecc71', '#9b59b6', '#e74c3c']
-
-# Create bar chart
-bars = ax.bar(x, floor_stats['mean_price'], color=colors,
-              alpha=0.9, edgecolor='white', linewidth=2)
-
-# Add value labels
-for i, (bar, price, count) in enumerate(zip(bars, floor_stats['mean_price'], floor_stats['count'])):
-    height = bar.get_height()
-    ax.text(bar.get_x() + bar.get_width()/2., height,
-            f'{price/1000:.0f}K AZN\n({count:,} props)',
-            ha='center', va='bottom', fontsize=12, fontweight='bold')
-
-ax.set_xticks(x)
-ax.set_xticklabels(floor_stats['floor_category'], fontsize=13)
-ax.set_xlabel('Floor Category', fontsize=16, fontweight='bold', labelpad=15)
-ax.set_ylabel('Average Price (AZN)', fontsize=16, fontweight='bold', labelpad=15)
-ax.set_title('Average Price by Floor Level Category',
-             fontsize=20, fontweight='bold', pad=25)
-
-ax.yaxis.set_major_formatter(FuncFormatter(format_price))
-ax.grid(True, alpha=0.3, axis='y', linestyle='-', linewidth=1)
-ax.set_axisbelow(True)
-ax.tick_params(axis='both', which='major', labelsize=12, length=8, width=2)
-
-for spine in ax.spines.values():
-    spine.set_linewidth(2)
-    spine.set_edgecolor('#2c3e50')
-
-plt.tight_layout(pad=2)
-plt.savefig('charts/17_floor_preference.png', dpi=300, bbox_inches='tight',
-            facecolor='white', edgecolor='none')
-plt.close()
-print("✓ Saved: charts/17_floor_preference.png\n")
+def chart_17(floor_stats):
+    """Floor Preference (Ground vs Higher Floors)"""
+    print("Generating Chart 17: Floor Preference Analysis...")
+
+    fig = plt.figure(figsize=(16, 10))
+    ax = plt.subplot(111)
+
+    x = range(len(floor_stats))
+    colors = ['#e67e22', '#3498db', '#2ecc71', '#9b59b6', '#e74c3c']
+
+    # Create bar chart
+    bars = ax.bar(x, floor_stats['mean_price'], color=colors,
+                  alpha=0.9, edgecolor='white', linewidth=2)
+
+    # Add value labels
+    ax.bar_label(bars, labels=[f'{price/1000:.0f}K AZN\n({count:,} props)'
+                               for price, count in zip(floor_stats['mean_price'], floor_stats['count'])],
+                 fontsize=12, fontweight='bold')
+
+    ax.set_xticks(x)
+    ax.set_xticklabels(floor_stats['floor_category'], fontsize=13)
+    ax.set_xlabel('Floor Category', fontsize=16, fontweight='bold', labelpad=15)
+    ax.set_ylabel('Average Price (AZN)', fontsize=16, fontweight='bold', labelpad=15)
+    ax.set_title('Average Price by Floor Level Category',
+                 fontsize=20, fontweight='bold', pad=25)
+
+    label_ticks(ax.yaxis, format_price)
+    ax.grid(True, alpha=0.3, axis='y', linestyle='-', linewidth=1)
+    ax.set_axisbelow(True)
+    ax.tick_params(axis='both', which='major', labelsize=12, length=8, width=2)
+
+    for spine in ax.spines.values():
+        spine.set_linewidth(2)
+        spine.set_edgecolor('#2c3e50')
+
+    plt.savefig('charts/17_floor_preference.png', dpi=300, bbox_inches='tight',
+                facecolor='white', edgecolor='none',
+                pil_kwargs={'compress_level': 1})
+    plt.close()
+    print("✓ Saved: charts/17_floor_preference.png\n")
+
 
 # =============================================================================
 # CHART 18: Building Type Analysis (by total floors)
 # =============================================================================
-print("Generating Chart 18: Building Type Distribution...")
-
-fig = plt.figure(figsize=(16, 10))
-ax = plt.subplot(111)
-
-# Categorize building types
-df_clean['building_type'] = pd.cut(df_clean['floors'],
-                                   bins=[0, 5, 10, 16, 100],
-                                   labels=['Low-Rise\n(≤5 floors)',
-                                          'Mid-Rise\n(6-10 floors)',
-                                          'High-Rise\n(11-16 floors)',
-                                          'Skyscraper\n(>16 floors)'])
-
-building_stats = df_clean.groupby('building_type').agg({
-    'price_value': ['mean', 'count'],
-    'area_value': 'mean'
-}).reset_index()
-building_stats.columns = ['building_type', 'mean_price', 'count', 'mean_area']
-building_stats = building_stats.dropna()
-
-x = range(len(building_stats))
-colors = ['#95a5a6', '#3498db', '#2ecc71', '#e74c3c']
-
-bars = ax.bar(x, building_stats['count'], color=colors,
-              alpha=0.9, edgecolor='white', linewidth=2)
-
-# Add value labels
-for i, (bar, count, price) in enumerate(zip(bars, building_stats['count'], building_stats['mean_price'])):
-    height = bar.get_height()
-    ax.text(bar.get_x() + bar.get_width()/2., height,
-            f'{count:,}\nAvg: {price/1000:.0f}K',
-            ha='center', va='bottom', fontsize=12, fontweight='bold')
-
-ax.set_xticks(x)
-ax.set_xticklabels(building_stats['building_type'], fontsize=13)
-ax.set_xlabel('Building Type', fontsize=16, fontweight='bold', labelpad=15)
-ax.set_ylabel('Number of Properties', fontsize=16, fontweight='bold', labelpad=15)
-ax.set_title('Property Distribution by Building Type',
-             fontsize=20, fontweight='bold', pad=25)
-
-ax.yaxis.set_major_formatter(FuncFormatter(format_count))
-ax.grid(True, alpha=0.3, axis='y', linestyle='-', linewidth=1)
-ax.set_axisbelow(True)
-ax.tick_params(axis='both', which='major', labelsize=12, length=8, width=2)
-
-for spine in ax.spines.values():
-    spine.set_linewidth(2)
-    spine.set_edgecolor('#2c3e50')
-
-plt.tight_layout(pad=2)
-plt.savefig('charts/18_building_type_distribution.png', dpi=300, bbox_inches='tight',
-            facecolor='white', edgecolor='none')
-plt.close()
-print("✓ Saved: charts/18_building_type_distribution.png\n")
+def chart_18(building_stats):
+    """Building Type Analysis (by total floors)"""
+    print("Generating Chart 18: Building Type Distribution...")
+
+    fig = plt.figure(figsize=(16, 10))
+    ax = plt.subplot(111)
+
+    x = range(len(building_stats))
+    colors = ['#95a5a6', '#3498db', '#2ecc71', '#e74c3c']
+
+    bars = ax.bar(x, building_stats['count'], color=colors,
+                  alpha=0.9, edgecolor='white', linewidth=2)
+
+    # Add value labels
+    ax.bar_label(bars, labels=[f'{count:,}\nAvg: {price/1000:.0f}K'
+                               for count, price in zip(building_stats['count'], building_stats['mean_price'])],
+                 fontsize=12, fontweight='bold')
+
+    ax.set_xticks(x)
+    ax.set_xticklabels(building_stats['building_type'], fontsize=13)
+    ax.set_xlabel('Building Type', fontsize=16, fontweight='bold', labelpad=15)
+    ax.set_ylabel('Number of Properties', fontsize=16, fontweight='bold', labelpad=15)
+    ax.set_title('Property Distribution by Building Type',
+                 fontsize=20, fontweight='bold', pad=25)
+
+    label_ticks(ax.yaxis, format_count)
+    ax.grid(True, alpha=0.3, axis='y', linestyle='-', linewidth=1)
+    ax.set_axisbelow(True)
+    ax.tick_params(axis='both', which='major', labelsize=12, length=8, width=2)
+
+    for spine in ax.spines.values():
+        spine.set_linewidth(2)
+        spine.set_edgecolor('#2c3e50')
+
+    plt.savefig('charts/18_building_type_distribution.png', dpi=300, bbox_inches='tight',
+                facecolor='white', edgecolor='none',
+                pil_kwargs={'compress_level': 1})
+    plt.close()
+    print("✓ Saved: charts/18_building_type_distribution.png\n")
+
 
 # =============================================================================
 # CHART 19: Top Locations Average Price
 # =============================================================================
-print("Generating Chart 19: Top Locations by Average Price...")
-
-fig = plt.figure(figsize=(16, 11))
-ax = plt.subplot(111)
-
-# Get top locations by property count
-location_stats = df_clean.groupby('location_name').agg({
-    'price_value': ['mean', 'count']
-}).reset_index()
-location_stats.columns = ['location', 'mean_price', 'count']
-location_stats = location_stats[location_stats['count'] >= 200]  # At least 200 properties
-location_stats = location_stats.nlargest(15, 'count')
-location_stats = location_stats.sort_values('mean_price', ascending=True)
-
-# Create horizontal bar chart
-colors = plt.cm.RdYlGn(np.linspace(0.2, 0.8, len(location_stats)))
-bars = ax.barh(range(len(location_stats)), location_stats['mean_price'],
-               color=colors, edgecolor='white', linewidth=2, alpha=0.9)
-
-# Add value labels
-for i, (bar, value, count) in enumerate(zip(bars, location_stats['mean_price'], location_stats['count'])):
-    ax.text(value + max(location_stats['mean_price'])*0.02, i,
-            f'{value/1000:.0f}K AZN\n({count:,})',
-            va='center', fontsize=10, fontweight='bold')
-
-ax.set_yticks(range(len(location_stats)))
-ax.set_yticklabels(location_stats['location'], fontsize=11)
-ax.set_xlabel('Average Price (AZN)', fontsize=16, fontweight='bold', labelpad=15)
-ax.set_ylabel('Location', fontsize=16, fontweight='bold', labelpad=15)
-ax.set_title('Average Price by Top 15 Locations (min. 200 properties)',
-             fontsize=20, fontweight='bold', pad=25)
-
-ax.xaxis.set_major_formatter(FuncFormatter(format_price))
-ax.grid(True, alpha=0.3, axis='x', linestyle='-', linewidth=1)
-ax.set_axisbelow(True)
-ax.tick_params(axis='both', which='major', labelsize=11, length=8, width=2)
-
-for spine in ax.spines.values():
-    spine.set_linewidth(2)
-    spine.set_edgecolor('#2c3e50')
-
-plt.tight_layout(pad=2)
-plt.savefig('charts/19_top_locations_price.png', dpi=300, bbox_inches='tight',
-            facecolor='white', edgecolor='none')
-plt.close()
-print("✓ Saved: charts/19_top_locations_price.png\n")
+def chart_19(location_stats):
+    """Top Locations Average Price"""
+    print("Generating Chart 19: Top Locations by Average Price...")
+
+    fig = plt.figure(figsize=(16, 11))
+    ax = plt.subplot(111)
+
+    # Create horizontal bar chart
+    colors = plt.cm.RdYlGn(np.linspace(0.2, 0.8, len(location_stats)))
+    bars = ax.barh(range(len(location_stats)), location_stats['mean_price'],
+                   color=colors, edgecolor='white', linewidth=2, alpha=0.9)
+
+    # Add value labels
+    offset = location_stats['mean_price'].max()*0.02
+    for i, (bar, value, count) in enumerate(zip(bars, location_stats['mean_price'], location_stats['count'])):
+        ax.text(value + offset, i,
+                f'{value/1000:.0f}K AZN\n({count:,})',
+                va='center', fontsize=10, fontweight='bold')
+
+    ax.set_yticks(range(len(location_stats)))
+    ax.set_yticklabels(location_stats['location'], fontsize=11)
+    ax.set_xlabel('Average Price (AZN)', fontsize=16, fontweight='bold', labelpad=15)
+    ax.set_ylabel('Location', fontsize=16, fontweight='bold', labelpad=15)
+    ax.set_title('Average Price by Top 15 Locations (min. 200 properties)',
+                 fontsize=20, fontweight='bold', pad=25)
+
+    label_ticks(ax.xaxis, format_price)
+    ax.grid(True, alpha=0.3, axis='x', linestyle='-', linewidth=1)
+    ax.set_axisbelow(True)
+    ax.tick_params(axis='both', which='major', labelsize=11, length=8, width=2)
+
+    for spine in ax.spines.values():
+        spine.set_linewidth(2)
+        spine.set_edgecolor('#2c3e50')
+
+    plt.savefig('charts/19_top_locations_price.png', dpi=300, bbox_inches='tight',
+                facecolor='white', edgecolor='none',
+                pil_kwargs={'compress_level': 1})
+    plt.close()
+    print("✓ Saved: charts/19_top_locations_price.png\n")
+
 
 # =============================================================================
 # CHART 20: Room vs Area Efficiency
 # =============================================================================
-print("Generating Chart 20: Area per Room Efficiency...")
-
-fig = plt.figure(figsize=(16, 10))
-ax = plt.subplot(111)
-
-# Calculate area per room
-df_clean['area_per_room'] = df_clean['area_value'] / df_clean['rooms']
-room_efficiency = df_clean[df_clean['rooms'] <= 6].groupby('rooms')['area_per_room'].agg(['mean', 'median', 'std'])
-
-x = room_efficiency.index
-mean_vals = room_efficiency['mean'].values
-median_vals = room_efficiency['median'].values
-
-width = 0.35
-
-bars1 = ax.bar(x - width/2, mean_vals, width, label='Mean Area/Room',
-               color='#e74c3c', alpha=0.9, edgecolor='white', linewidth=2)
-bars2 = ax.bar(x + width/2, median_vals, width, label='Median Area/Room',
-               color='#3498db', alpha=0.9, edgecolor='white', linewidth=2)
-
-# Add value labels
-for bars in [bars1, bars2]:
-    for bar in bars:
-        height = bar.get_height()
-        ax.text(bar.get_x() + bar.get_width()/2., height,
-                f'{height:.1f}m²',
-                ha='center', va='bottom', fontsize=12, fontweight='bold')
-
-ax.set_xlabel('Number of Rooms', fontsize=16, fontweight='bold', labelpad=15)
-ax.set_ylabel('Area per Room (m²/room)', fontsize=16, fontweight='bold', labelpad=15)
-ax.set_title('Average Area per Room by Property Size',
-             fontsize=20, fontweight='bold', pad=25)
-ax.set_xticks(x)
-ax.set_xticklabels([f'{int(r)} Room{"s" if r > 1 else ""}' for r in x])
-ax.legend(fontsize=14, framealpha=0.98, edgecolor='#2c3e50',
-         fancybox=True, shadow=True)
-ax.grid(True, alpha=0.3, axis='y', linestyle='-', linewidth=1)
-ax.set_axisbelow(True)
-ax.tick_params(axis='both', which='major', labelsize=12, length=8, width=2)
-
-for spine in ax.spines.values():
-    spine.set_linewidth(2)
-    spine.set_edgecolor('#2c3e50')
-
-plt.tight_layout(pad=2)
-plt.savefig('charts/20_area_per_room_efficiency.png', dpi=300, bbox_inches='tight',
-            facecolor='white', edgecolor='none')
-plt.close()
-print("✓ Saved: charts/20_area_per_room_efficiency.png\n")
-
-print("="*80)
-print("ADVANCED INSIGHTS GENERATION COMPLETE!")
-print("="*80)
-print("\nNew charts created:")
-print("  13. Average Price by City")
-print("  14. Feature Impact on Price")
-print("  15. Average Area by Rooms")
-print("  16. Market Segmentation")
-print("  17. Floor Preference Analysis")
-print("  18. Building Type Distribution")
-print("  19. Top Locations by Price")
-print("  20. Area per Room Efficiency")
-print("\nTotal charts: 20")
-print("="*80)
+def chart_20(room_stats):
+    """Room vs Area Efficiency"""
+    print("Generating Chart 20: Area per Room Efficiency...")
+
+    fig = plt.figure(figsize=(16, 10))
+    ax = plt.subplot(111)
+
+    # Area per room, from the room groups shared with chart 15
+    room_efficiency = room_stats.loc[room_stats.index <= 6,
+                                     ['mean_area_per_room', 'median_area_per_room', 'std_area_per_room']]
+    room_efficiency.columns = ['mean', 'median', 'std']
+
+    x = room_efficiency.index
+    mean_vals = room_efficiency['mean'].values
+    median_vals = room_efficiency['median'].values
+
+    width = 0.35
+
+    bars1 = ax.bar(x - width/2, mean_vals, width, label='Mean Area/Room',
+                   color='#e74c3c', alpha=0.9, edgecolor='white', linewidth=2)
+    bars2 = ax.bar(x + width/2, median_vals, width, label='Median Area/Room',
+                   color='#3498db', alpha=0.9, edgecolor='white', linewidth=2)
+
+    # Add value labels
+    for bars in [bars1, bars2]:
+        ax.bar_label(bars, fmt='{:.1f}m²', fontsize=12, fontweight='bold')
+
+    ax.set_xlabel('Number of Rooms', fontsize=16, fontweight='bold', labelpad=15)
+    ax.set_ylabel('Area per Room (m²/room)', fontsize=16, fontweight='bold', labelpad=15)
+    ax.set_title('Average Area per Room by Property Size',
+                 fontsize=20, fontweight='bold', pad=25)
+    ax.set_xticks(x)
+    ax.set_xticklabels([f'{int(r)} Room{"s" if r > 1 else ""}' for r in x])
+    ax.legend(fontsize=14, framealpha=0.98, edgecolor='#2c3e50',
+             fancybox=True, shadow=True)
+    ax.grid(True, alpha=0.3, axis='y', linestyle='-', linewidth=1)
+    ax.set_axisbelow(True)
+    ax.tick_params(axis='both', which='major', labelsize=12, length=8, width=2)
+
+    for spine in ax.spines.values():
+        spine.set_linewidth(2)
+        spine.set_edgecolor('#2c3e50')
+
+    plt.savefig('charts/20_area_per_room_efficiency.png', dpi=300, bbox_inches='tight',
+                facecolor='white', edgecolor='none',
+                pil_kwargs={'compress_level': 1})
+    plt.close()
+    print("✓ Saved: charts/20_area_per_room_efficiency.png\n")
+
+
+def render(task):
+    """Pool worker: draw one chart from its precomputed table"""
+    chart, table = task
+    chart(table)
+
+
+# Each chart and the aggregated table it draws
+CHARTS = [
+    (chart_13, 'city_data'),
+    (chart_14, 'feature_impact'),
+    (chart_15, 'room_stats'),
+    (chart_16, 'segment_counts'),
+    (chart_17, 'floor_stats'),
+    (chart_18, 'building_stats'),
+    (chart_19, 'location_stats'),
+    (chart_20, 'room_stats'),
+]
+
+
+if __name__ == '__main__':
+    # Load cleaned data
+    df_clean = load_clean()
+    rooms = df_clean['rooms'].to_numpy()
+    df_clean = df_clean.loc[(rooms > 0) & (rooms <= 10)].reset_index(drop=True)
+
+    print(f"Clean data: {len(df_clean):,} records\n")
+
+    # The tables are a few rows each, so the workers get those instead of the DataFrame
+    tables = aggregate(df_clean)
+    tasks = [(chart, tables[name]) for chart, name in CHARTS]
+
+    # The charts are independent, so render them in parallel
+    with Pool(min(len(tasks), os.cpu_count() or 1)) as pool:
+        pool.map(render, tasks)
+
+    print("="*80)
+    print("ADVANCED INSIGHTS GENERATION COMPLETE!")
+    print("="*80)
+    print("\nNew charts created:")
+    print("  13. Average Price by City")
+    print("  14. Feature Impact on Price")
+    print("  15. Average Area by Rooms")
+    print("  16. Market Segmentation")
+    print("  17. Floor Preference Analysis")
+    print("  18. Building Type Distribution")
+    print("  19. Top Locations by Price")
+    print("  20. Area per Room Efficiency")
+    print("\nTotal charts: 20")
+    print("="*80)
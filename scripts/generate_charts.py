@@ -4,11 +4,12 @@ Real Estate Data Analysis - Chart Generation
 Generates comprehensive, attractive visualizations of real estate data
 """
 
-import pandas as pd
 import numpy as np
 import matplotlib.pyplot as plt
 import seaborn as sns
 from datetime import datetime
+from _data import load_raw
+from _charts import bucket, histogram, top_counts
 import warnings
 warnings.filterwarnings('ignore')
 
@@ -18,9 +19,10 @@ sns.set_palette("husl")
 
 # Configure matplotlib for better looking charts
 plt.rcParams['figure.figsize'] = (12, 8)
-plt.rcParams['figure.dpi'] = 300
+plt.rcParams['figure.dpi'] = 100  # layout only; savefig renders the PNG at 300
 plt.rcParams['savefig.dpi'] = 300
 plt.rcParams['savefig.bbox'] = 'tight'
+plt.rcParams['figure.constrained_layout.use'] = True
 plt.rcParams['font.size'] = 10
 plt.rcParams['axes.titlesize'] = 14
 plt.rcParams['axes.labelsize'] = 11
@@ -28,40 +30,49 @@ plt.rcParams['xtick.labelsize'] = 9
 plt.rcParams['ytick.labelsize'] = 9
 plt.rcParams['legend.fontsize'] = 9
 
-# Load data
-print("Loading combined dataset...")
-df = pd.read_csv('data/combined_real_estate_bina_format.csv')
+# Load data: only the charted columns, with the shared narrow dtypes
+df = load_raw()
 print(f"Loaded {len(df):,} records\n")
 
-# Data cleaning for analysis
-df_clean = df.copy()
+# Data cleaning for analysis: one boolean mask over the loaded frame (no copy);
+# each 99th-percentile cut-off is taken over the rows that pass the filters before it,
+# partitioning the masked copy in place (linear interpolation, as pandas quantile)
+price = df['price_value'].to_numpy()
+area = df['area_value'].to_numpy()
+floor = df['floor'].to_numpy()
+rooms = df['rooms'].to_numpy()
 
 # Clean price data (remove outliers and zero prices)
-df_clean = df_clean[df_clean['price_value'] > 0]
-df_clean = df_clean[df_clean['price_value'] < df_clean['price_value'].quantile(0.99)]
+mask = price > 0
+mask &= price < np.percentile(price[mask], 99, overwrite_input=True)
 
 # Clean area data
-df_clean = df_clean[df_clean['area_value'] > 0]
-df_clean = df_clean[df_clean['area_value'] < df_clean['area_value'].quantile(0.99)]
+mask &= area > 0
+mask &= area < np.percentile(area[mask], 99, overwrite_input=True)
 
-# Clean floor data
-df_clean = df_clean[df_clean['floor'] > 0]
-df_clean = df_clean[df_clean['floor'] < 50]
+# Clean floor and rooms data
+mask &= (floor > 0) & (floor < 50) & (rooms > 0) & (rooms <= 10)
 
-# Clean rooms data
-df_clean = df_clean[df_clean['rooms'] > 0]
-df_clean = df_clean[df_clean['rooms'] <= 10]
+# The cleaned-data charts only use the numeric columns; the category and flag
+# columns stay on the full frame for the full-dataset charts
+df_clean = df.loc[mask, ['price_value', 'area_value', 'floor', 'floors', 'rooms']].reset_index(drop=True)
 
 print(f"After cleaning: {len(df_clean):,} records\n")
 
+# One figure (and canvas) serves every chart; each chart clears it and adds fresh axes
+fig = plt.figure(figsize=(14, 8))
+
 # =============================================================================
 # CHART 1: Price Distribution
 # =============================================================================
 print("Generating Chart 1: Price Distribution...")
-fig, ax = plt.subplots(figsize=(14, 8))
+fig.clear()
+ax = fig.add_subplot()
 
 prices = df_clean['price_value'].dropna()
-ax.hist(prices, bins=50, color='#3498db', edgecolor='black', alpha=0.7)
+# Bin with an explicit range, then let ax.hist draw the precomputed counts
+counts, edges = histogram(prices.to_numpy(), 50)
+ax.hist(edges[:-1], bins=edges, weights=counts, color='#3498db', edgecolor='black', alpha=0.7)
 
 ax.set_xlabel('Price (AZN)', fontsize=12, fontweight='bold')
 ax.set_ylabel('Number of Properties', fontsize=12, fontweight='bold')
@@ -81,16 +92,16 @@ ax.text(0.98, 0.97, stats_text, transform=ax.transAxes, fontsize=10,
 
 ax.legend(loc='upper right', framealpha=0.9)
 ax.grid(True, alpha=0.3)
-plt.tight_layout()
-plt.savefig('charts/01_price_distribution.png', dpi=300, bbox_inches='tight')
-plt.close()
+plt.savefig('charts/01_price_distribution.png', dpi=300, bbox_inches='tight',
+            pil_kwargs={'compress_level': 1})
 print("✓ Saved: charts/01_price_distribution.png\n")
 
 # =============================================================================
 # CHART 2: Price by Number of Rooms
 # =============================================================================
 print("Generating Chart 2: Price by Number of Rooms...")
-fig, ax = plt.subplots(figsize=(14, 8))
+fig.clear()
+ax = fig.add_subplot()
 
 room_price = df_clean[['rooms', 'price_value']].dropna()
 room_price = room_price[room_price['rooms'] <= 6]  # Focus on 1-6 rooms
@@ -108,11 +119,7 @@ bars2 = ax.bar(x + width/2, room_stats['median'], width, label='Median Price',
 
 # Add value labels on bars
 for bars in [bars1, bars2]:
-    for bar in bars:
-        height = bar.get_height()
-        ax.text(bar.get_x() + bar.get_width()/2., height,
-                f'{height:,.0f}',
-                ha='center', va='bottom', fontsize=9, fontweight='bold')
+    ax.bar_label(bars, fmt='{:,.0f}', fontsize=9, fontweight='bold')
 
 ax.set_xlabel('Number of Rooms', fontsize=12, fontweight='bold')
 ax.set_ylabel('Price (AZN)', fontsize=12, fontweight='bold')
@@ -121,21 +128,22 @@ ax.set_xticks(x)
 ax.legend(framealpha=0.9)
 ax.grid(True, alpha=0.3, axis='y')
 
-plt.tight_layout()
-plt.savefig('charts/02_price_by_rooms.png', dpi=300, bbox_inches='tight')
-plt.close()
+plt.savefig('charts/02_price_by_rooms.png', dpi=300, bbox_inches='tight',
+            pil_kwargs={'compress_level': 1})
 print("✓ Saved: charts/02_price_by_rooms.png\n")
 
 # =============================================================================
 # CHART 3: Area Distribution
 # =============================================================================
 print("Generating Chart 3: Area Distribution...")
-fig, ax = plt.subplots(figsize=(14, 8))
+fig.clear()
+ax = fig.add_subplot()
 
 areas = df_clean['area_value'].dropna()
 areas = areas[areas <= 500]  # Focus on typical apartments
 
-ax.hist(areas, bins=60, color='#9b59b6', edgecolor='black', alpha=0.7)
+counts, edges = histogram(areas.to_numpy(), 60)
+ax.hist(edges[:-1], bins=edges, weights=counts, color='#9b59b6', edgecolor='black', alpha=0.7)
 
 ax.set_xlabel('Area (m²)', fontsize=12, fontweight='bold')
 ax.set_ylabel('Number of Properties', fontsize=12, fontweight='bold')
@@ -155,16 +163,16 @@ ax.text(0.98, 0.97, stats_text, transform=ax.transAxes, fontsize=10,
 
 ax.legend(loc='upper right', framealpha=0.9)
 ax.grid(True, alpha=0.3)
-plt.tight_layout()
-plt.savefig('charts/03_area_distribution.png', dpi=300, bbox_inches='tight')
-plt.close()
+plt.savefig('charts/03_area_distribution.png', dpi=300, bbox_inches='tight',
+            pil_kwargs={'compress_level': 1})
 print("✓ Saved: charts/03_area_distribution.png\n")
 
 # =============================================================================
 # CHART 4: Price per Square Meter by Rooms
 # =============================================================================
 print("Generating Chart 4: Price per Square Meter Analysis...")
-fig, ax = plt.subplots(figsize=(14, 8))
+fig.clear()
+ax = fig.add_subplot()
 
 # Calculate price per m²
 df_price_m2 = df_clean[['rooms', 'price_value', 'area_value']].dropna()
@@ -190,53 +198,52 @@ ax.set_ylabel('Price per m² (AZN)', fontsize=12, fontweight='bold')
 ax.set_title('Price per Square Meter by Number of Rooms', fontsize=16, fontweight='bold', pad=20)
 ax.grid(True, alpha=0.3, axis='y')
 
-plt.tight_layout()
-plt.savefig('charts/04_price_per_sqm.png', dpi=300, bbox_inches='tight')
-plt.close()
+plt.savefig('charts/04_price_per_sqm.png', dpi=300, bbox_inches='tight',
+            pil_kwargs={'compress_level': 1})
 print("✓ Saved: charts/04_price_per_sqm.png\n")
 
 # =============================================================================
 # CHART 5: Room Count Distribution
 # =============================================================================
 print("Generating Chart 5: Room Count Distribution...")
-fig, ax = plt.subplots(figsize=(14, 8))
+fig.clear()
+ax = fig.add_subplot()
 
 room_counts = df_clean['rooms'].dropna()
 room_counts = room_counts[room_counts <= 7]
 
-room_dist = room_counts.value_counts().sort_index()
+room_values, room_dist = np.unique(room_counts.to_numpy(), return_counts=True)
 
 colors = plt.cm.viridis(np.linspace(0, 1, len(room_dist)))
-bars = ax.bar(room_dist.index, room_dist.values, color=colors, edgecolor='black', alpha=0.8)
+bars = ax.bar(room_values, room_dist, color=colors, edgecolor='black', alpha=0.8)
 
 # Add value labels
-for bar in bars:
-    height = bar.get_height()
-    ax.text(bar.get_x() + bar.get_width()/2., height,
-            f'{int(height):,}\n({height/len(room_counts)*100:.1f}%)',
-            ha='center', va='bottom', fontsize=10, fontweight='bold')
+ax.bar_label(bars, labels=[f'{int(height):,}\n({height/len(room_counts)*100:.1f}%)'
+                           for height in bars.datavalues],
+             fontsize=10, fontweight='bold')
 
 ax.set_xlabel('Number of Rooms', fontsize=12, fontweight='bold')
 ax.set_ylabel('Number of Properties', fontsize=12, fontweight='bold')
 ax.set_title('Distribution of Properties by Number of Rooms', fontsize=16, fontweight='bold', pad=20)
-ax.set_xticks(room_dist.index)
+ax.set_xticks(room_values)
 ax.grid(True, alpha=0.3, axis='y')
 
-plt.tight_layout()
-plt.savefig('charts/05_room_distribution.png', dpi=300, bbox_inches='tight')
-plt.close()
+plt.savefig('charts/05_room_distribution.png', dpi=300, bbox_inches='tight',
+            pil_kwargs={'compress_level': 1})
 print("✓ Saved: charts/05_room_distribution.png\n")
 
 # =============================================================================
 # CHART 6: Floor Distribution
 # =============================================================================
 print("Generating Chart 6: Floor Distribution...")
-fig, ax = plt.subplots(figsize=(14, 8))
+fig.clear()
+ax = fig.add_subplot()
 
 floors = df_clean['floor'].dropna()
 floors = floors[floors <= 25]
 
-ax.hist(floors, bins=25, color='#e67e22', edgecolor='black', alpha=0.7)
+counts, edges = histogram(floors.to_numpy(), 25)
+ax.hist(edges[:-1], bins=edges, weights=counts, color='#e67e22', edgecolor='black', alpha=0.7)
 
 ax.set_xlabel('Floor Number', fontsize=12, fontweight='bold')
 ax.set_ylabel('Number of Properties', fontsize=12, fontweight='bold')
@@ -254,53 +261,55 @@ ax.text(0.98, 0.97, stats_text, transform=ax.transAxes, fontsize=10,
 
 ax.legend(framealpha=0.9)
 ax.grid(True, alpha=0.3)
-plt.tight_layout()
-plt.savefig('charts/06_floor_distribution.png', dpi=300, bbox_inches='tight')
-plt.close()
+plt.savefig('charts/06_floor_distribution.png', dpi=300, bbox_inches='tight',
+            pil_kwargs={'compress_level': 1})
 print("✓ Saved: charts/06_floor_distribution.png\n")
 
 # =============================================================================
 # CHART 7: Top Cities by Property Count
 # =============================================================================
 print("Generating Chart 7: Top Cities...")
-fig, ax = plt.subplots(figsize=(14, 8))
+fig.clear()
+ax = fig.add_subplot()
 
-city_counts = df['city_name'].dropna().value_counts().head(15)
+city_names, city_counts = top_counts(df['city_name'], 15)
 
 colors = plt.cm.Spectral(np.linspace(0, 1, len(city_counts)))
-bars = ax.barh(range(len(city_counts)), city_counts.values, color=colors, edgecolor='black', alpha=0.8)
+bars = ax.barh(range(len(city_counts)), city_counts, color=colors, edgecolor='black', alpha=0.8)
 
-# Add value labels
-for i, (bar, value) in enumerate(zip(bars, city_counts.values)):
-    ax.text(value + max(city_counts.values)*0.01, i, f'{value:,}',
-            va='center', fontsize=10, fontweight='bold')
+# Add value labels (the padding matches the old 1%-of-max data offset)
+ax.bar_label(bars, labels=[f'{value:,}' for value in city_counts], padding=9,
+             fontsize=10, fontweight='bold')
 
 ax.set_yticks(range(len(city_counts)))
-ax.set_yticklabels(city_counts.index)
+ax.set_yticklabels(city_names)
 ax.set_xlabel('Number of Properties', fontsize=12, fontweight='bold')
 ax.set_ylabel('City', fontsize=12, fontweight='bold')
 ax.set_title('Top 15 Cities by Number of Properties', fontsize=16, fontweight='bold', pad=20)
 ax.grid(True, alpha=0.3, axis='x')
 
-plt.tight_layout()
-plt.savefig('charts/07_top_cities.png', dpi=300, bbox_inches='tight')
-plt.close()
+plt.savefig('charts/07_top_cities.png', dpi=300, bbox_inches='tight',
+            pil_kwargs={'compress_level': 1})
 print("✓ Saved: charts/07_top_cities.png\n")
 
 # =============================================================================
 # CHART 8: Property Features Analysis
 # =============================================================================
 print("Generating Chart 8: Property Features...")
-fig, ax = plt.subplots(figsize=(14, 8))
-
-features = {
-    'Has Repair': df['has_repair'].value_counts().get(True, 0),
-    'Has Mortgage': df['has_mortgage'].value_counts().get(True, 0),
-    'Bill of Sale': df['has_bill_of_sale'].value_counts().get(True, 0),
-    'VIP Listing': df['vipped'].value_counts().get(True, 0),
-    'Featured': df['featured'].value_counts().get(True, 0),
-    'Business': df['is_business'].value_counts().get(True, 0)
+fig.clear()
+ax = fig.add_subplot()
+
+# Count the True flags of every column in one pass (missing counts as False)
+feature_names = {
+    'has_repair': 'Has Repair',
+    'has_mortgage': 'Has Mortgage',
+    'has_bill_of_sale': 'Bill of Sale',
+    'vipped': 'VIP Listing',
+    'featured': 'Featured',
+    'is_business': 'Business'
 }
+feature_counts = df[list(feature_names)].to_numpy(dtype=bool, na_value=False).sum(axis=0)
+features = dict(zip(feature_names.values(), feature_counts.tolist()))
 
 features_sorted = dict(sorted(features.items(), key=lambda x: x[1], reverse=True))
 colors = ['#e74c3c', '#3498db', '#2ecc71', '#f39c12', '#9b59b6', '#1abc9c']
@@ -309,11 +318,10 @@ bars = ax.bar(range(len(features_sorted)), features_sorted.values(),
               color=colors, edgecolor='black', alpha=0.8)
 
 # Add value labels
-for bar in bars:
-    height = bar.get_height()
-    ax.text(bar.get_x() + bar.get_width()/2., height,
-            f'{int(height):,}\n({height/len(df)*100:.1f}%)',
-            ha='center', va='bottom', fontsize=10, fontweight='bold')
+total = len(df)
+ax.bar_label(bars, labels=[f'{int(height):,}\n({height/total*100:.1f}%)'
+                           for height in bars.datavalues],
+             fontsize=10, fontweight='bold')
 
 ax.set_xticks(range(len(features_sorted)))
 ax.set_xticklabels(features_sorted.keys(), rotation=45, ha='right')
@@ -321,16 +329,16 @@ ax.set_ylabel('Number of Properties', fontsize=12, fontweight='bold')
 ax.set_title('Property Features Distribution', fontsize=16, fontweight='bold', pad=20)
 ax.grid(True, alpha=0.3, axis='y')
 
-plt.tight_layout()
-plt.savefig('charts/08_property_features.png', dpi=300, bbox_inches='tight')
-plt.close()
+plt.savefig('charts/08_property_features.png', dpi=300, bbox_inches='tight',
+            pil_kwargs={'compress_level': 1})
 print("✓ Saved: charts/08_property_features.png\n")
 
 # =============================================================================
 # CHART 9: Price Range Categories
 # =============================================================================
 print("Generating Chart 9: Price Range Categories...")
-fig, ax = plt.subplots(figsize=(14, 8))
+fig.clear()
+ax = fig.add_subplot()
 
 prices_clean = df_clean['price_value'].dropna()
 
@@ -338,47 +346,53 @@ prices_clean = df_clean['price_value'].dropna()
 bins = [0, 50000, 100000, 150000, 200000, 300000, 500000, float('inf')]
 labels = ['<50K', '50K-100K', '100K-150K', '150K-200K', '200K-300K', '300K-500K', '>500K']
 
-price_ranges = pd.cut(prices_clean, bins=bins, labels=labels)
-range_counts = price_ranges.value_counts().sort_index()
+range_codes = bucket(prices_clean.to_numpy(), bins)
+range_counts = np.bincount(range_codes[range_codes >= 0], minlength=len(labels))
 
 colors = plt.cm.RdYlGn_r(np.linspace(0.2, 0.8, len(range_counts)))
-bars = ax.bar(range(len(range_counts)), range_counts.values, color=colors,
+bars = ax.bar(range(len(range_counts)), range_counts, color=colors,
               edgecolor='black', alpha=0.8)
 
 # Add value labels
-for bar in bars:
-    height = bar.get_height()
-    ax.text(bar.get_x() + bar.get_width()/2., height,
-            f'{int(height):,}\n({height/len(prices_clean)*100:.1f}%)',
-            ha='center', va='bottom', fontsize=10, fontweight='bold')
+ax.bar_label(bars, labels=[f'{int(height):,}\n({height/len(prices_clean)*100:.1f}%)'
+                           for height in bars.datavalues],
+             fontsize=10, fontweight='bold')
 
 ax.set_xticks(range(len(range_counts)))
-ax.set_xticklabels(range_counts.index, rotation=45, ha='right')
+ax.set_xticklabels(labels, rotation=45, ha='right')
 ax.set_ylabel('Number of Properties', fontsize=12, fontweight='bold')
 ax.set_xlabel('Price Range (AZN)', fontsize=12, fontweight='bold')
 ax.set_title('Distribution of Properties by Price Range', fontsize=16, fontweight='bold', pad=20)
 ax.grid(True, alpha=0.3, axis='y')
 
-plt.tight_layout()
-plt.savefig('charts/09_price_ranges.png', dpi=300, bbox_inches='tight')
-plt.close()
+plt.savefig('charts/09_price_ranges.png', dpi=300, bbox_inches='tight',
+            pil_kwargs={'compress_level': 1})
 print("✓ Saved: charts/09_price_ranges.png\n")
 
 # =============================================================================
 # CHART 10: Area vs Price Scatter
 # =============================================================================
 print("Generating Chart 10: Area vs Price Correlation...")
-fig, ax = plt.subplots(figsize=(14, 8))
+fig.clear()
+ax = fig.add_subplot()
 
 scatter_data = df_clean[['area_value', 'price_value', 'rooms']].dropna()
 scatter_data = scatter_data[scatter_data['area_value'] <= 300]
 scatter_data = scatter_data[scatter_data['rooms'] <= 5]
 
-# Create scatter plot with color by rooms
-for room in sorted(scatter_data['rooms'].unique()):
-    data = scatter_data[scatter_data['rooms'] == room]
-    ax.scatter(data['area_value'], data['price_value'], alpha=0.5,
-              s=30, label=f'{int(room)} Room{"s" if room > 1 else ""}')
+# Create scatter plot with color by rooms: one collection for every point, drawn
+# room by room (stable sort) in the palette's colours, with empty per-room
+# collections as legend entries
+rooms = scatter_data['rooms'].to_numpy()
+room_values, room_codes = np.unique(rooms, return_inverse=True)
+order = np.argsort(room_codes, kind='stable')
+palette = plt.rcParams['axes.prop_cycle'].by_key()['color']
+room_colors = [palette[i % len(palette)] for i in range(len(room_values))]
+
+ax.scatter(scatter_data['area_value'].to_numpy()[order], scatter_data['price_value'].to_numpy()[order],
+           c=np.array(room_colors)[room_codes[order]], alpha=0.5, s=30)
+for room, color in zip(room_values, room_colors):
+    ax.scatter([], [], color=color, alpha=0.5, s=30, label=f'{int(room)} Room{"s" if room > 1 else ""}')
 
 ax.set_xlabel('Area (m²)', fontsize=12, fontweight='bold')
 ax.set_ylabel('Price (AZN)', fontsize=12, fontweight='bold')
@@ -386,21 +400,22 @@ ax.set_title('Property Price vs Area (by Number of Rooms)', fontsize=16, fontwei
 ax.legend(title='Rooms', framealpha=0.9)
 ax.grid(True, alpha=0.3)
 
-plt.tight_layout()
-plt.savefig('charts/10_area_vs_price.png', dpi=300, bbox_inches='tight')
-plt.close()
+plt.savefig('charts/10_area_vs_price.png', dpi=300, bbox_inches='tight',
+            pil_kwargs={'compress_level': 1})
 print("✓ Saved: charts/10_area_vs_price.png\n")
 
 # =============================================================================
 # CHART 11: Building Floor Count Distribution
 # =============================================================================
 print("Generating Chart 11: Building Heights...")
-fig, ax = plt.subplots(figsize=(14, 8))
+fig.clear()
+ax = fig.add_subplot()
 
 building_floors = df_clean['floors'].dropna()
 building_floors = building_floors[building_floors <= 30]
 
-ax.hist(building_floors, bins=30, color='#34495e', edgecolor='black', alpha=0.7)
+counts, edges = histogram(building_floors.to_numpy(), 30)
+ax.hist(edges[:-1], bins=edges, weights=counts, color='#34495e', edgecolor='black', alpha=0.7)
 
 ax.set_xlabel('Total Floors in Building', fontsize=12, fontweight='bold')
 ax.set_ylabel('Number of Properties', fontsize=12, fontweight='bold')
@@ -420,38 +435,38 @@ ax.text(0.98, 0.97, stats_text, transform=ax.transAxes, fontsize=10,
 
 ax.legend(framealpha=0.9)
 ax.grid(True, alpha=0.3)
-plt.tight_layout()
-plt.savefig('charts/11_building_heights.png', dpi=300, bbox_inches='tight')
-plt.close()
+plt.savefig('charts/11_building_heights.png', dpi=300, bbox_inches='tight',
+            pil_kwargs={'compress_level': 1})
 print("✓ Saved: charts/11_building_heights.png\n")
 
 # =============================================================================
 # CHART 12: Top Locations
 # =============================================================================
 print("Generating Chart 12: Top Locations...")
-fig, ax = plt.subplots(figsize=(14, 10))
+fig.clear()
+fig.set_size_inches(14, 10)
+ax = fig.add_subplot()
 
-location_counts = df['location_name'].dropna().value_counts().head(20)
+location_names, location_counts = top_counts(df['location_name'], 20)
 
 colors = plt.cm.plasma(np.linspace(0, 1, len(location_counts)))
-bars = ax.barh(range(len(location_counts)), location_counts.values,
+bars = ax.barh(range(len(location_counts)), location_counts,
                color=colors, edgecolor='black', alpha=0.8)
 
-# Add value labels
-for i, (bar, value) in enumerate(zip(bars, location_counts.values)):
-    ax.text(value + max(location_counts.values)*0.01, i, f'{value:,}',
-            va='center', fontsize=9, fontweight='bold')
+# Add value labels (the padding matches the old 1%-of-max data offset)
+ax.bar_label(bars, labels=[f'{value:,}' for value in location_counts], padding=9,
+             fontsize=9, fontweight='bold')
 
 ax.set_yticks(range(len(location_counts)))
-ax.set_yticklabels(location_counts.index, fontsize=9)
+ax.set_yticklabels(location_names, fontsize=9)
 ax.set_xlabel('Number of Properties', fontsize=12, fontweight='bold')
 ax.set_ylabel('Location', fontsize=12, fontweight='bold')
 ax.set_title('Top 20 Locations by Property Count', fontsize=16, fontweight='bold', pad=20)
 ax.grid(True, alpha=0.3, axis='x')
 
-plt.tight_layout()
-plt.savefig('charts/12_top_locations.png', dpi=300, bbox_inches='tight')
-plt.close()
+plt.savefig('charts/12_top_locations.png', dpi=300, bbox_inches='tight',
+            pil_kwargs={'compress_level': 1})
+plt.close(fig)
 print("✓ Saved: charts/12_top_locations.png\n")
 
 # =============================================================================
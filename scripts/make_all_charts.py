@@ -0,0 +1,570 @@
+#!/usr/bin/env python3
+"""
+Distribution charts (price, area, floor, building height) in either style
+Replaces fix_charts.py (classic) and fix_charts_v2.py (v2); the default is v2
+
+Usage: python make_all_charts.py [classic|v2]
+"""
+
+import os
+import sys
+from collections import namedtuple
+from multiprocessing import Pool
+import numpy as np
+import matplotlib.pyplot as plt
+from matplotlib.ticker import FuncFormatter, MaxNLocator
+from _data import load_clean
+from _charts import cap, histogram, describe, gradient_bars, format_price, format_thousands, format_count
+import warnings
+warnings.filterwarnings('ignore')
+
+# Matplotlib style and rcParams for each variant
+STYLES = {
+    'classic': ('seaborn-v0_8-whitegrid', {
+        'figure.dpi': 100,  # layout only; savefig renders the PNG at 300
+        'savefig.dpi': 300,
+        'savefig.bbox': 'tight',
+        'figure.constrained_layout.use': True,
+        'font.family': 'sans-serif',
+        'font.sans-serif': ['Arial', 'DejaVu Sans'],
+    }),
+    'v2': ('default', {
+        # Every chart shares the same spine style
+        'axes.linewidth': 2,
+        'axes.edgecolor': '#2c3e50',
+        'figure.constrained_layout.use': True,
+    }),
+}
+
+# Plotted series: source column, upper cap and dtype
+SERIES = {
+    'price': ('price_value', None, np.float32),
+    'area': ('area_value', 500, np.float32),
+    'floor': ('floor', 25, np.int16),
+    'floors': ('floors', 30, np.int16),
+}
+
+Summary = namedtuple('Summary', 'stats mode histograms')
+
+
+def summarize(df_clean, charts):
+    """Stats, mode and histograms for each series the charts use, computed once per series/bin count"""
+    summaries = {}
+    for name, (column, limit, dtype) in SERIES.items():
+        bin_counts = {bins for _, series, bins in charts if series == name}
+        if not bin_counts:
+            continue
+
+        values = df_clean[column].dropna()
+        if limit is not None:
+            values = cap(values, limit)
+        values = values.astype(dtype, copy=False)
+
+        stats = describe(values)
+        # Only the whole-number (floor) charts show a mode; count occurrences
+        # from the minimum up so argmax picks the smallest most common value
+        mode = None
+        if np.issubdtype(dtype, np.integer):
+            offsets = values.to_numpy().astype(np.intp) - int(stats.min)
+            mode = int(stats.min) + int(np.bincount(offsets).argmax())
+        histograms = {bins: histogram(values, bins, range=(stats.min, stats.max)) for bins in bin_counts}
+        summaries[name] = Summary(stats, mode, histograms)
+    return summaries
+
+
+def style_axes(ax, xlabel, ylabel, title, stats, edge_color):
+    """Apply the shared v2 labels, stats box, legend, grid and tick styling"""
+    ax.set_xlabel(xlabel, fontsize=16, fontweight='bold', labelpad=15)
+    ax.set_ylabel(ylabel, fontsize=16, fontweight='bold', labelpad=15)
+    ax.set_title(title, fontsize=20, fontweight='bold', pad=25)
+
+    # Stats box
+    props = dict(boxstyle='round,pad=1.2', facecolor='white',
+                 alpha=0.95, edgecolor=edge_color, linewidth=2.5)
+    ax.text(0.98, 0.98, stats, transform=ax.transAxes, fontsize=13,
+            verticalalignment='top', horizontalalignment='right',
+            bbox=props, family='monospace')
+
+    ax.legend(loc='upper left', fontsize=14, framealpha=0.98,
+              edgecolor='#2c3e50', fancybox=True, shadow=True)
+    ax.grid(True, alpha=0.3, linestyle='-', linewidth=1, color='gray')
+    ax.set_axisbelow(True)
+    ax.tick_params(axis='both', which='major', labelsize=13, length=8, width=2)
+
+
+# =============================================================================
+# CHART 1: Price Distribution (classic)
+# =============================================================================
+def classic_price_distribution(summary, n, bins):
+    """Price Distribution histogram, classic style"""
+    print("Fixing Chart 1: Price Distribution...")
+    fig, ax = plt.subplots(figsize=(16, 9))
+
+    price_stats = summary.stats
+
+    # Color gradient for bars, mapped from the left bin edges
+    gradient_bars(ax, n, bins, plt.cm.viridis, bins[:-1], (bins[0], bins[-1]),
+                  edgecolor='#2c3e50', alpha=0.85, linewidth=1.5)
+
+    ax.set_xlabel('Price (AZN)', fontsize=14, fontweight='bold', labelpad=10)
+    ax.set_ylabel('Number of Properties', fontsize=14, fontweight='bold', labelpad=10)
+    ax.set_title('Real Estate Price Distribution in Azerbaijan',
+                 fontsize=18, fontweight='bold', pad=20)
+
+    # Format x-axis
+    ax.xaxis.set_major_formatter(FuncFormatter(format_thousands))
+    ax.yaxis.set_major_formatter(FuncFormatter(format_count))
+
+    # Add statistics lines
+    mean_price = price_stats.mean
+    median_price = price_stats.median
+    ax.axvline(mean_price, color='#e74c3c', linestyle='--', linewidth=3,
+              label=f'Mean: {mean_price:,.0f} AZN', alpha=0.8)
+    ax.axvline(median_price, color='#2ecc71', linestyle='--', linewidth=3,
+              label=f'Median: {median_price:,.0f} AZN', alpha=0.8)
+
+    # Statistics box
+    stats_text = (f'Total Properties: {price_stats.n:,}\n'
+                  f'Mean Price: {mean_price:,.0f} AZN\n'
+                  f'Median Price: {median_price:,.0f} AZN\n'
+                  f'Std Dev: {price_stats.std:,.0f} AZN\n'
+                  f'Min: {price_stats.min:,.0f} AZN\n'
+                  f'Max: {price_stats.max:,.0f} AZN')
+
+    props = dict(boxstyle='round,pad=1', facecolor='#ecf0f1', alpha=0.9, edgecolor='#34495e', linewidth=2)
+    ax.text(0.97, 0.97, stats_text, transform=ax.transAxes, fontsize=11,
+            verticalalignment='top', horizontalalignment='right',
+            bbox=props, family='monospace')
+
+    ax.legend(loc='upper right', fontsize=12, framealpha=0.95, edgecolor='black', fancybox=True)
+    ax.grid(True, alpha=0.4, linestyle='--', linewidth=0.8)
+    ax.set_axisbelow(True)
+
+    # Rotate x-axis labels if needed
+    plt.xticks(rotation=0, ha='center', fontsize=11)
+    plt.yticks(fontsize=11)
+
+    plt.savefig('charts/01_price_distribution.png', dpi=300, bbox_inches='tight',
+                facecolor='white', edgecolor='none',
+                pil_kwargs={'compress_level': 1})
+    plt.close()
+    print("✓ Fixed: charts/01_price_distribution.png\n")
+
+
+# =============================================================================
+# CHART 3: Area Distribution (classic)
+# =============================================================================
+def classic_area_distribution(summary, n, bins):
+    """Area Distribution histogram, classic style"""
+    print("Fixing Chart 3: Area Distribution...")
+    fig, ax = plt.subplots(figsize=(16, 9))
+
+    area_stats = summary.stats
+
+    # Color gradient, mapped from the left bin edges
+    gradient_bars(ax, n, bins, plt.cm.plasma, bins[:-1], (bins[0], bins[-1]),
+                  edgecolor='#6c3483', alpha=0.85, linewidth=1.5)
+
+    ax.set_xlabel('Area (m²)', fontsize=14, fontweight='bold', labelpad=10)
+    ax.set_ylabel('Number of Properties', fontsize=14, fontweight='bold', labelpad=10)
+    ax.set_title('Property Area Distribution', fontsize=18, fontweight='bold', pad=20)
+
+    # Format axes
+    ax.yaxis.set_major_formatter(FuncFormatter(format_count))
+
+    # Statistics
+    mean_area = area_stats.mean
+    median_area = area_stats.median
+    ax.axvline(mean_area, color='#e74c3c', linestyle='--', linewidth=3,
+              label=f'Mean: {mean_area:.1f} m²', alpha=0.8)
+    ax.axvline(median_area, color='#2ecc71', linestyle='--', linewidth=3,
+              label=f'Median: {median_area:.1f} m²', alpha=0.8)
+
+    # Statistics box
+    stats_text = (f'Total Properties: {area_stats.n:,}\n'
+                  f'Mean Area: {mean_area:.1f} m²\n'
+                  f'Median Area: {median_area:.1f} m²\n'
+                  f'Std Dev: {area_stats.std:.1f} m²\n'
+                  f'Min: {area_stats.min:.1f} m²\n'
+                  f'Max: {area_stats.max:.1f} m²')
+
+    props = dict(boxstyle='round,pad=1', facecolor='#e8f8f5', alpha=0.9, edgecolor='#1abc9c', linewidth=2)
+    ax.text(0.97, 0.97, stats_text, transform=ax.transAxes, fontsize=11,
+            verticalalignment='top', horizontalalignment='right',
+            bbox=props, family='monospace')
+
+    ax.legend(loc='upper right', fontsize=12, framealpha=0.95, edgecolor='black', fancybox=True)
+    ax.grid(True, alpha=0.4, linestyle='--', linewidth=0.8)
+    ax.set_axisbelow(True)
+
+    plt.xticks(fontsize=11)
+    plt.yticks(fontsize=11)
+
+    plt.savefig('charts/03_area_distribution.png', dpi=300, bbox_inches='tight',
+                facecolor='white', edgecolor='none',
+                pil_kwargs={'compress_level': 1})
+    plt.close()
+    print("✓ Fixed: charts/03_area_distribution.png\n")
+
+
+# =============================================================================
+# CHART 6: Floor Distribution (classic)
+# =============================================================================
+def classic_floor_distribution(summary, n, bins):
+    """Floor Distribution histogram, classic style"""
+    print("Fixing Chart 6: Floor Distribution...")
+    fig, ax = plt.subplots(figsize=(16, 9))
+
+    floor_stats = summary.stats
+
+    # Color gradient, mapped from the left bin edges
+    gradient_bars(ax, n, bins, plt.cm.autumn, bins[:-1], (bins[0], bins[-1]),
+                  edgecolor='#d35400', alpha=0.85, linewidth=1.5)
+
+    ax.set_xlabel('Floor Number', fontsize=14, fontweight='bold', labelpad=10)
+    ax.set_ylabel('Number of Properties', fontsize=14, fontweight='bold', labelpad=10)
+    ax.set_title('Property Distribution by Floor Level', fontsize=18, fontweight='bold', pad=20)
+
+    # Format y-axis
+    ax.yaxis.set_major_formatter(FuncFormatter(format_count))
+
+    # Statistics
+    mean_floor = floor_stats.mean
+    median_floor = floor_stats.median
+    ax.axvline(mean_floor, color='#e74c3c', linestyle='--', linewidth=3,
+              label=f'Mean: {mean_floor:.1f}', alpha=0.8)
+    ax.axvline(median_floor, color='#2ecc71', linestyle='--', linewidth=3,
+              label=f'Median: {median_floor:.1f}', alpha=0.8)
+
+    # Statistics box
+    stats_text = (f'Total Properties: {floor_stats.n:,}\n'
+                  f'Mean Floor: {mean_floor:.1f}\n'
+                  f'Median Floor: {median_floor:.1f}\n'
+                  f'Std Dev: {floor_stats.std:.1f}\n'
+                  f'Most Common: {summary.mode:.0f}\n'
+                  f'Range: {floor_stats.min:.0f} - {floor_stats.max:.0f}')
+
+    props = dict(boxstyle='round,pad=1', facecolor='#fef5e7', alpha=0.9, edgecolor='#f39c12', linewidth=2)
+    ax.text(0.97, 0.97, stats_text, transform=ax.transAxes, fontsize=11,
+            verticalalignment='top', horizontalalignment='right',
+            bbox=props, family='monospace')
+
+    ax.legend(loc='upper right', fontsize=12, framealpha=0.95, edgecolor='black', fancybox=True)
+    ax.grid(True, alpha=0.4, linestyle='--', linewidth=0.8)
+    ax.set_axisbelow(True)
+
+    plt.xticks(fontsize=11)
+    plt.yticks(fontsize=11)
+
+    plt.savefig('charts/06_floor_distribution.png', dpi=300, bbox_inches='tight',
+                facecolor='white', edgecolor='none',
+                pil_kwargs={'compress_level': 1})
+    plt.close()
+    print("✓ Fixed: charts/06_floor_distribution.png\n")
+
+
+# =============================================================================
+# CHART 11: Building Heights (classic)
+# =============================================================================
+def classic_building_heights(summary, n, bins):
+    """Building Heights histogram, classic style"""
+    print("Fixing Chart 11: Building Heights...")
+    fig, ax = plt.subplots(figsize=(16, 9))
+
+    building_stats = summary.stats
+
+    # Color gradient, mapped from the left bin edges
+    gradient_bars(ax, n, bins, plt.cm.cool, bins[:-1], (bins[0], bins[-1]),
+                  edgecolor='#2c3e50', alpha=0.85, linewidth=1.5)
+
+    ax.set_xlabel('Total Floors in Building', fontsize=14, fontweight='bold', labelpad=10)
+    ax.set_ylabel('Number of Properties', fontsize=14, fontweight='bold', labelpad=10)
+    ax.set_title('Distribution by Building Height (Total Floors)', fontsize=18, fontweight='bold', pad=20)
+
+    # Format y-axis
+    ax.yaxis.set_major_formatter(FuncFormatter(format_count))
+
+    # Statistics
+    mean_floors = building_stats.mean
+    median_floors = building_stats.median
+    ax.axvline(mean_floors, color='#e74c3c', linestyle='--', linewidth=3,
+              label=f'Mean: {mean_floors:.1f} floors', alpha=0.8)
+    ax.axvline(median_floors, color='#2ecc71', linestyle='--', linewidth=3,
+              label=f'Median: {median_floors:.1f} floors', alpha=0.8)
+
+    # Statistics box
+    stats_text = (f'Total Properties: {building_stats.n:,}\n'
+                  f'Mean Floors: {mean_floors:.1f}\n'
+                  f'Median Floors: {median_floors:.1f}\n'
+                  f'Std Dev: {building_stats.std:.1f}\n'
+                  f'Most Common: {summary.mode:.0f}\n'
+                  f'Range: {building_stats.min:.0f} - {building_stats.max:.0f}')
+
+    props = dict(boxstyle='round,pad=1', facecolor='#eaecee', alpha=0.9, edgecolor='#5d6d7e', linewidth=2)
+    ax.text(0.97, 0.97, stats_text, transform=ax.transAxes, fontsize=11,
+            verticalalignment='top', horizontalalignment='right',
+            bbox=props, family='monospace')
+
+    ax.legend(loc='upper right', fontsize=12, framealpha=0.95, edgecolor='black', fancybox=True)
+    ax.grid(True, alpha=0.4, linestyle='--', linewidth=0.8)
+    ax.set_axisbelow(True)
+
+    plt.xticks(fontsize=11)
+    plt.yticks(fontsize=11)
+
+    plt.savefig('charts/11_building_heights.png', dpi=300, bbox_inches='tight',
+                facecolor='white', edgecolor='none',
+                pil_kwargs={'compress_level': 1})
+    plt.close()
+    print("✓ Fixed: charts/11_building_heights.png\n")
+
+
+# =============================================================================
+# CHART 1: Price Distribution (v2)
+# =============================================================================
+def v2_price_distribution(summary, counts, bins):
+    """Price Distribution histogram, v2 style"""
+    print("Generating Chart 1: Price Distribution...")
+
+    fig = plt.figure(figsize=(16, 10))
+    ax = plt.subplot(111)
+
+    price_stats = summary.stats
+
+    # Apply gradient color
+    gradient_bars(ax, counts, bins, plt.cm.Blues, np.linspace(0.4, 0.9, len(counts)), (0, 1),
+                  edgecolor='white', linewidth=2, alpha=0.9)
+
+    # Format axes
+    ax.xaxis.set_major_formatter(FuncFormatter(format_price))
+    ax.yaxis.set_major_formatter(FuncFormatter(format_count))
+    ax.xaxis.set_major_locator(MaxNLocator(nbins=10))
+    ax.yaxis.set_major_locator(MaxNLocator(nbins=8))
+
+    # Statistics
+    mean_price = price_stats.mean
+    median_price = price_stats.median
+
+    ax.axvline(mean_price, color='#e74c3c', linestyle='--', linewidth=3.5,
+              label=f'Mean: {mean_price/1000:.0f}K AZN', alpha=0.9, zorder=5)
+    ax.axvline(median_price, color='#27ae60', linestyle='--', linewidth=3.5,
+              label=f'Median: {median_price/1000:.0f}K AZN', alpha=0.9, zorder=5)
+
+    # Stats box
+    stats = (f'Properties: {price_stats.n:,}\n\n'
+             f'Mean:   {mean_price:>12,.0f} AZN\n'
+             f'Median: {median_price:>12,.0f} AZN\n'
+             f'Std:    {price_stats.std:>12,.0f} AZN\n'
+             f'Min:    {price_stats.min:>12,.0f} AZN\n'
+             f'Max:    {price_stats.max:>12,.0f} AZN')
+
+    # Labels, stats box, legend and grid
+    style_axes(ax, 'Price (AZN)', 'Number of Properties',
+               'Real Estate Price Distribution in Azerbaijan', stats, '#34495e')
+
+    plt.savefig('charts/01_price_distribution.png', dpi=300, bbox_inches='tight',
+                facecolor='white', edgecolor='none',
+                pil_kwargs={'compress_level': 1})
+    plt.close()
+    print("✓ Saved: charts/01_price_distribution.png\n")
+
+
+# =============================================================================
+# CHART 3: Area Distribution (v2)
+# =============================================================================
+def v2_area_distribution(summary, counts, bins):
+    """Area Distribution histogram, v2 style"""
+    print("Generating Chart 3: Area Distribution...")
+
+    fig = plt.figure(figsize=(16, 10))
+    ax = plt.subplot(111)
+
+    area_stats = summary.stats
+
+    # Gradient
+    gradient_bars(ax, counts, bins, plt.cm.Purples, np.linspace(0.4, 0.9, len(counts)), (0, 1),
+                  edgecolor='white', linewidth=2, alpha=0.9)
+
+    # Format axes
+    ax.yaxis.set_major_formatter(FuncFormatter(format_count))
+    ax.xaxis.set_major_locator(MaxNLocator(nbins=10))
+    ax.yaxis.set_major_locator(MaxNLocator(nbins=8))
+
+    # Statistics
+    mean_area = area_stats.mean
+    median_area = area_stats.median
+
+    ax.axvline(mean_area, color='#e74c3c', linestyle='--', linewidth=3.5,
+              label=f'Mean: {mean_area:.0f} m²', alpha=0.9, zorder=5)
+    ax.axvline(median_area, color='#27ae60', linestyle='--', linewidth=3.5,
+              label=f'Median: {median_area:.0f} m²', alpha=0.9, zorder=5)
+
+    # Stats box
+    stats = (f'Properties: {area_stats.n:,}\n\n'
+             f'Mean:   {mean_area:>8.1f} m²\n'
+             f'Median: {median_area:>8.1f} m²\n'
+             f'Std:    {area_stats.std:>8.1f} m²\n'
+             f'Min:    {area_stats.min:>8.1f} m²\n'
+             f'Max:    {area_stats.max:>8.1f} m²')
+
+    # Labels, stats box, legend and grid
+    style_axes(ax, 'Area (m²)', 'Number of Properties',
+               'Property Area Distribution', stats, '#8e44ad')
+
+    plt.savefig('charts/03_area_distribution.png', dpi=300, bbox_inches='tight',
+                facecolor='white', edgecolor='none',
+                pil_kwargs={'compress_level': 1})
+    plt.close()
+    print("✓ Saved: charts/03_area_distribution.png\n")
+
+
+# =============================================================================
+# CHART 6: Floor Distribution (v2)
+# =============================================================================
+def v2_floor_distribution(summary, counts, bins):
+    """Floor Distribution histogram, v2 style"""
+    print("Generating Chart 6: Floor Distribution...")
+
+    fig = plt.figure(figsize=(16, 10))
+    ax = plt.subplot(111)
+
+    floor_stats = summary.stats
+
+    # Gradient
+    gradient_bars(ax, counts, bins, plt.cm.Oranges, np.linspace(0.4, 0.9, len(counts)), (0, 1),
+                  edgecolor='white', linewidth=2, alpha=0.9)
+
+    # Format axes
+    ax.yaxis.set_major_formatter(FuncFormatter(format_count))
+    ax.xaxis.set_major_locator(MaxNLocator(nbins=12))
+    ax.yaxis.set_major_locator(MaxNLocator(nbins=8))
+
+    # Statistics
+    mean_floor = floor_stats.mean
+    median_floor = floor_stats.median
+
+    ax.axvline(mean_floor, color='#e74c3c', linestyle='--', linewidth=3.5,
+              label=f'Mean: {mean_floor:.1f}', alpha=0.9, zorder=5)
+    ax.axvline(median_floor, color='#27ae60', linestyle='--', linewidth=3.5,
+              label=f'Median: {median_floor:.1f}', alpha=0.9, zorder=5)
+
+    # Stats box
+    mode_floor = summary.mode
+    stats = (f'Properties: {floor_stats.n:,}\n\n'
+             f'Mean:   {mean_floor:>6.1f}\n'
+             f'Median: {median_floor:>6.1f}\n'
+             f'Mode:   {mode_floor:>6.0f}\n'
+             f'Std:    {floor_stats.std:>6.1f}\n'
+             f'Range:  {floor_stats.min:.0f} - {floor_stats.max:.0f}')
+
+    # Labels, stats box, legend and grid
+    style_axes(ax, 'Floor Number', 'Number of Properties',
+               'Property Distribution by Floor Level', stats, '#d35400')
+
+    plt.savefig('charts/06_floor_distribution.png', dpi=300, bbox_inches='tight',
+                facecolor='white', edgecolor='none',
+                pil_kwargs={'compress_level': 1})
+    plt.close()
+    print("✓ Saved: charts/06_floor_distribution.png\n")
+
+
+# =============================================================================
+# CHART 11: Building Heights (v2)
+# =============================================================================
+def v2_building_heights(summary, counts, bins):
+    """Building Heights histogram, v2 style"""
+    print("Generating Chart 11: Building Heights...")
+
+    fig = plt.figure(figsize=(16, 10))
+    ax = plt.subplot(111)
+
+    building_stats = summary.stats
+
+    # Gradient
+    gradient_bars(ax, counts, bins, plt.cm.Greys, np.linspace(0.4, 0.9, len(counts)), (0, 1),
+                  edgecolor='white', linewidth=2, alpha=0.9)
+
+    # Format axes
+    ax.yaxis.set_major_formatter(FuncFormatter(format_count))
+    ax.xaxis.set_major_locator(MaxNLocator(nbins=10))
+    ax.yaxis.set_major_locator(MaxNLocator(nbins=8))
+
+    # Statistics
+    mean_floors = building_stats.mean
+    median_floors = building_stats.median
+
+    ax.axvline(mean_floors, color='#e74c3c', linestyle='--', linewidth=3.5,
+              label=f'Mean: {mean_floors:.1f} floors', alpha=0.9, zorder=5)
+    ax.axvline(median_floors, color='#27ae60', linestyle='--', linewidth=3.5,
+              label=f'Median: {median_floors:.1f} floors', alpha=0.9, zorder=5)
+
+    # Stats box
+    mode_floors = summary.mode
+    stats = (f'Properties: {building_stats.n:,}\n\n'
+             f'Mean:   {mean_floors:>6.1f} floors\n'
+             f'Median: {median_floors:>6.1f} floors\n'
+             f'Mode:   {mode_floors:>6.0f} floors\n'
+             f'Std:    {building_stats.std:>6.1f} floors\n'
+             f'Range:  {building_stats.min:.0f} - {building_stats.max:.0f}')
+
+    # Labels, stats box, legend and grid
+    style_axes(ax, 'Total Floors in Building', 'Number of Properties',
+               'Distribution by Building Height', stats, '#2c3e50')
+
+    plt.savefig('charts/11_building_heights.png', dpi=300, bbox_inches='tight',
+                facecolor='white', edgecolor='none',
+                pil_kwargs={'compress_level': 1})
+    plt.close()
+    print("✓ Saved: charts/11_building_heights.png\n")
+
+
+# Charts per variant: (draw function, series, bin count)
+CHARTS = {
+    'classic': [
+        (classic_price_distribution, 'price', 40),
+        (classic_area_distribution, 'area', 50),
+        (classic_floor_distribution, 'floor', 25),
+        (classic_building_heights, 'floors', 30),
+    ],
+    'v2': [
+        (v2_price_distribution, 'price', 35),
+        (v2_area_distribution, 'area', 40),
+        (v2_floor_distribution, 'floor', 25),
+        (v2_building_heights, 'floors', 30),
+    ],
+}
+
+
+def render(task):
+    """Pool worker: draw one chart from its precomputed summary"""
+    variant, chart, summary, bins = task
+    style, rc = STYLES[variant]
+    with plt.style.context(style), plt.rc_context(rc):
+        chart(summary, *summary.histograms[bins])
+
+
+if __name__ == '__main__':
+    variant = sys.argv[1] if len(sys.argv) > 1 else 'v2'
+    if variant not in CHARTS:
+        sys.exit(f"Unknown variant '{variant}', expected one of: {', '.join(CHARTS)}")
+
+    df_clean = load_clean()
+    print(f"Clean data: {len(df_clean):,} records\n")
+
+    # Summaries are small, so the workers get those instead of the DataFrame
+    summaries = summarize(df_clean, CHARTS[variant])
+    tasks = [(variant, chart, summaries[series], bins) for chart, series, bins in CHARTS[variant]]
+
+    # The charts are independent, so render them in parallel
+    with Pool(min(len(tasks), os.cpu_count() or 1)) as pool:
+        pool.map(render, tasks)
+
+    print("="*80)
+    print(f"ALL CHARTS REGENERATED ({variant})")
+    print("="*80)
+    print("\nCharts:")
+    print("  ✓ 01_price_distribution.png")
+    print("  ✓ 03_area_distribution.png")
+    print("  ✓ 06_floor_distribution.png")
+    print("  ✓ 11_building_heights.png")
+    print("\n" + "="*80)
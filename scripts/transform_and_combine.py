@@ -1,7 +1,10 @@
+import os
+import re
+from multiprocessing import Pool
 import pandas as pd
 import numpy as np
-from datetime import datetime
 import warnings
+from _sources import SCRAPED_AT, read_csv, read_excel
 warnings.filterwarnings('ignore')
 
 # Define the baseline schema (from bina_sale_20251117_213934.csv)
@@ -18,62 +21,132 @@ def create_empty_baseline():
     df = pd.DataFrame(columns=BASELINE_COLUMNS)
     return df
 
+def baseline_frame(data):
+    """Build a transform's result in one constructor call: the baseline columns, then any extras"""
+    extras = [col for col in data if col not in BASELINE_COLUMNS]
+    # Without any mapped source column there are no rows, as when scalars
+    # were assigned to the empty baseline
+    index = pd.RangeIndex(0) if all(np.ndim(value) == 0 for value in data.values()) else None
+    return pd.DataFrame(data, index=index, columns=BASELINE_COLUMNS + extras)
+
+# Source columns each fixed-layout transform maps; the rest are never parsed
+IPOTEKA_COLUMNS = ['announcement_id', 'area', 'flat', 'baxis_sayi', 'room_count',
+                   'document_type', 'repair_type', 'update_date', 'phone_cleaned']
+BINALAR_COLUMNS = ['id', 'area', 'rooms', 'floor', 'price_raw', 'address', 'url', 'phone']
+YENIEMLAK_COLUMNS = ['link', 'phone_number']
+MYHOME_COLUMNS = ['id', 'area', 'room_count', 'floor', 'floor_count', 'city', 'region', 'address',
+                  'price', 'is_repaired', 'is_vip', 'is_premium', 'credit_possible',
+                  'formatted_date', 'phone_number', 'lat', 'lng']
+UNVAN_COLUMNS = ['id', 'area', 'room_count', 'price', 'address', 'address_2', 'owner',
+                 'date', 'link', 'phone']
+MULK_COLUMNS = ['listing_id', 'area_numeric', 'rooms_numeric', 'current_floor', 'total_floors',
+                'price_numeric', 'location_district', 'full_address', 'deed_available',
+                'listing_date', 'url', 'image_count', 'scraped_at', 'contact_phone']
+
+# Separator characters dropped from phone numbers, removed in a single translate pass
+PHONE_SEPARATORS = str.maketrans('', '', ' -()')
+
 def standardize_phone(phone):
     """Standardize phone number format"""
     if pd.isna(phone):
         return None
-    phone_str = str(phone).replace(' ', '').replace('-', '').replace('(', '').replace(')', '')
-    return phone_str
+    return str(phone).translate(PHONE_SEPARATORS)
+
+def parse_number(values, *remove):
+    """Vectorized pd.to_numeric(str(x).replace(...).strip()) over a column, NaN where unparsable"""
+    # Columns read as numbers have nothing to strip
+    if pd.api.types.is_numeric_dtype(values) and not pd.api.types.is_bool_dtype(values):
+        return values
+    text = values.astype(str)
+    for token in remove:
+        text = text.str.replace(token, '', regex=False)
+    return pd.to_numeric(text.str.strip(), errors='coerce')
+
+# Currency and thousands separators stripped from price text in one regex pass
+PRICE_NOISE = re.compile('AZN|,')
+
+def parse_price(values):
+    """Whole-AZN prices from text such as '120,000 AZN', 0 where unparsable"""
+    text = values.astype(str).str.replace(PRICE_NOISE, '', regex=True).str.strip()
+    return pd.to_numeric(text, errors='coerce').fillna(0).astype(int)
+
+def parse_leading_number(values, sep=None):
+    """Vectorized pd.to_numeric(str(x).split(sep)[0]) over a column, NaN where unparsable"""
+    return pd.to_numeric(values.astype(str).str.split(sep, n=1).str[0], errors='coerce')
+
+# Column-name substrings the generic transforms look for: (substring, baseline column, numeric)
+COLUMN_RULES = [
+    ('area', 'area_value', True),
+    ('price', 'price_value', True),
+    ('room', 'rooms', True),
+]
+URL_RULES = [('url', 'url', False)]
+
+def map_columns_by_name(df, rules):
+    """Result columns taken from the df columns whose lowercased names contain each rule's substring"""
+    # Each column counts for its first matching rule; when several columns
+    # match a rule the last one wins, as with assigning them in turn
+    sources = {}
+    for col in df.columns:
+        name = col.lower()
+        for substring, target, numeric in rules:
+            if substring in name:
+                sources[target] = (col, numeric)
+                break
+
+    return {
+        target: pd.to_numeric(df[col], errors='coerce') if numeric else df[col]
+        for target, (col, numeric) in sources.items()
+    }
 
 def transform_bina_sale(file_path):
     """Transform bina_sale dataset (already in baseline format)"""
     print(f"Loading {file_path}...")
-    df = pd.read_csv(file_path)
+    df = read_csv(file_path)
     df['source_dataset'] = 'bina_sale'
     return df
 
 def transform_ipoteka_xlsx(file_path):
     """Transform ipotekaAz.xlsx to baseline format"""
     print(f"Loading {file_path}...")
-    df = pd.read_excel(file_path)
-
-    result = create_empty_baseline()
-    result['id'] = df['announcement_id']
-    result['area_value'] = df['area'].apply(lambda x: pd.to_numeric(str(x).replace(' m²', '').replace(',', ''), errors='coerce') if pd.notna(x) else np.nan)
-    result['area_units'] = 'm²'
-    result['leased'] = False
-    result['floor'] = df['flat'].apply(lambda x: pd.to_numeric(str(x).split('/')[0] if '/' in str(x) else x, errors='coerce'))
-    result['floors'] = df['baxis_sayi']
-    result['rooms'] = df['room_count']
-    result['city_name'] = df['area']
-    result['price_value'] = 0
-    result['price_currency'] = 'AZN'
-    result['has_mortgage'] = False
-    result['has_bill_of_sale'] = df['document_type'].notna()
-    result['has_repair'] = df['repair_type'].notna()
-    result['updated_at'] = df['update_date']
-    result['url'] = 'https://ipoteka.az/elan/' + df['announcement_id'].astype(str)
-    result['scraped_at'] = datetime.now().isoformat()
-    result['source_dataset'] = 'ipotekaAz'
-    result['contact_phone'] = df['phone_cleaned']
-
-    return result
+    df = read_excel(file_path, IPOTEKA_COLUMNS)
+
+    return baseline_frame({
+        'id': df['announcement_id'],
+        'area_value': parse_number(df['area'], ' m²', ','),
+        'area_units': 'm²',
+        'leased': False,
+        'floor': parse_leading_number(df['flat'], '/'),
+        'floors': df['baxis_sayi'],
+        'rooms': df['room_count'],
+        'city_name': df['area'],
+        'price_value': 0,
+        'price_currency': 'AZN',
+        'has_mortgage': False,
+        'has_bill_of_sale': df['document_type'].notna(),
+        'has_repair': df['repair_type'].notna(),
+        'updated_at': df['update_date'],
+        'url': 'https://ipoteka.az/elan/' + df['announcement_id'].astype(str),
+        'scraped_at': SCRAPED_AT,
+        'source_dataset': 'ipotekaAz',
+        'contact_phone': df['phone_cleaned'],
+    })
 
 def transform_ipoteka_csv(file_path):
     """Transform ipotekaAz.csv to baseline format"""
     print(f"Loading {file_path}...")
     try:
-        df = pd.read_csv(file_path)
+        df = read_csv(file_path)
         # Similar transformation as xlsx version
-        result = create_empty_baseline()
+        data = {}
 
         # Map common fields if they exist
         if 'announcement_id' in df.columns:
-            result['id'] = df['announcement_id']
+            data['id'] = df['announcement_id']
 
-        result['source_dataset'] = 'ipotekaAz_csv'
-        result['scraped_at'] = datetime.now().isoformat()
-        return result
+        data['source_dataset'] = 'ipotekaAz_csv'
+        data['scraped_at'] = SCRAPED_AT
+        return baseline_frame(data)
     except Exception as e:
         print(f"Error processing {file_path}: {e}")
         return create_empty_baseline()
@@ -81,49 +154,47 @@ def transform_ipoteka_csv(file_path):
 def transform_binalar_listings(file_path):
     """Transform binalar_listings.csv to baseline format"""
     print(f"Loading {file_path}...")
-    df = pd.read_csv(file_path)
-
-    result = create_empty_baseline()
-    result['id'] = df['id']
-    result['area_value'] = df['area']
-    result['area_units'] = 'm²'
-    result['rooms'] = df['rooms']
-    result['floor'] = df['floor'].apply(lambda x: pd.to_numeric(str(x).split('/')[0] if '/' in str(x) else x, errors='coerce'))
-    result['price_value'] = df['price_raw'].fillna(0).astype(int)
-    result['price_currency'] = 'AZN'
-    result['location_name'] = df['address']
-    result['url'] = df['url']
-    result['scraped_at'] = datetime.now().isoformat()
-    result['source_dataset'] = 'binalar_listings'
-    result['contact_phone'] = df['phone']
-
-    return result
+    df = read_csv(file_path, BINALAR_COLUMNS)
+
+    return baseline_frame({
+        'id': df['id'],
+        'area_value': df['area'],
+        'area_units': 'm²',
+        'rooms': df['rooms'],
+        'floor': parse_leading_number(df['floor'], '/'),
+        'price_value': df['price_raw'].fillna(0).astype(int),
+        'price_currency': 'AZN',
+        'location_name': df['address'],
+        'url': df['url'],
+        'scraped_at': SCRAPED_AT,
+        'source_dataset': 'binalar_listings',
+        'contact_phone': df['phone'],
+    })
 
 def transform_yeniemlak_xlsx(file_path):
     """Transform yeniemlak.xlsx to baseline format"""
     print(f"Loading {file_path}...")
-    df = pd.read_excel(file_path)
+    df = read_excel(file_path, YENIEMLAK_COLUMNS)
 
-    result = create_empty_baseline()
-    # Extract ID from link if possible
-    result['id'] = range(len(df))
-    result['url'] = 'https://' + df['link'].astype(str)
-    result['scraped_at'] = datetime.now().isoformat()
-    result['source_dataset'] = 'yeniemlak'
-    result['contact_phone'] = df['phone_number']
-
-    return result
+    return baseline_frame({
+        # Extract ID from link if possible
+        'id': np.arange(len(df), dtype=np.int32),
+        'url': 'https://' + df['link'].astype(str),
+        'scraped_at': SCRAPED_AT,
+        'source_dataset': 'yeniemlak',
+        'contact_phone': df['phone_number'],
+    })
 
 def transform_yeniemlak_csv(file_path):
     """Transform yeniemlakAz.csv to baseline format"""
     print(f"Loading {file_path}...")
     try:
-        df = pd.read_csv(file_path)
-        result = create_empty_baseline()
-        result['id'] = range(len(df))
-        result['source_dataset'] = 'yeniemlakAz_csv'
-        result['scraped_at'] = datetime.now().isoformat()
-        return result
+        df = read_csv(file_path)
+        return baseline_frame({
+            'id': np.arange(len(df), dtype=np.int32),
+            'source_dataset': 'yeniemlakAz_csv',
+            'scraped_at': SCRAPED_AT,
+        })
     except Exception as e:
         print(f"Error processing {file_path}: {e}")
         return create_empty_baseline()
@@ -131,100 +202,100 @@ def transform_yeniemlak_csv(file_path):
 def transform_myhome_listings(file_path):
     """Transform myhome_listings to baseline format"""
     print(f"Loading {file_path}...")
-    df = pd.read_csv(file_path)
-
-    result = create_empty_baseline()
-    result['id'] = df['id']
-    result['area_value'] = df['area']
-    result['area_units'] = 'm²'
-    result['rooms'] = df['room_count']
-    result['floor'] = df['floor']
-    result['floors'] = df['floor_count']
-    result['city_id'] = df['city']
-    result['city_name'] = df['city']
-    result['location_name'] = df['region']
-    result['location_full_name'] = df['address']
-    result['price_value'] = df['price'].apply(lambda x: pd.to_numeric(str(x).replace('AZN', '').replace(',', '').strip(), errors='coerce')).fillna(0).astype(int)
-    result['price_currency'] = 'AZN'
-    result['has_repair'] = df['is_repaired'].fillna(0) > 0
-    result['vipped'] = df['is_vip'] == 1
-    result['featured'] = df['is_premium'] == 1
-    result['has_mortgage'] = df['credit_possible'] == 1
-    result['updated_at'] = df['formatted_date']
-    result['scraped_at'] = datetime.now().isoformat()
-    result['source_dataset'] = 'myhome'
-    result['contact_phone'] = df['phone_number']
-    result['latitude'] = df['lat']
-    result['longitude'] = df['lng']
-
-    return result
+    df = read_csv(file_path, MYHOME_COLUMNS)
+    # The three 0/1 flags compared in one pass
+    flags = df[['is_vip', 'is_premium', 'credit_possible']].to_numpy() == 1
+
+    return baseline_frame({
+        'id': df['id'],
+        'area_value': df['area'],
+        'area_units': 'm²',
+        'rooms': df['room_count'],
+        'floor': df['floor'],
+        'floors': df['floor_count'],
+        'city_id': df['city'],
+        'city_name': df['city'],
+        'location_name': df['region'],
+        'location_full_name': df['address'],
+        'price_value': parse_price(df['price']),
+        'price_currency': 'AZN',
+        'has_repair': df['is_repaired'].fillna(0) > 0,
+        'vipped': flags[:, 0],
+        'featured': flags[:, 1],
+        'has_mortgage': flags[:, 2],
+        'updated_at': df['formatted_date'],
+        'scraped_at': SCRAPED_AT,
+        'source_dataset': 'myhome',
+        'contact_phone': df['phone_number'],
+        'latitude': df['lat'],
+        'longitude': df['lng'],
+    })
 
 def transform_unvan_xlsx(file_path):
     """Transform unvan.xlsx to baseline format"""
     print(f"Loading {file_path}...")
-    df = pd.read_excel(file_path)
-
-    result = create_empty_baseline()
-    result['id'] = df['id']
-    result['area_value'] = df['area'].apply(lambda x: pd.to_numeric(str(x).replace(' m²', '').replace('m²', '').strip(), errors='coerce'))
-    result['area_units'] = 'm²'
-    result['rooms'] = df['room_count'].apply(lambda x: pd.to_numeric(str(x).split()[0] if pd.notna(x) else np.nan, errors='coerce'))
-    result['price_value'] = df['price'].apply(lambda x: pd.to_numeric(str(x).replace('AZN', '').replace(',', '').strip(), errors='coerce')).fillna(0).astype(int)
-    result['price_currency'] = 'AZN'
-    result['location_name'] = df['address']
-    result['location_full_name'] = df['address_2']
-    result['company_name'] = df['owner']
-    result['updated_at'] = df['date']
-    result['url'] = df['link']
-    result['scraped_at'] = datetime.now().isoformat()
-    result['source_dataset'] = 'unvan'
-    result['contact_phone'] = df['phone']
-
-    return result
+    df = read_excel(file_path, UNVAN_COLUMNS)
+
+    return baseline_frame({
+        'id': df['id'],
+        'area_value': parse_number(df['area'], ' m²', 'm²'),
+        'area_units': 'm²',
+        'rooms': parse_leading_number(df['room_count']),
+        'price_value': parse_price(df['price']),
+        'price_currency': 'AZN',
+        'location_name': df['address'],
+        'location_full_name': df['address_2'],
+        'company_name': df['owner'],
+        'updated_at': df['date'],
+        'url': df['link'],
+        'scraped_at': SCRAPED_AT,
+        'source_dataset': 'unvan',
+        'contact_phone': df['phone'],
+    })
 
 def transform_mulk_data(file_path):
     """Transform mulk_data to baseline format"""
     print(f"Loading {file_path}...")
-    df = pd.read_csv(file_path)
-
-    result = create_empty_baseline()
-    result['id'] = df['listing_id']
-    result['area_value'] = df['area_numeric']
-    result['area_units'] = 'm²'
-    result['rooms'] = df['rooms_numeric']
-    result['floor'] = df['current_floor']
-    result['floors'] = df['total_floors']
-    result['price_value'] = df['price_numeric']
-    result['price_currency'] = 'AZN'
-    result['location_name'] = df['location_district']
-    result['location_full_name'] = df['full_address']
-    result['has_bill_of_sale'] = df['deed_available'] == 'Yes'
-    result['updated_at'] = df['listing_date']
-    result['url'] = df['url']
-    result['photos_count'] = df['image_count']
-    result['scraped_at'] = df['scraped_at']
-    result['source_dataset'] = 'mulk'
-    result['contact_phone'] = df['contact_phone']
-
-    return result
+    df = read_csv(file_path, MULK_COLUMNS)
+
+    return baseline_frame({
+        'id': df['listing_id'],
+        'area_value': df['area_numeric'],
+        'area_units': 'm²',
+        'rooms': df['rooms_numeric'],
+        'floor': df['current_floor'],
+        'floors': df['total_floors'],
+        'price_value': df['price_numeric'],
+        'price_currency': 'AZN',
+        'location_name': df['location_district'],
+        'location_full_name': df['full_address'],
+        'has_bill_of_sale': df['deed_available'] == 'Yes',
+        'updated_at': df['listing_date'],
+        'url': df['url'],
+        'photos_count': df['image_count'],
+        'scraped_at': df['scraped_at'],
+        'source_dataset': 'mulk',
+        'contact_phone': df['contact_phone'],
+    })
 
 def transform_emlak_xlsx(file_path):
     """Transform emlakAz.xlsx to baseline format"""
     print(f"Loading {file_path}...")
     try:
-        df = pd.read_excel(file_path)
-        result = create_empty_baseline()
-        result['id'] = range(len(df))
-        result['source_dataset'] = 'emlakAz'
-        result['scraped_at'] = datetime.now().isoformat()
+        df = read_excel(file_path)
+        data = {
+            'id': np.arange(len(df), dtype=np.int32),
+            'source_dataset': 'emlakAz',
+            'scraped_at': SCRAPED_AT,
+        }
 
         # Map fields if they exist
         if 'area' in df.columns:
-            result['area_value'] = df['area']
+            data['area_value'] = df['area']
         if 'price' in df.columns:
-            result['price_value'] = df['price']
+            data['price_value'] = df['price']
 
-        return result
+        return baseline_frame(data)
     except Exception as e:
         print(f"Error processing {file_path}: {e}")
         return create_empty_baseline()
@@ -233,22 +304,23 @@ def transform_ofis_listings(file_path):
     """Transform ofis_listings.csv to baseline format"""
     print(f"Loading {file_path}...")
     try:
-        df = pd.read_csv(file_path)
-        result = create_empty_baseline()
-        result['id'] = range(len(df))
-        result['source_dataset'] = 'ofis_listings'
-        result['scraped_at'] = datetime.now().isoformat()
-        result['is_business'] = True
+        df = read_csv(file_path)
+        data = {
+            'id': np.arange(len(df), dtype=np.int32),
+            'source_dataset': 'ofis_listings',
+            'scraped_at': SCRAPED_AT,
+            'is_business': True,
+        }
 
         # Map common fields
         if 'area' in df.columns:
-            result['area_value'] = df['area']
+            data['area_value'] = df['area']
         if 'price' in df.columns:
-            result['price_value'] = df['price']
+            data['price_value'] = df['price']
         if 'url' in df.columns:
-            result['url'] = df['url']
+            data['url'] = df['url']
 
-        return result
+        return baseline_frame(data)
     except Exception as e:
         print(f"Error processing {file_path}: {e}")
         return create_empty_baseline()
@@ -257,22 +329,14 @@ def transform_real_estate_feb(file_path):
     """Transform real_estate_data_25_feb_2025.csv to baseline format"""
     print(f"Loading {file_path}...")
     try:
-        df = pd.read_csv(file_path)
-        result = create_empty_baseline()
-        result['id'] = range(len(df))
-        result['source_dataset'] = 'real_estate_feb_2025'
-        result['scraped_at'] = '2025-02-25'
-
-        # Map fields based on common column names
-        for col in df.columns:
-            if 'area' in col.lower():
-                result['area_value'] = pd.to_numeric(df[col], errors='coerce')
-            elif 'price' in col.lower():
-                result['price_value'] = pd.to_numeric(df[col], errors='coerce')
-            elif 'room' in col.lower():
-                result['rooms'] = pd.to_numeric(df[col], errors='coerce')
-
-        return result
+        df = read_csv(file_path)
+        return baseline_frame({
+            'id': np.arange(len(df), dtype=np.int32),
+            'source_dataset': 'real_estate_feb_2025',
+            'scraped_at': '2025-02-25',
+            # Map fields based on common column names
+            **map_columns_by_name(df, COLUMN_RULES),
+        })
     except Exception as e:
         print(f"Error processing {file_path}: {e}")
         return create_empty_baseline()
@@ -281,23 +345,15 @@ def transform_villa_az(file_path):
     """Transform villa_az_complete_dataset.csv to baseline format"""
     print(f"Loading {file_path}...")
     try:
-        df = pd.read_csv(file_path)
-        result = create_empty_baseline()
-        result['id'] = range(len(df))
-        result['source_dataset'] = 'villa_az'
-        result['scraped_at'] = datetime.now().isoformat()
-        result['property_type'] = 'villa'
-
-        # Map common fields
-        for col in df.columns:
-            if 'area' in col.lower():
-                result['area_value'] = pd.to_numeric(df[col], errors='coerce')
-            elif 'price' in col.lower():
-                result['price_value'] = pd.to_numeric(df[col], errors='coerce')
-            elif 'room' in col.lower():
-                result['rooms'] = pd.to_numeric(df[col], errors='coerce')
-
-        return result
+        df = read_csv(file_path)
+        return baseline_frame({
+            'id': np.arange(len(df), dtype=np.int32),
+            'source_dataset': 'villa_az',
+            'scraped_at': SCRAPED_AT,
+            'property_type': 'villa',
+            # Map common fields
+            **map_columns_by_name(df, COLUMN_RULES),
+        })
     except Exception as e:
         print(f"Error processing {file_path}: {e}")
         return create_empty_baseline()
@@ -306,24 +362,14 @@ def transform_evv_az(file_path):
     """Transform evv_az_listings.csv to baseline format"""
     print(f"Loading {file_path}...")
     try:
-        df = pd.read_csv(file_path)
-        result = create_empty_baseline()
-        result['id'] = range(len(df))
-        result['source_dataset'] = 'evv_az'
-        result['scraped_at'] = datetime.now().isoformat()
-
-        # Map common fields
-        for col in df.columns:
-            if 'area' in col.lower():
-                result['area_value'] = pd.to_numeric(df[col], errors='coerce')
-            elif 'price' in col.lower():
-                result['price_value'] = pd.to_numeric(df[col], errors='coerce')
-            elif 'room' in col.lower():
-                result['rooms'] = pd.to_numeric(df[col], errors='coerce')
-            elif 'url' in col.lower():
-                result['url'] = df[col]
-
-        return result
+        df = read_csv(file_path)
+        return baseline_frame({
+            'id': np.arange(len(df), dtype=np.int32),
+            'source_dataset': 'evv_az',
+            'scraped_at': SCRAPED_AT,
+            # Map common fields
+            **map_columns_by_name(df, COLUMN_RULES + URL_RULES),
+        })
     except Exception as e:
         print(f"Error processing {file_path}: {e}")
         return create_empty_baseline()
@@ -332,22 +378,14 @@ def transform_binam_listings(file_path):
     """Transform binam_listings to baseline format"""
     print(f"Loading {file_path}...")
     try:
-        df = pd.read_csv(file_path)
-        result = create_empty_baseline()
-        result['id'] = range(len(df))
-        result['source_dataset'] = 'binam_listings'
-        result['scraped_at'] = datetime.now().isoformat()
-
-        # Map common fields
-        for col in df.columns:
-            if 'area' in col.lower():
-                result['area_value'] = pd.to_numeric(df[col], errors='coerce')
-            elif 'price' in col.lower():
-                result['price_value'] = pd.to_numeric(df[col], errors='coerce')
-            elif 'room' in col.lower():
-                result['rooms'] = pd.to_numeric(df[col], errors='coerce')
-
-        return result
+        df = read_csv(file_path)
+        return baseline_frame({
+            'id': np.arange(len(df), dtype=np.int32),
+            'source_dataset': 'binam_listings',
+            'scraped_at': SCRAPED_AT,
+            # Map common fields
+            **map_columns_by_name(df, COLUMN_RULES),
+        })
     except Exception as e:
         print(f"Error processing {file_path}: {e}")
         return create_empty_baseline()
@@ -356,70 +394,82 @@ def transform_bina_xlsx(file_path):
     """Transform bina.xlsx to baseline format"""
     print(f"Loading {file_path}...")
     try:
-        df = pd.read_excel(file_path)
-        result = create_empty_baseline()
-        result['id'] = range(len(df))
-        result['source_dataset'] = 'bina_xlsx'
-        result['scraped_at'] = datetime.now().isoformat()
-
-        # Map common fields
-        for col in df.columns:
-            if 'area' in col.lower():
-                result['area_value'] = pd.to_numeric(df[col], errors='coerce')
-            elif 'price' in col.lower():
-                result['price_value'] = pd.to_numeric(df[col], errors='coerce')
-            elif 'room' in col.lower():
-                result['rooms'] = pd.to_numeric(df[col], errors='coerce')
-
-        return result
+        df = read_excel(file_path)
+        return baseline_frame({
+            'id': np.arange(len(df), dtype=np.int32),
+            'source_dataset': 'bina_xlsx',
+            'scraped_at': SCRAPED_AT,
+            # Map common fields
+            **map_columns_by_name(df, COLUMN_RULES),
+        })
     except Exception as e:
         print(f"Error processing {file_path}: {e}")
         return create_empty_baseline()
 
+# Each source file and the transform that maps it to the baseline schema
+SOURCES = [
+    (transform_bina_sale, 'data/bina_sale_20251117_213934.csv'),
+    (transform_ipoteka_xlsx, 'data/ipotekaAz.xlsx'),
+    (transform_ipoteka_csv, 'data/ipotekaAz.csv'),
+    (transform_binalar_listings, 'data/binalar_listings.csv'),
+    (transform_yeniemlak_xlsx, 'data/yeniemlak.xlsx'),
+    (transform_yeniemlak_csv, 'data/yeniemlakAz.csv'),
+    (transform_myhome_listings, 'data/myhome_listings_20250929_003143.csv'),
+    (transform_unvan_xlsx, 'data/unvan.xlsx'),
+    (transform_mulk_data, 'data/mulk_data_20250929_143644.csv'),
+    (transform_emlak_xlsx, 'data/emlakAz.xlsx'),
+    (transform_ofis_listings, 'data/ofis_listings.csv'),
+    (transform_real_estate_feb, 'data/real_estate_data_25_feb_2025.csv'),
+    (transform_villa_az, 'data/villa_az_complete_dataset.csv'),
+    (transform_evv_az, 'data/evv_az_listings.csv'),
+    (transform_binam_listings, 'data/binam_listings_1758793717.csv'),
+    (transform_bina_xlsx, 'data/bina.xlsx'),
+]
+
+def run_transform(source):
+    """Pool worker: load and transform one source file"""
+    transform, file_path = source
+    return transform(file_path)
+
 def main():
     """Main function to transform and combine all datasets"""
     print("Starting dataset transformation and combination...\n")
 
-    datasets = []
-
-    # Transform each dataset
-    datasets.append(transform_bina_sale('data/bina_sale_20251117_213934.csv'))
-    datasets.append(transform_ipoteka_xlsx('data/ipotekaAz.xlsx'))
-    datasets.append(transform_ipoteka_csv('data/ipotekaAz.csv'))
-    datasets.append(transform_binalar_listings('data/binalar_listings.csv'))
-    datasets.append(transform_yeniemlak_xlsx('data/yeniemlak.xlsx'))
-    datasets.append(transform_yeniemlak_csv('data/yeniemlakAz.csv'))
-    datasets.append(transform_myhome_listings('data/myhome_listings_20250929_003143.csv'))
-    datasets.append(transform_unvan_xlsx('data/unvan.xlsx'))
-    datasets.append(transform_mulk_data('data/mulk_data_20250929_143644.csv'))
-    datasets.append(transform_emlak_xlsx('data/emlakAz.xlsx'))
-    datasets.append(transform_ofis_listings('data/ofis_listings.csv'))
-    datasets.append(transform_real_estate_feb('data/real_estate_data_25_feb_2025.csv'))
-    datasets.append(transform_villa_az('data/villa_az_complete_dataset.csv'))
-    datasets.append(transform_evv_az('data/evv_az_listings.csv'))
-    datasets.append(transform_binam_listings('data/binam_listings_1758793717.csv'))
-    datasets.append(transform_bina_xlsx('data/bina.xlsx'))
-
-    # Combine all datasets
+    # Transform each dataset; the files are independent, so parse them in parallel
+    with Pool(min(len(SOURCES), os.cpu_count() or 1)) as pool:
+        datasets = pool.map(run_transform, SOURCES)
+
+    # Combine all datasets: the column order and dtypes pd.concat would give
+    # come from the empty frames alone, so each dataset is written straight
+    # to the output instead of being copied into one combined frame first
     print("\nCombining all datasets...")
-    combined_df = pd.concat(datasets, ignore_index=True)
+    layout = pd.concat([dataset.iloc[:0] for dataset in datasets], ignore_index=True)
 
-    # Save combined dataset
+    # Save combined dataset, tallying the summary as each dataset goes out
     output_file = 'data/combined_real_estate_dataset.csv'
     print(f"\nSaving combined dataset to {output_file}...")
-    combined_df.to_csv(output_file, index=False)
+    total_rows = 0
+    source_counts = pd.Series(dtype='int64')
+    missing = pd.Series(0, index=layout.columns)
+    with open(output_file, 'w', newline='') as out:
+        for i, dataset in enumerate(datasets):
+            dataset = dataset.reindex(columns=layout.columns).astype(layout.dtypes)
+            dataset.to_csv(out, index=False, header=(i == 0))
+
+            total_rows += len(dataset)
+            source_counts = source_counts.add(dataset['source_dataset'].value_counts(), fill_value=0)
+            missing += dataset.isnull().sum()
 
     # Print summary statistics
     print("\n" + "="*80)
     print("COMBINED DATASET SUMMARY")
     print("="*80)
-    print(f"Total rows: {len(combined_df):,}")
-    print(f"Total columns: {len(combined_df.columns)}")
+    print(f"Total rows: {total_rows:,}")
+    print(f"Total columns: {len(layout.columns)}")
     print(f"\nRows per source:")
-    print(combined_df['source_dataset'].value_counts().to_string())
+    print(source_counts.astype('int64').sort_values(ascending=False, kind='stable').rename('count').to_string())
     print(f"\nMissing values by column:")
-    missing = combined_df.isnull().sum()
-    missing_pct = (missing / len(combined_df) * 100).round(2)
+    missing_pct = (missing / total_rows * 100).round(2)
     missing_df = pd.DataFrame({'Missing': missing, 'Percentage': missing_pct})
     print(missing_df[missing_df['Missing'] > 0].to_string())
 
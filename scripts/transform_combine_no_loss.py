@@ -2,13 +2,20 @@
 """
 Real Estate Dataset Transformation and Combination
 This script transforms all datasets to a common schema while preserving ALL original data
+
+Usage: python transform_combine_no_loss.py [--excel]
 """
 
+import os
+import sys
+from multiprocessing import Pool
 import pandas as pd
 import numpy as np
-from datetime import datetime
+import pyarrow as pa
+import pyarrow.parquet as pq
 import warnings
 import re
+from _sources import EXCEL_MAX_ROWS, SCRAPED_AT, read_csv, read_excel, write_excel
 warnings.filterwarnings('ignore')
 
 # Define the baseline schema columns
@@ -21,521 +28,488 @@ BASELINE_COLUMNS = [
     'source_dataset', 'contact_phone', 'contact_name', 'description', 'latitude', 'longitude'
 ]
 
-def safe_numeric(value, default=np.nan):
-    """Safely convert value to numeric"""
-    if pd.isna(value):
-        return default
-    try:
-        # Remove common non-numeric characters
-        if isinstance(value, str):
-            value = value.replace(',', '').replace(' ', '').replace('m²', '').replace('AZN', '').strip()
-        return pd.to_numeric(value, errors='coerce')
-    except:
-        return default
-
-def extract_number_from_string(s):
-    """Extract first number from string"""
-    if pd.isna(s):
-        return np.nan
-    s = str(s)
-    numbers = re.findall(r'\d+', s)
-    if numbers:
-        return int(numbers[0])
-    return np.nan
-
-def parse_floor(floor_str):
-    """Parse floor string like '5/9' to extract current floor"""
-    if pd.isna(floor_str):
-        return np.nan
-    s = str(floor_str)
-    if '/' in s:
-        parts = s.split('/')
-        return safe_numeric(parts[0])
-    return safe_numeric(s)
-
-def parse_total_floors(floor_str):
-    """Parse floor string like '5/9' to extract total floors"""
-    if pd.isna(floor_str):
-        return np.nan
-    s = str(floor_str)
-    if '/' in s:
-        parts = s.split('/')
-        if len(parts) > 1:
-            return safe_numeric(parts[1])
-    return np.nan
+# Separators and units stripped from numeric text, in this order
+NUMERIC_NOISE = (',', ' ', 'm²', 'AZN')
+
+def parse_number(values, *remove):
+    """Vectorized pd.to_numeric(str(x)) over a column once `remove` and NUMERIC_NOISE are stripped, NaN where unparsable"""
+    # Columns read as numbers have nothing to strip
+    if pd.api.types.is_numeric_dtype(values) and not pd.api.types.is_bool_dtype(values):
+        return values
+    text = values.astype(str)
+    for token in remove + NUMERIC_NOISE:
+        text = text.str.replace(token, '', regex=False)
+    return pd.to_numeric(text.str.strip(), errors='coerce')
+
+# First run of digits in a string, e.g. the 3 in '3 otaqlı'
+FIRST_NUMBER = re.compile(r'(\d+)')
+
+def extract_number(values):
+    """Vectorized first whole number in each string of a column, NaN where there is none"""
+    return pd.to_numeric(values.astype(str).str.extract(FIRST_NUMBER, expand=False), errors='coerce')
+
+def split_floor(values):
+    """Vectorized floor parsing of strings like '5/9': the numbers before and after the first '/'"""
+    # 'floors' is the field between the first and second '/', missing without a '/'
+    parts = values.astype(str).str.extract(r'^([^/]*)(?:/([^/]*))?')
+    return pd.DataFrame({'floor': parse_number(parts[0]), 'floors': parse_number(parts[1])})
+
+def ensure_https(values):
+    """Prefix 'https://' to links without an http(s) scheme; missing links stay missing"""
+    text = values.astype(str)
+    return text.where(text.str.startswith('http', na=True), 'https://' + text)
+
+def notna_flags(df, flags):
+    """Flag columns (flag -> source column) that are True where the source has a value, from one notna() call"""
+    # A flag whose source column is missing is False throughout
+    present = [flag for flag, source in flags.items() if source in df.columns]
+    values = dict(zip(present, df[[flags[flag] for flag in present]].notna().to_numpy().T))
+    return {flag: values.get(flag, False) for flag in flags}
+
+def whole_ids(values):
+    """Ids that are whole numbers as nullable Int64 (read as float only because of gaps); others unchanged"""
+    if isinstance(values, pd.Series) and pd.api.types.is_float_dtype(values):
+        present = values.dropna()
+        if (present == np.floor(present)).all() and np.isfinite(present).all():
+            return values.astype('Int64')
+    return values
 
 def add_prefix_to_columns(df, prefix):
     """Add prefix to all columns in dataframe"""
     return df.add_prefix(f'{prefix}_')
 
-def create_base_df(size):
-    """Create base dataframe with baseline columns"""
-    return pd.DataFrame({col: [np.nan] * size for col in BASELINE_COLUMNS})
-
-def transform_bina_sale(file_path):
-    """Transform bina_sale_20251117_213934.csv (baseline format)"""
-    print(f"Processing: {file_path}")
-    df = pd.read_csv(file_path)
-
-    # Add source
-    df['source_dataset'] = 'bina_sale'
-
-    # Rename columns to match baseline if needed
-    df = df.rename(columns={'area_value': 'area_value', 'price_value': 'price_value'})
-
-    # Keep all original columns with prefix
-    original = add_prefix_to_columns(df.copy(), 'orig')
-
-    # Merge with original columns
-    result = pd.concat([df, original], axis=1)
-
-    print(f"  Rows: {len(result):,}")
-    return result
-
-def transform_ipoteka_xlsx(file_path):
-    """Transform ipotekaAz.xlsx"""
-    print(f"Processing: {file_path}")
-    df = pd.read_excel(file_path)
-
-    # Keep ALL original data
-    original = add_prefix_to_columns(df.copy(), 'orig')
-
-    # Create baseline columns
-    base = create_base_df(len(df))
-    base['id'] = df['announcement_id']
-    base['area_value'] = df['area'].apply(lambda x: safe_numeric(str(x).replace('m²', '')))
-    base['area_units'] = 'm²'
-    base['floor'] = df['flat'].apply(parse_floor)
-    base['floors'] = df['baxis_sayi']
-    base['rooms'] = df['room_count']
-    base['city_name'] = df['area']
-    base['price_value'] = 0
-    base['price_currency'] = 'AZN'
-    base['has_bill_of_sale'] = df['document_type'].notna()
-    base['has_repair'] = df['repair_type'].notna()
-    base['updated_at'] = df['update_date']
-    base['url'] = 'https://ipoteka.az/elan/' + df['announcement_id'].astype(str)
-    base['scraped_at'] = datetime.now().isoformat()
-    base['source_dataset'] = 'ipotekaAz_xlsx'
-    base['contact_phone'] = df.get('phone_cleaned', df.get('phone_number'))
-    base['contact_name'] = df.get('user_name')
-
-    # Merge
-    result = pd.concat([base, original], axis=1)
-    print(f"  Rows: {len(result):,}")
-    return result
-
-def transform_ipoteka_csv(file_path):
-    """Transform ipotekaAz.csv"""
-    print(f"Processing: {file_path}")
-    df = pd.read_csv(file_path)
-
-    original = add_prefix_to_columns(df.copy(), 'orig')
-
-    base = create_base_df(len(df))
-    base['id'] = df['announcement_id']
-    base['area_value'] = df['area'].apply(lambda x: safe_numeric(str(x).replace('m²', '')))
-    base['area_units'] = 'm²'
-    base['floor'] = df['flat'].apply(parse_floor)
-    base['floors'] = df['baxis_sayi']
-    base['rooms'] = df['room_count']
-    base['city_name'] = df['area']
-    base['has_bill_of_sale'] = df['document_type'].notna()
-    base['has_repair'] = df['repair_type'].notna()
-    base['updated_at'] = df['update_date']
-    base['url'] = 'https://ipoteka.az/elan/' + df['announcement_id'].astype(str)
-    base['scraped_at'] = datetime.now().isoformat()
-    base['source_dataset'] = 'ipotekaAz_csv'
-    base['contact_phone'] = df.get('phone_number')
-    base['contact_name'] = df.get('user_name')
-
-    result = pd.concat([base, original], axis=1)
-    print(f"  Rows: {len(result):,}")
-    return result
-
-def transform_binalar_listings(file_path):
-    """Transform binalar_listings.csv"""
+def base_frame(cols, original):
+    """Build the output frame in one call: the mapped columns (unmapped ones NaN, extras last), then the original ones"""
+    extras = [col for col in cols if col not in BASELINE_COLUMNS]
+    # .array keeps each original column's dtype without going through object
+    data = {**cols, **{col: original[col].array for col in original.columns}}
+    return pd.DataFrame(data, index=original.index).reindex(columns=BASELINE_COLUMNS + extras + list(original.columns))
+
+def map_column(df, rule, floors):
+    """One baseline column from a mapping rule, see MAPPINGS ('5/9' floor strings are split once per column in `floors`)"""
+    kind, *args = rule
+    if kind == 'value':
+        return args[0]
+    if kind == 'row_number':
+        return range(len(df))
+    if kind == 'optional':
+        # The first of the named columns present, missing if none is
+        return next((df[name] for name in args if name in df.columns), None)
+    if kind == 'default':
+        name, fallback = args
+        return df[name] if name in df.columns else map_column(df, fallback, floors)
+    if kind == 'if_present':
+        # A rule over a column that may be missing, NaN throughout if it is
+        return map_column(df, args[0], floors) if args[0][1] in df.columns else np.nan
+
+    # The rest take the column named by their first argument
+    values = df[args[0]]
+    if kind == 'column':
+        return values
+    if kind == 'filled':
+        return values.fillna(args[1])
+    if kind == 'equals':
+        return values == args[1]
+    if kind == 'positive':
+        return values.fillna(0) > 0
+    if kind == 'number':
+        return parse_number(values, *args[1:])
+    if kind == 'first_number':
+        return extract_number(values)
+    if kind in ('floor', 'floors'):
+        if args[0] not in floors:
+            floors[args[0]] = split_floor(values)
+        return floors[args[0]][kind]
+    if kind == 'https':
+        return ensure_https(values)
+    if kind == 'prefixed':
+        return args[1] + values.astype(str)
+    raise ValueError(f"Unknown mapping rule: {kind}")
+
+def apply_mapping(df, mapping):
+    """Baseline columns of df from a mapping of baseline column -> rule"""
+    # The 'has_value' flags of a source come from a single notna() call
+    cols = notna_flags(df, {col: rule[1] for col, rule in mapping.items() if rule[0] == 'has_value'})
+    floors = {}
+    for col, rule in mapping.items():
+        if rule[0] != 'has_value':
+            cols[col] = map_column(df, rule, floors)
+    # Ids stay integers, and columns mixing them with other sources' text ids hold ints, not floats
+    cols['id'] = whole_ids(cols['id'])
+    return cols
+
+# Baseline columns of each source as rules (kind, *args) for map_column:
+#   ('value', v)                     the constant v
+#   ('row_number',)                  0, 1, 2, ...
+#   ('column', name)                 the column as is
+#   ('optional', name, ...)          the first of the columns present, missing if none is
+#   ('default', name, rule)          the column, or `rule` if it is missing
+#   ('if_present', rule)             `rule`, or NaN if the column it reads is missing
+#   ('filled', name, v)              the column with missing values set to v
+#   ('equals', name, v)              whether the column equals v
+#   ('positive', name)               whether the column is above 0
+#   ('has_value', name)              whether the column has a value (False if it is missing)
+#   ('number', name, *remove)        parse_number of the column
+#   ('first_number', name)           extract_number of the column
+#   ('floor', name), ('floors', name)  the parts of split_floor of the column
+#   ('https', name)                  ensure_https of the column
+#   ('prefixed', name, prefix)       prefix + the column as text
+# Rules reading a column fail the source when the column is missing, unless noted
+IPOTEKA_XLSX = {
+    'id': ('column', 'announcement_id'),
+    'area_value': ('number', 'area', 'm²'),
+    'area_units': ('value', 'm²'),
+    'floor': ('floor', 'flat'),
+    'floors': ('column', 'baxis_sayi'),
+    'rooms': ('column', 'room_count'),
+    'city_name': ('column', 'area'),
+    'price_value': ('value', 0),
+    'price_currency': ('value', 'AZN'),
+    'has_bill_of_sale': ('has_value', 'document_type'),
+    'has_repair': ('has_value', 'repair_type'),
+    'updated_at': ('column', 'update_date'),
+    'url': ('prefixed', 'announcement_id', 'https://ipoteka.az/elan/'),
+    'scraped_at': ('value', SCRAPED_AT),
+    'source_dataset': ('value', 'ipotekaAz_xlsx'),
+    'contact_phone': ('optional', 'phone_cleaned', 'phone_number'),
+    'contact_name': ('optional', 'user_name'),
+}
+
+IPOTEKA_CSV = {
+    'id': ('column', 'announcement_id'),
+    'area_value': ('number', 'area', 'm²'),
+    'area_units': ('value', 'm²'),
+    'floor': ('floor', 'flat'),
+    'floors': ('column', 'baxis_sayi'),
+    'rooms': ('column', 'room_count'),
+    'city_name': ('column', 'area'),
+    'has_bill_of_sale': ('has_value', 'document_type'),
+    'has_repair': ('has_value', 'repair_type'),
+    'updated_at': ('column', 'update_date'),
+    'url': ('prefixed', 'announcement_id', 'https://ipoteka.az/elan/'),
+    'scraped_at': ('value', SCRAPED_AT),
+    'source_dataset': ('value', 'ipotekaAz_csv'),
+    'contact_phone': ('optional', 'phone_number'),
+    'contact_name': ('optional', 'user_name'),
+}
+
+BINALAR_LISTINGS = {
+    'id': ('column', 'id'),
+    'area_value': ('column', 'area'),
+    'area_units': ('value', 'm²'),
+    'rooms': ('column', 'rooms'),
+    'floor': ('floor', 'floor'),
+    'floors': ('floors', 'floor'),
+    'price_value': ('filled', 'price_raw', 0),
+    'price_currency': ('value', 'AZN'),
+    'location_name': ('column', 'address'),
+    'url': ('column', 'url'),
+    'updated_at': ('column', 'date'),
+    'scraped_at': ('value', SCRAPED_AT),
+    'source_dataset': ('value', 'binalar_listings'),
+    'contact_phone': ('column', 'phone'),
+    'description': ('column', 'description'),
+}
+
+YENIEMLAK_XLSX = {
+    'id': ('row_number',),
+    'url': ('https', 'link'),
+    'scraped_at': ('value', SCRAPED_AT),
+    'source_dataset': ('value', 'yeniemlak_xlsx'),
+    'contact_phone': ('column', 'phone_number'),
+}
+
+YENIEMLAK_CSV = {
+    'id': ('default', 'id', ('row_number',)),
+    'price_value': ('default', 'price', ('value', 0)),
+    'rooms': ('optional', 'room_count'),
+    'area_value': ('optional', 'area'),
+    'area_units': ('value', 'm²'),
+    'floor': ('optional', 'flat', 'floor'),
+    'location_name': ('optional', 'address'),
+    'location_full_name': ('optional', 'address_2'),
+    'url': ('if_present', ('https', 'href')),
+    'updated_at': ('optional', 'date'),
+    'scraped_at': ('value', SCRAPED_AT),
+    'source_dataset': ('value', 'yeniemlakAz_csv'),
+    'contact_phone': ('optional', 'owner_number'),
+    'contact_name': ('optional', 'owner_name'),
+    'description': ('optional', 'description'),
+    'has_bill_of_sale': ('has_value', 'doc_type'),
+}
+
+MYHOME_LISTINGS = {
+    'id': ('column', 'id'),
+    'area_value': ('column', 'area'),
+    'area_units': ('value', 'm²'),
+    'rooms': ('column', 'room_count'),
+    'floor': ('column', 'floor'),
+    'floors': ('column', 'floor_count'),
+    'city_name': ('column', 'city'),
+    'location_name': ('column', 'region'),
+    'location_full_name': ('column', 'address'),
+    'price_value': ('number', 'price', 'AZN'),
+    'price_currency': ('value', 'AZN'),
+    'has_repair': ('positive', 'is_repaired'),
+    'vipped': ('equals', 'is_vip', 1),
+    'featured': ('equals', 'is_premium', 1),
+    'has_mortgage': ('equals', 'credit_possible', 1),
+    'updated_at': ('column', 'formatted_date'),
+    'scraped_at': ('value', SCRAPED_AT),
+    'source_dataset': ('value', 'myhome'),
+    'contact_phone': ('column', 'phone_number'),
+    'latitude': ('column', 'lat'),
+    'longitude': ('column', 'lng'),
+    'description': ('column', 'description'),
+}
+
+UNVAN_XLSX = {
+    'id': ('column', 'id'),
+    'area_value': ('number', 'area'),
+    'area_units': ('value', 'm²'),
+    'rooms': ('first_number', 'room_count'),
+    'price_value': ('number', 'price'),
+    'price_currency': ('value', 'AZN'),
+    'location_name': ('column', 'address'),
+    'location_full_name': ('column', 'address_2'),
+    'company_name': ('column', 'owner'),
+    'updated_at': ('column', 'date'),
+    'url': ('column', 'link'),
+    'scraped_at': ('value', SCRAPED_AT),
+    'source_dataset': ('value', 'unvan'),
+    'contact_phone': ('column', 'phone'),
+    'description': ('optional', 'long_descr', 'short_descr'),
+}
+
+MULK_DATA = {
+    'id': ('column', 'listing_id'),
+    'area_value': ('column', 'area_numeric'),
+    'area_units': ('value', 'm²'),
+    'rooms': ('column', 'rooms_numeric'),
+    'floor': ('column', 'current_floor'),
+    'floors': ('column', 'total_floors'),
+    'price_value': ('column', 'price_numeric'),
+    'price_currency': ('value', 'AZN'),
+    'location_name': ('column', 'location_district'),
+    'location_full_name': ('column', 'full_address'),
+    'has_bill_of_sale': ('equals', 'deed_available', 'Yes'),
+    'updated_at': ('column', 'listing_date'),
+    'url': ('column', 'url'),
+    'photos_count': ('column', 'image_count'),
+    'scraped_at': ('column', 'scraped_at'),
+    'source_dataset': ('value', 'mulk'),
+    'contact_phone': ('column', 'contact_phone'),
+    'contact_name': ('optional', 'contact_person'),
+    'description': ('column', 'description'),
+}
+
+EMLAK_XLSX = {
+    'id': ('column', 'id'),
+    'area_value': ('number', 'area'),
+    'area_units': ('value', 'm²'),
+    'rooms': ('first_number', 'room_count'),
+    'floor': ('floor', 'flat'),
+    'price_value': ('number', 'price'),
+    'price_currency': ('value', 'AZN'),
+    'has_repair': ('has_value', 'repair_type'),
+    'has_bill_of_sale': ('has_value', 'document_type'),
+    'updated_at': ('column', 'date'),
+    'url': ('prefixed', 'href', 'https://emlak.az'),
+    'scraped_at': ('value', SCRAPED_AT),
+    'source_dataset': ('value', 'emlakAz'),
+    'contact_phone': ('optional', 'phone_cleaned', 'phone_numbers'),
+    'contact_name': ('optional', 'seller_name'),
+    'description': ('column', 'description'),
+}
+
+OFIS_LISTINGS = {
+    'id': ('column', 'listing_id'),
+    'area_value': ('number', 'Sahə'),
+    'area_units': ('value', 'm²'),
+    'rooms': ('column', 'Otaq Sayı'),
+    'floor': ('column', 'Mərtəbə'),
+    'floors': ('column', 'Mərtəbə sayı'),
+    'price_value': ('number', 'price'),
+    'price_currency': ('value', 'AZN'),
+    'city_name': ('column', 'Şəhər'),
+    'location_name': ('column', 'Ünvan'),
+    'updated_at': ('column', 'date'),
+    'url': ('column', 'url'),
+    'scraped_at': ('value', SCRAPED_AT),
+    'source_dataset': ('value', 'ofis_listings'),
+    'is_business': ('value', True),
+    'contact_phone': ('column', 'phone'),
+    'contact_name': ('optional', 'contact_name'),
+    'description': ('column', 'description'),
+}
+
+REAL_ESTATE_FEB = {
+    'id': ('column', 'id'),
+    'area_value': ('number', 'area'),
+    'area_units': ('value', 'm²'),
+    'rooms': ('column', 'rooms'),
+    'floor': ('column', 'floor'),
+    'floors': ('column', 'total_floors'),
+    'price_value': ('column', 'price'),
+    'price_currency': ('column', 'currency'),
+    'city_name': ('optional', 'district'),
+    'location_name': ('optional', 'location', 'address'),
+    'location_full_name': ('column', 'address'),
+    'has_repair': ('equals', 'has_repair', 1),
+    'updated_at': ('optional', 'updated_at', 'listing_date'),
+    'url': ('column', 'source_url'),
+    'scraped_at': ('default', 'created_at', ('value', SCRAPED_AT)),
+    'source_dataset': ('value', 'real_estate_feb_2025'),
+    'contact_phone': ('column', 'contact_phone'),
+    'latitude': ('column', 'latitude'),
+    'longitude': ('column', 'longitude'),
+    'description': ('column', 'description'),
+    'photos': ('optional', 'photos'),
+}
+
+VILLA_AZ = {
+    'id': ('column', 'listing_id'),
+    'area_value': ('column', 'Sahə, m²'),
+    'area_units': ('value', 'm²'),
+    'rooms': ('column', 'Otaq sayı'),
+    'floor': ('if_present', ('floor', 'Mərtəbə')),
+    'price_value': ('number', 'price'),
+    'price_currency': ('value', 'AZN'),
+    'city_name': ('column', 'Şəhər'),
+    'location_name': ('column', 'address'),
+    'has_bill_of_sale': ('has_value', 'Əmlak sənədi'),
+    'updated_at': ('column', 'date'),
+    'url': ('column', 'url'),
+    'scraped_at': ('value', SCRAPED_AT),
+    'source_dataset': ('value', 'villa_az'),
+    'contact_phone': ('column', 'phones'),
+    'contact_name': ('optional', 'owner_name'),
+    'description': ('column', 'description'),
+    'property_type': ('value', 'villa'),
+}
+
+EVV_AZ = {
+    'id': ('column', 'listing_id'),
+    'area_value': ('number', 'area'),
+    'area_units': ('value', 'm²'),
+    'rooms': ('first_number', 'rooms'),
+    'floor': ('floor', 'floor'),
+    'price_value': ('number', 'price'),
+    'price_currency': ('value', 'AZN'),
+    'city_name': ('column', 'city'),
+    'location_name': ('column', 'location'),
+    'has_bill_of_sale': ('has_value', 'document'),
+    'has_mortgage': ('has_value', 'mortgage'),
+    'updated_at': ('optional', 'update_date', 'post_date'),
+    'url': ('column', 'url'),
+    'scraped_at': ('value', SCRAPED_AT),
+    'source_dataset': ('value', 'evv_az'),
+    'contact_phone': ('column', 'phone'),
+    'contact_name': ('optional', 'seller_name'),
+    'description': ('column', 'description'),
+}
+
+BINAM_LISTINGS = {
+    'id': ('column', 'listing_code'),
+    'area_value': ('number', 'area'),
+    'area_units': ('value', 'm²'),
+    'rooms': ('first_number', 'rooms'),
+    'floor': ('floor', 'floor'),
+    'price_value': ('number', 'price'),
+    'price_currency': ('value', 'AZN'),
+    'city_name': ('column', 'country_city'),
+    'location_name': ('column', 'district'),
+    'location_full_name': ('optional', 'address'),
+    'company_name': ('optional', 'company_name'),
+    'updated_at': ('column', 'listing_date'),
+    'url': ('column', 'url'),
+    'scraped_at': ('value', SCRAPED_AT),
+    'source_dataset': ('value', 'binam_listings'),
+    'contact_phone': ('optional', 'phone', 'mobile'),
+    'contact_name': ('optional', 'contact_name'),
+    'description': ('column', 'description'),
+}
+
+BINA_XLSX = {
+    'id': ('column', 'item_id'),
+    'area_value': ('number', 'area'),
+    'area_units': ('value', 'm²'),
+    'rooms': ('first_number', 'room count'),
+    'floor': ('floor', 'floor'),
+    'price_value': ('column', 'price'),
+    'price_currency': ('column', 'currency'),
+    'has_mortgage': ('has_value', 'mortgage'),
+    'url': ('column', 'url'),
+    'scraped_at': ('value', SCRAPED_AT),
+    'source_dataset': ('value', 'bina_xlsx'),
+    'contact_phone': ('column', 'phone number'),
+    'contact_name': ('optional', 'owner name'),
+    'description': ('column', 'description'),
+}
+
+def transform(file_path, mapping):
+    """Transform one source file with its mapping, keeping all original columns with an 'orig_' prefix"""
     print(f"Processing: {file_path}")
-    df = pd.read_csv(file_path)
-
-    original = add_prefix_to_columns(df.copy(), 'orig')
-
-    base = create_base_df(len(df))
-    base['id'] = df['id']
-    base['area_value'] = df['area']
-    base['area_units'] = 'm²'
-    base['rooms'] = df['rooms']
-    base['floor'] = df['floor'].apply(parse_floor)
-    base['floors'] = df['floor'].apply(parse_total_floors)
-    base['price_value'] = df['price_raw'].fillna(0)
-    base['price_currency'] = 'AZN'
-    base['location_name'] = df['address']
-    base['url'] = df['url']
-    base['updated_at'] = df['date']
-    base['scraped_at'] = datetime.now().isoformat()
-    base['source_dataset'] = 'binalar_listings'
-    base['contact_phone'] = df['phone']
-    base['description'] = df['description']
-
-    result = pd.concat([base, original], axis=1)
-    print(f"  Rows: {len(result):,}")
-    return result
+    df = read_excel(file_path) if file_path.endswith('.xlsx') else read_csv(file_path)
 
-def transform_yeniemlak_xlsx(file_path):
-    """Transform yeniemlak.xlsx"""
-    print(f"Processing: {file_path}")
-    df = pd.read_excel(file_path)
-
-    original = add_prefix_to_columns(df.copy(), 'orig')
+    if mapping is None:
+        # Already in the baseline format: add the source and keep the columns as they are
+        df['source_dataset'] = 'bina_sale'
+        result = df.assign(**add_prefix_to_columns(df, 'orig'))
+    else:
+        result = base_frame(apply_mapping(df, mapping), add_prefix_to_columns(df, 'orig'))
 
-    base = create_base_df(len(df))
-    base['id'] = range(len(df))
-    base['url'] = df['link'].apply(lambda x: f'https://{x}' if not str(x).startswith('http') else x)
-    base['scraped_at'] = datetime.now().isoformat()
-    base['source_dataset'] = 'yeniemlak_xlsx'
-    base['contact_phone'] = df['phone_number']
-
-    result = pd.concat([base, original], axis=1)
     print(f"  Rows: {len(result):,}")
     return result
 
-def transform_yeniemlak_csv(file_path):
-    """Transform yeniemlakAz.csv"""
-    print(f"Processing: {file_path}")
-    df = pd.read_csv(file_path)
-
-    original = add_prefix_to_columns(df.copy(), 'orig')
-
-    base = create_base_df(len(df))
-    base['id'] = df.get('id', range(len(df)))
-    base['price_value'] = df.get('price', 0)
-    base['rooms'] = df.get('room_count')
-    base['area_value'] = df.get('area')
-    base['area_units'] = 'm²'
-    base['floor'] = df.get('flat', df.get('floor'))
-    base['location_name'] = df.get('address')
-    base['location_full_name'] = df.get('address_2')
-    base['url'] = df['href'].apply(lambda x: f'https://{x}' if not str(x).startswith('http') else x) if 'href' in df else np.nan
-    base['updated_at'] = df.get('date')
-    base['scraped_at'] = datetime.now().isoformat()
-    base['source_dataset'] = 'yeniemlakAz_csv'
-    base['contact_phone'] = df.get('owner_number')
-    base['contact_name'] = df.get('owner_name')
-    base['description'] = df.get('description')
-    base['has_bill_of_sale'] = df.get('doc_type').notna() if 'doc_type' in df else False
-
-    result = pd.concat([base, original], axis=1)
-    print(f"  Rows: {len(result):,}")
-    return result
-
-def transform_myhome_listings(file_path):
-    """Transform myhome_listings_20250929_003143.csv"""
-    print(f"Processing: {file_path}")
-    df = pd.read_csv(file_path)
-
-    original = add_prefix_to_columns(df.copy(), 'orig')
-
-    base = create_base_df(len(df))
-    base['id'] = df['id']
-    base['area_value'] = df['area']
-    base['area_units'] = 'm²'
-    base['rooms'] = df['room_count']
-    base['floor'] = df['floor']
-    base['floors'] = df['floor_count']
-    base['city_name'] = df['city']
-    base['location_name'] = df['region']
-    base['location_full_name'] = df['address']
-    base['price_value'] = df['price'].apply(lambda x: safe_numeric(str(x).replace('AZN', '')))
-    base['price_currency'] = 'AZN'
-    base['has_repair'] = df['is_repaired'].fillna(0) > 0
-    base['vipped'] = df['is_vip'] == 1
-    base['featured'] = df['is_premium'] == 1
-    base['has_mortgage'] = df['credit_possible'] == 1
-    base['updated_at'] = df['formatted_date']
-    base['scraped_at'] = datetime.now().isoformat()
-    base['source_dataset'] = 'myhome'
-    base['contact_phone'] = df['phone_number']
-    base['latitude'] = df['lat']
-    base['longitude'] = df['lng']
-    base['description'] = df['description']
-
-    result = pd.concat([base, original], axis=1)
-    print(f"  Rows: {len(result):,}")
-    return result
 
-def transform_unvan_xlsx(file_path):
-    """Transform unvan.xlsx"""
-    print(f"Processing: {file_path}")
-    df = pd.read_excel(file_path)
-
-    original = add_prefix_to_columns(df.copy(), 'orig')
-
-    base = create_base_df(len(df))
-    base['id'] = df['id']
-    base['area_value'] = df['area'].apply(lambda x: safe_numeric(str(x)))
-    base['area_units'] = 'm²'
-    base['rooms'] = df['room_count'].apply(extract_number_from_string)
-    base['price_value'] = df['price'].apply(lambda x: safe_numeric(str(x)))
-    base['price_currency'] = 'AZN'
-    base['location_name'] = df['address']
-    base['location_full_name'] = df['address_2']
-    base['company_name'] = df['owner']
-    base['updated_at'] = df['date']
-    base['url'] = df['link']
-    base['scraped_at'] = datetime.now().isoformat()
-    base['source_dataset'] = 'unvan'
-    base['contact_phone'] = df['phone']
-    base['description'] = df.get('long_descr', df.get('short_descr'))
-
-    result = pd.concat([base, original], axis=1)
-    print(f"  Rows: {len(result):,}")
-    return result
-
-def transform_mulk_data(file_path):
-    """Transform mulk_data_20250929_143644.csv"""
-    print(f"Processing: {file_path}")
-    df = pd.read_csv(file_path)
-
-    original = add_prefix_to_columns(df.copy(), 'orig')
-
-    base = create_base_df(len(df))
-    base['id'] = df['listing_id']
-    base['area_value'] = df['area_numeric']
-    base['area_units'] = 'm²'
-    base['rooms'] = df['rooms_numeric']
-    base['floor'] = df['current_floor']
-    base['floors'] = df['total_floors']
-    base['price_value'] = df['price_numeric']
-    base['price_currency'] = 'AZN'
-    base['location_name'] = df['location_district']
-    base['location_full_name'] = df['full_address']
-    base['has_bill_of_sale'] = df['deed_available'] == 'Yes'
-    base['updated_at'] = df['listing_date']
-    base['url'] = df['url']
-    base['photos_count'] = df['image_count']
-    base['scraped_at'] = df['scraped_at']
-    base['source_dataset'] = 'mulk'
-    base['contact_phone'] = df['contact_phone']
-    base['contact_name'] = df.get('contact_person')
-    base['description'] = df['description']
-
-    result = pd.concat([base, original], axis=1)
-    print(f"  Rows: {len(result):,}")
-    return result
-
-def transform_emlak_xlsx(file_path):
-    """Transform emlakAz.xlsx"""
-    print(f"Processing: {file_path}")
-    df = pd.read_excel(file_path)
-
-    original = add_prefix_to_columns(df.copy(), 'orig')
-
-    base = create_base_df(len(df))
-    base['id'] = df['id']
-    base['area_value'] = df['area'].apply(lambda x: safe_numeric(str(x)))
-    base['area_units'] = 'm²'
-    base['rooms'] = df['room_count'].apply(extract_number_from_string)
-    base['floor'] = df['flat'].apply(parse_floor)
-    base['price_value'] = df['price'].apply(lambda x: safe_numeric(str(x)))
-    base['price_currency'] = 'AZN'
-    base['has_repair'] = df['repair_type'].notna()
-    base['has_bill_of_sale'] = df['document_type'].notna()
-    base['updated_at'] = df['date']
-    base['url'] = 'https://emlak.az' + df['href'].astype(str)
-    base['scraped_at'] = datetime.now().isoformat()
-    base['source_dataset'] = 'emlakAz'
-    base['contact_phone'] = df.get('phone_cleaned', df.get('phone_numbers'))
-    base['contact_name'] = df.get('seller_name')
-    base['description'] = df['description']
-
-    result = pd.concat([base, original], axis=1)
-    print(f"  Rows: {len(result):,}")
-    return result
-
-def transform_ofis_listings(file_path):
-    """Transform ofis_listings.csv"""
-    print(f"Processing: {file_path}")
-    df = pd.read_csv(file_path)
-
-    original = add_prefix_to_columns(df.copy(), 'orig')
-
-    base = create_base_df(len(df))
-    base['id'] = df['listing_id']
-    base['area_value'] = df['Sahə'].apply(lambda x: safe_numeric(str(x)))
-    base['area_units'] = 'm²'
-    base['rooms'] = df['Otaq Sayı']
-    base['floor'] = df['Mərtəbə']
-    base['floors'] = df['Mərtəbə sayı']
-    base['price_value'] = df['price'].apply(lambda x: safe_numeric(str(x)))
-    base['price_currency'] = 'AZN'
-    base['city_name'] = df['Şəhər']
-    base['location_name'] = df['Ünvan']
-    base['updated_at'] = df['date']
-    base['url'] = df['url']
-    base['scraped_at'] = datetime.now().isoformat()
-    base['source_dataset'] = 'ofis_listings'
-    base['is_business'] = True
-    base['contact_phone'] = df['phone']
-    base['contact_name'] = df.get('contact_name')
-    base['description'] = df['description']
-
-    result = pd.concat([base, original], axis=1)
-    print(f"  Rows: {len(result):,}")
-    return result
-
-def transform_real_estate_feb(file_path):
-    """Transform real_estate_data_25_feb_2025.csv"""
-    print(f"Processing: {file_path}")
-    df = pd.read_csv(file_path)
-
-    original = add_prefix_to_columns(df.copy(), 'orig')
-
-    base = create_base_df(len(df))
-    base['id'] = df['id']
-    base['area_value'] = df['area'].apply(lambda x: safe_numeric(str(x)))
-    base['area_units'] = 'm²'
-    base['rooms'] = df['rooms']
-    base['floor'] = df['floor']
-    base['floors'] = df['total_floors']
-    base['price_value'] = df['price']
-    base['price_currency'] = df['currency']
-    base['city_name'] = df.get('district')
-    base['location_name'] = df.get('location', df.get('address'))
-    base['location_full_name'] = df['address']
-    base['has_repair'] = df['has_repair'] == 1
-    base['updated_at'] = df.get('updated_at', df.get('listing_date'))
-    base['url'] = df['source_url']
-    base['scraped_at'] = df.get('created_at', datetime.now().isoformat())
-    base['source_dataset'] = 'real_estate_feb_2025'
-    base['contact_phone'] = df['contact_phone']
-    base['latitude'] = df['latitude']
-    base['longitude'] = df['longitude']
-    base['description'] = df['description']
-    base['photos'] = df.get('photos')
-
-    result = pd.concat([base, original], axis=1)
-    print(f"  Rows: {len(result):,}")
-    return result
+# Source files and their mappings (None for the baseline-format file), in output order
+SOURCES = [
+    ('data/bina_sale_20251117_213934.csv', None),
+    ('data/ipotekaAz.xlsx', IPOTEKA_XLSX),
+    ('data/ipotekaAz.csv', IPOTEKA_CSV),
+    ('data/binalar_listings.csv', BINALAR_LISTINGS),
+    ('data/yeniemlak.xlsx', YENIEMLAK_XLSX),
+    ('data/yeniemlakAz.csv', YENIEMLAK_CSV),
+    ('data/myhome_listings_20250929_003143.csv', MYHOME_LISTINGS),
+    ('data/unvan.xlsx', UNVAN_XLSX),
+    ('data/mulk_data_20250929_143644.csv', MULK_DATA),
+    ('data/emlakAz.xlsx', EMLAK_XLSX),
+    ('data/ofis_listings.csv', OFIS_LISTINGS),
+    ('data/real_estate_data_25_feb_2025.csv', REAL_ESTATE_FEB),
+    ('data/villa_az_complete_dataset.csv', VILLA_AZ),
+    ('data/evv_az_listings.csv', EVV_AZ),
+    ('data/binam_listings_1758793717.csv', BINAM_LISTINGS),
+    ('data/bina.xlsx', BINA_XLSX),
+]
 
-def transform_villa_az(file_path):
-    """Transform villa_az_complete_dataset.csv"""
-    print(f"Processing: {file_path}")
-    df = pd.read_csv(file_path)
-
-    original = add_prefix_to_columns(df.copy(), 'orig')
-
-    base = create_base_df(len(df))
-    base['id'] = df['listing_id']
-    base['area_value'] = df['Sahə, m²']
-    base['area_units'] = 'm²'
-    base['rooms'] = df['Otaq sayı']
-    base['floor'] = df['Mərtəbə'].apply(parse_floor) if 'Mərtəbə' in df else np.nan
-    base['price_value'] = df['price'].apply(lambda x: safe_numeric(str(x)))
-    base['price_currency'] = 'AZN'
-    base['city_name'] = df['Şəhər']
-    base['location_name'] = df['address']
-    base['has_bill_of_sale'] = df['Əmlak sənədi'].notna()
-    base['updated_at'] = df['date']
-    base['url'] = df['url']
-    base['scraped_at'] = datetime.now().isoformat()
-    base['source_dataset'] = 'villa_az'
-    base['contact_phone'] = df['phones']
-    base['contact_name'] = df.get('owner_name')
-    base['description'] = df['description']
-    base['property_type'] = 'villa'
-
-    result = pd.concat([base, original], axis=1)
-    print(f"  Rows: {len(result):,}")
-    return result
+def run_transform(source):
+    """Pool worker: transform one source file, None if it fails"""
+    file_path, mapping = source
+    try:
+        return transform(file_path, mapping)
+    except Exception as e:
+        print(f"  ERROR: {e}\n")
+        return None
 
-def transform_evv_az(file_path):
-    """Transform evv_az_listings.csv"""
-    print(f"Processing: {file_path}")
-    df = pd.read_csv(file_path)
-
-    original = add_prefix_to_columns(df.copy(), 'orig')
-
-    base = create_base_df(len(df))
-    base['id'] = df['listing_id']
-    base['area_value'] = df['area'].apply(lambda x: safe_numeric(str(x)))
-    base['area_units'] = 'm²'
-    base['rooms'] = df['rooms'].apply(extract_number_from_string)
-    base['floor'] = df['floor'].apply(parse_floor)
-    base['price_value'] = df['price'].apply(lambda x: safe_numeric(str(x)))
-    base['price_currency'] = 'AZN'
-    base['city_name'] = df['city']
-    base['location_name'] = df['location']
-    base['has_bill_of_sale'] = df['document'].notna()
-    base['has_mortgage'] = df['mortgage'].notna()
-    base['updated_at'] = df.get('update_date', df.get('post_date'))
-    base['url'] = df['url']
-    base['scraped_at'] = datetime.now().isoformat()
-    base['source_dataset'] = 'evv_az'
-    base['contact_phone'] = df['phone']
-    base['contact_name'] = df.get('seller_name')
-    base['description'] = df['description']
-
-    result = pd.concat([base, original], axis=1)
-    print(f"  Rows: {len(result):,}")
-    return result
 
-def transform_binam_listings(file_path):
-    """Transform binam_listings_1758793717.csv"""
-    print(f"Processing: {file_path}")
-    df = pd.read_csv(file_path)
-
-    original = add_prefix_to_columns(df.copy(), 'orig')
-
-    base = create_base_df(len(df))
-    base['id'] = df['listing_code']
-    base['area_value'] = df['area'].apply(lambda x: safe_numeric(str(x)))
-    base['area_units'] = 'm²'
-    base['rooms'] = df['rooms'].apply(extract_number_from_string)
-    base['floor'] = df['floor'].apply(parse_floor)
-    base['price_value'] = df['price'].apply(lambda x: safe_numeric(str(x)))
-    base['price_currency'] = 'AZN'
-    base['city_name'] = df['country_city']
-    base['location_name'] = df['district']
-    base['location_full_name'] = df.get('address')
-    base['company_name'] = df.get('company_name')
-    base['updated_at'] = df['listing_date']
-    base['url'] = df['url']
-    base['scraped_at'] = datetime.now().isoformat()
-    base['source_dataset'] = 'binam_listings'
-    base['contact_phone'] = df.get('phone', df.get('mobile'))
-    base['contact_name'] = df.get('contact_name')
-    base['description'] = df['description']
-
-    result = pd.concat([base, original], axis=1)
-    print(f"  Rows: {len(result):,}")
-    return result
+# Parquet dtypes for object columns by the kinds of value (pd.api.types.infer_dtype)
+# they hold across all sources; any other mix, such as ids that are numbers in
+# one source and text in another, is stored as text
+PARQUET_DTYPES = [
+    ({'boolean'}, 'boolean'),
+    ({'integer'}, 'Int64'),
+    ({'integer', 'floating', 'mixed-integer-float'}, 'float64'),
+]
 
-def transform_bina_xlsx(file_path):
-    """Transform bina.xlsx"""
-    print(f"Processing: {file_path}")
-    df = pd.read_excel(file_path)
-
-    original = add_prefix_to_columns(df.copy(), 'orig')
-
-    base = create_base_df(len(df))
-    base['id'] = df['item_id']
-    base['area_value'] = df['area'].apply(lambda x: safe_numeric(str(x)))
-    base['area_units'] = 'm²'
-    base['rooms'] = df['room count'].apply(extract_number_from_string)
-    base['floor'] = df['floor'].apply(parse_floor)
-    base['price_value'] = df['price']
-    base['price_currency'] = df['currency']
-    base['has_mortgage'] = df['mortgage'].notna()
-    base['url'] = df['url']
-    base['scraped_at'] = datetime.now().isoformat()
-    base['source_dataset'] = 'bina_xlsx'
-    base['contact_phone'] = df['phone number']
-    base['contact_name'] = df.get('owner name')
-    base['description'] = df['description']
-
-    result = pd.concat([base, original], axis=1)
-    print(f"  Rows: {len(result):,}")
-    return result
+def parquet_dtypes(datasets, columns):
+    """Dtype each of the object columns is stored with in the combined Parquet file"""
+    dtypes = {}
+    for col in columns:
+        kinds = {pd.api.types.infer_dtype(dataset[col], skipna=True)
+                 for dataset in datasets if col in dataset.columns} - {'empty'}
+        dtypes[col] = next((dtype for allowed, dtype in PARQUET_DTYPES if kinds and kinds <= allowed), 'str')
+    return dtypes
 
 
 def main():
@@ -546,130 +520,81 @@ def main():
     print("="*80)
     print()
 
-    datasets = []
-
-    # Process each dataset
-    try:
-        datasets.append(transform_bina_sale('data/bina_sale_20251117_213934.csv'))
-    except Exception as e:
-        print(f"  ERROR: {e}\n")
-
-    try:
-        datasets.append(transform_ipoteka_xlsx('data/ipotekaAz.xlsx'))
-    except Exception as e:
-        print(f"  ERROR: {e}\n")
-
-    try:
-        datasets.append(transform_ipoteka_csv('data/ipotekaAz.csv'))
-    except Exception as e:
-        print(f"  ERROR: {e}\n")
-
-    try:
-        datasets.append(transform_binalar_listings('data/binalar_listings.csv'))
-    except Exception as e:
-        print(f"  ERROR: {e}\n")
-
-    try:
-        datasets.append(transform_yeniemlak_xlsx('data/yeniemlak.xlsx'))
-    except Exception as e:
-        print(f"  ERROR: {e}\n")
+    # The transforms are independent, so each runs in its own process
+    with Pool(min(len(SOURCES), os.cpu_count() or 1)) as pool:
+        results = pool.map(run_transform, SOURCES)
+    datasets = [df for df in results if df is not None]
 
-    try:
-        datasets.append(transform_yeniemlak_csv('data/yeniemlakAz.csv'))
-    except Exception as e:
-        print(f"  ERROR: {e}\n")
-
-    try:
-        datasets.append(transform_myhome_listings('data/myhome_listings_20250929_003143.csv'))
-    except Exception as e:
-        print(f"  ERROR: {e}\n")
-
-    try:
-        datasets.append(transform_unvan_xlsx('data/unvan.xlsx'))
-    except Exception as e:
-        print(f"  ERROR: {e}\n")
-
-    try:
-        datasets.append(transform_mulk_data('data/mulk_data_20250929_143644.csv'))
-    except Exception as e:
-        print(f"  ERROR: {e}\n")
-
-    try:
-        datasets.append(transform_emlak_xlsx('data/emlakAz.xlsx'))
-    except Exception as e:
-        print(f"  ERROR: {e}\n")
-
-    try:
-        datasets.append(transform_ofis_listings('data/ofis_listings.csv'))
-    except Exception as e:
-        print(f"  ERROR: {e}\n")
-
-    try:
-        datasets.append(transform_real_estate_feb('data/real_estate_data_25_feb_2025.csv'))
-    except Exception as e:
-        print(f"  ERROR: {e}\n")
-
-    try:
-        datasets.append(transform_villa_az('data/villa_az_complete_dataset.csv'))
-    except Exception as e:
-        print(f"  ERROR: {e}\n")
-
-    try:
-        datasets.append(transform_evv_az('data/evv_az_listings.csv'))
-    except Exception as e:
-        print(f"  ERROR: {e}\n")
-
-    try:
-        datasets.append(transform_binam_listings('data/binam_listings_1758793717.csv'))
-    except Exception as e:
-        print(f"  ERROR: {e}\n")
-
-    try:
-        datasets.append(transform_bina_xlsx('data/bina.xlsx'))
-    except Exception as e:
-        print(f"  ERROR: {e}\n")
-
-    # Combine all datasets
+    # Combine all datasets: the column order and dtypes pd.concat would give
+    # come from the empty frames alone, so each dataset is written straight
+    # to the outputs instead of being copied into one combined frame first
     print("\n" + "="*80)
     print("COMBINING ALL DATASETS...")
     print("="*80)
-    combined_df = pd.concat(datasets, ignore_index=True, sort=False)
+    layout = pd.concat([dataset.iloc[:0] for dataset in datasets], ignore_index=True, sort=False)
 
-    # Save combined dataset
+    # Object columns have no Arrow type of their own: flags that are bool in
+    # some sources and missing in others stay boolean in the Parquet copy, and
+    # only columns really mixing numbers and text (ids, phones) become text
+    parquet = parquet_dtypes(datasets, layout.columns[layout.dtypes == object])
+    schema = pa.Schema.from_pandas(layout.astype(parquet), preserve_index=False)
+
+    # Save combined dataset as CSV, and as Parquet for fast typed reloads,
+    # tallying the summary as each dataset goes out
     output_file = 'data/combined_real_estate_master.csv'
+    output_parquet = 'data/combined_real_estate_master.parquet'
     print(f"\nSaving to: {output_file}")
-    combined_df.to_csv(output_file, index=False)
-
-    # Also save as Excel for better viewing
-    output_excel = 'data/combined_real_estate_master.xlsx'
-    print(f"Saving to: {output_excel}")
-    combined_df.to_excel(output_excel, index=False, engine='openpyxl')
+    print(f"Saving to: {output_parquet}")
+    summary_columns = [col for col in BASELINE_COLUMNS[:15] if col in layout.columns]
+    total_rows = 0
+    source_counts = pd.Series(dtype='int64')
+    non_null = pd.Series(0, index=summary_columns)
+    with open(output_file, 'w', newline='') as out, \
+            pq.ParquetWriter(output_parquet, schema, compression='zstd') as writer:
+        for i, dataset in enumerate(datasets):
+            dataset = dataset.reindex(columns=layout.columns).astype(layout.dtypes)
+            dataset.to_csv(out, index=False, header=(i == 0))
+            writer.write_table(pa.Table.from_pandas(dataset.astype(parquet),
+                                                    schema=schema, preserve_index=False))
+
+            total_rows += len(dataset)
+            source_counts = source_counts.add(dataset['source_dataset'].value_counts(), fill_value=0)
+            non_null += dataset[summary_columns].notna().sum()
+
+    # Writing the workbook is slow, so the Excel copy is opt-in; only it needs
+    # all rows in one frame, and it is skipped when they cannot fit one sheet
+    output_excel = 'data/combined_real_estate_master.xlsx' if '--excel' in sys.argv[1:] else None
+    if output_excel and total_rows >= EXCEL_MAX_ROWS:
+        print(f"Skipping Excel: {total_rows:,} rows do not fit one sheet")
+        output_excel = None
+    if output_excel:
+        print(f"Saving to: {output_excel}")
+        write_excel(pd.concat(datasets, ignore_index=True, sort=False), output_excel)
 
     # Print summary
     print("\n" + "="*80)
     print("COMBINED DATASET SUMMARY")
     print("="*80)
-    print(f"Total rows: {len(combined_df):,}")
-    print(f"Total columns: {len(combined_df.columns):,}")
+    print(f"Total rows: {total_rows:,}")
+    print(f"Total columns: {len(layout.columns):,}")
 
-    print(f"\nBaseline columns: {len([c for c in combined_df.columns if not c.startswith('orig_')])}")
-    print(f"Original columns preserved: {len([c for c in combined_df.columns if c.startswith('orig_')])}")
+    print(f"\nBaseline columns: {len([c for c in layout.columns if not c.startswith('orig_')])}")
+    print(f"Original columns preserved: {len([c for c in layout.columns if c.startswith('orig_')])}")
 
     print(f"\n\nRows per source:")
-    source_counts = combined_df['source_dataset'].value_counts().sort_index()
-    for source, count in source_counts.items():
+    for source, count in source_counts.astype('int64').sort_index().items():
         print(f"  {source:30s}: {count:>8,}")
 
     print(f"\n\nBaseline column completeness:")
-    for col in BASELINE_COLUMNS[:15]:  # Show first 15
-        if col in combined_df.columns:
-            non_null = combined_df[col].notna().sum()
-            pct = (non_null / len(combined_df) * 100)
-            print(f"  {col:30s}: {non_null:>8,} ({pct:5.1f}%)")
+    for col in summary_columns:  # Show first 15
+        pct = (non_null[col] / total_rows * 100)
+        print(f"  {col:30s}: {non_null[col]:>8,} ({pct:5.1f}%)")
 
     print(f"\n\nFiles saved:")
-    print(f"  CSV:   {output_file}")
-    print(f"  Excel: {output_excel}")
+    print(f"  CSV:     {output_file}")
+    print(f"  Parquet: {output_parquet}")
+    if output_excel:
+        print(f"  Excel:   {output_excel}")
     print("\nTransformation complete! No data was lost.")
 
 if __name__ == "__main__":
@@ -4,11 +4,16 @@ Real Estate Dataset Transformation - All to Bina.az Format
 Transforms all datasets to match bina_sale_20251117_213934.csv schema (30 columns)
 """
 
+import os
+import io
+import sys
+from contextlib import redirect_stdout
+from multiprocessing import Pool
 import pandas as pd
 import numpy as np
-from datetime import datetime
 import warnings
 import re
+from _sources import EXCEL_MAX_ROWS, SCRAPED_AT, read_csv, read_excel, write_excel
 warnings.filterwarnings('ignore')
 
 # Exact schema from bina_sale_20251117_213934.csv (30 columns)
@@ -20,528 +25,475 @@ BINA_SCHEMA = [
     'vipped', 'featured', 'updated_at', 'path', 'photos_count', 'photos', 'url', 'scraped_at'
 ]
 
-def create_empty_row():
-    """Create a dict with all schema columns initialized to None"""
-    return {col: None for col in BINA_SCHEMA}
-
-def safe_numeric(value, default=None):
-    """Safely convert value to numeric"""
-    if pd.isna(value):
-        return default
-    try:
-        if isinstance(value, str):
-            value = value.replace(',', '').replace(' ', '').replace('m²', '').replace('AZN', '').replace('₼', '').strip()
-        return pd.to_numeric(value, errors='coerce')
-    except:
-        return default
-
-def safe_int(value, default=None):
-    """Safely convert to integer"""
-    num = safe_numeric(value, default)
-    if num is not None and not pd.isna(num):
-        return int(num)
-    return default
-
-def safe_float(value, default=None):
-    """Safely convert to float"""
-    num = safe_numeric(value, default)
-    if num is not None and not pd.isna(num):
-        return float(num)
-    return default
-
-def safe_bool(value, default=False):
-    """Safely convert to boolean"""
-    if pd.isna(value):
-        return default
-    if isinstance(value, bool):
-        return value
-    if isinstance(value, (int, float)):
-        return bool(value)
-    if isinstance(value, str):
-        value_lower = value.lower().strip()
-        if value_lower in ['yes', 'true', '1', 'var', 'bəli']:
-            return True
-        if value_lower in ['no', 'false', '0', 'yox']:
-            return False
-    return default
-
-def parse_floor(floor_str):
-    """Parse floor string like '5/9' to get current floor"""
-    if pd.isna(floor_str):
-        return None
-    s = str(floor_str).strip()
-    if '/' in s:
-        parts = s.split('/')
-        return safe_float(parts[0])
-    return safe_float(s)
-
-def parse_total_floors(floor_str):
-    """Parse floor string like '5/9' to get total floors"""
-    if pd.isna(floor_str):
-        return None
-    s = str(floor_str).strip()
-    if '/' in s:
-        parts = s.split('/')
-        if len(parts) > 1:
-            return safe_float(parts[1])
-    return None
-
-def extract_number(s):
-    """Extract first number from string"""
-    if pd.isna(s):
-        return None
-    s = str(s)
-    numbers = re.findall(r'\d+\.?\d*', s)
-    if numbers:
-        return safe_float(numbers[0])
-    return None
-
-def transform_row(row_data):
-    """Transform a row to bina schema"""
-    return pd.Series(row_data, index=BINA_SCHEMA)
+# Separators, units and currency signs stripped from numeric text, in this order
+NUMERIC_NOISE = (',', ' ', 'm²', 'AZN', '₼')
 
-# =============================================================================
-# TRANSFORMATION FUNCTIONS FOR EACH DATASET
-# =============================================================================
-
-def transform_bina_sale(file_path):
-    """Baseline: bina_sale_20251117_213934.csv"""
-    print(f"Processing: {file_path}")
-    df = pd.read_csv(file_path)
-
-    # Already in correct format, just ensure column order
-    result = df[BINA_SCHEMA].copy()
-
-    print(f"  Rows: {len(result):,}")
-    return result
-
-def transform_ipoteka_xlsx(file_path):
-    """Transform ipotekaAz.xlsx"""
-    print(f"Processing: {file_path}")
-    df = pd.read_excel(file_path)
-
-    rows = []
-    for _, row in df.iterrows():
-        new_row = create_empty_row()
-        new_row['id'] = safe_int(row.get('announcement_id'))
-        new_row['area_value'] = safe_float(extract_number(row.get('area')))
-        new_row['area_units'] = 'm²'
-        new_row['leased'] = False
-        new_row['floor'] = parse_floor(row.get('flat'))
-        new_row['floors'] = safe_float(row.get('baxis_sayi'))
-        new_row['rooms'] = safe_float(row.get('room_count'))
-        new_row['city_name'] = str(row.get('area')) if pd.notna(row.get('area')) else None
-        new_row['price_value'] = 0
-        new_row['price_currency'] = 'AZN'
-        new_row['has_mortgage'] = False
-        new_row['has_bill_of_sale'] = safe_bool(pd.notna(row.get('document_type')))
-        new_row['has_repair'] = safe_bool(pd.notna(row.get('repair_type')))
-        new_row['updated_at'] = str(row.get('update_date')) if pd.notna(row.get('update_date')) else None
-        new_row['url'] = f"https://ipoteka.az/elan/{row.get('announcement_id')}" if pd.notna(row.get('announcement_id')) else None
-        new_row['scraped_at'] = datetime.now().isoformat()
-        rows.append(new_row)
-
-    result = pd.DataFrame(rows, columns=BINA_SCHEMA)
-    print(f"  Rows: {len(result):,}")
-    return result
+# Text spellings safe_bools understands (compared lower-cased and stripped)
+BOOL_VALUES = {
+    'yes': True, 'true': True, '1': True, 'var': True, 'bəli': True,
+    'no': False, 'false': False, '0': False, 'yox': False,
+}
 
-def transform_ipoteka_csv(file_path):
-    """Transform ipotekaAz.csv"""
-    print(f"Processing: {file_path}")
-    df = pd.read_csv(file_path)
-
-    rows = []
-    for _, row in df.iterrows():
-        new_row = create_empty_row()
-        new_row['id'] = safe_int(row.get('announcement_id'))
-        new_row['area_value'] = safe_float(extract_number(row.get('area')))
-        new_row['area_units'] = 'm²'
-        new_row['leased'] = False
-        new_row['floor'] = parse_floor(row.get('flat'))
-        new_row['floors'] = safe_float(row.get('baxis_sayi'))
-        new_row['rooms'] = safe_float(row.get('room_count'))
-        new_row['city_name'] = str(row.get('area')) if pd.notna(row.get('area')) else None
-        new_row['price_value'] = 0
-        new_row['price_currency'] = 'AZN'
-        new_row['has_mortgage'] = False
-        new_row['has_bill_of_sale'] = safe_bool(pd.notna(row.get('document_type')))
-        new_row['has_repair'] = safe_bool(pd.notna(row.get('repair_type')))
-        new_row['updated_at'] = str(row.get('update_date')) if pd.notna(row.get('update_date')) else None
-        new_row['url'] = f"https://ipoteka.az/elan/{row.get('announcement_id')}" if pd.notna(row.get('announcement_id')) else None
-        new_row['scraped_at'] = datetime.now().isoformat()
-        rows.append(new_row)
-
-    result = pd.DataFrame(rows, columns=BINA_SCHEMA)
-    print(f"  Rows: {len(result):,}")
-    return result
+# First number in a string, e.g. the 55.5 in '55.5 m²'
+FIRST_NUMBER = re.compile(r'(\d+\.?\d*)')
 
-def transform_binalar_listings(file_path):
-    """Transform binalar_listings.csv"""
-    print(f"Processing: {file_path}")
-    df = pd.read_csv(file_path)
-
-    rows = []
-    for _, row in df.iterrows():
-        new_row = create_empty_row()
-        new_row['id'] = safe_int(row.get('id'))
-        new_row['area_value'] = safe_float(row.get('area'))
-        new_row['area_units'] = 'm²'
-        new_row['leased'] = False
-        new_row['floor'] = parse_floor(row.get('floor'))
-        new_row['floors'] = parse_total_floors(row.get('floor'))
-        new_row['rooms'] = safe_float(row.get('rooms'))
-        new_row['location_name'] = str(row.get('address')) if pd.notna(row.get('address')) else None
-        new_row['price_value'] = safe_int(row.get('price_raw'), 0)
-        new_row['price_currency'] = 'AZN'
-        new_row['updated_at'] = str(row.get('date')) if pd.notna(row.get('date')) else None
-        new_row['url'] = str(row.get('url')) if pd.notna(row.get('url')) else None
-        new_row['scraped_at'] = datetime.now().isoformat()
-        rows.append(new_row)
-
-    result = pd.DataFrame(rows, columns=BINA_SCHEMA)
-    print(f"  Rows: {len(result):,}")
-    return result
+# Floor strings like '5/9': the fields before the first '/' and between the first and second one
+FLOOR_PARTS = re.compile(r'^([^/]*)(?:/([^/]*))?')
 
-def transform_yeniemlak_xlsx(file_path):
-    """Transform yeniemlak.xlsx"""
-    print(f"Processing: {file_path}")
-    df = pd.read_excel(file_path)
-
-    rows = []
-    for idx, row in df.iterrows():
-        new_row = create_empty_row()
-        new_row['id'] = idx + 1
-        link = str(row.get('link', ''))
-        new_row['url'] = f'https://{link}' if link and not link.startswith('http') else link
-        new_row['scraped_at'] = datetime.now().isoformat()
-        new_row['price_currency'] = 'AZN'
-        new_row['area_units'] = 'm²'
-        rows.append(new_row)
-
-    result = pd.DataFrame(rows, columns=BINA_SCHEMA)
-    print(f"  Rows: {len(result):,}")
-    return result
-
-def transform_yeniemlak_csv(file_path):
-    """Transform yeniemlakAz.csv"""
-    print(f"Processing: {file_path}")
-    df = pd.read_csv(file_path)
-
-    rows = []
-    for _, row in df.iterrows():
-        new_row = create_empty_row()
-        new_row['id'] = safe_int(row.get('id'))
-        new_row['area_value'] = safe_float(row.get('area'))
-        new_row['area_units'] = 'm²'
-        new_row['leased'] = False
-        new_row['floor'] = safe_float(row.get('flat'))
-        new_row['rooms'] = safe_float(row.get('room_count'))
-        new_row['location_name'] = str(row.get('address')) if pd.notna(row.get('address')) else None
-        new_row['location_full_name'] = str(row.get('address_2')) if pd.notna(row.get('address_2')) else None
-        new_row['price_value'] = safe_int(row.get('price'), 0)
-        new_row['price_currency'] = 'AZN'
-        new_row['has_bill_of_sale'] = safe_bool(pd.notna(row.get('doc_type')))
-        new_row['updated_at'] = str(row.get('date')) if pd.notna(row.get('date')) else None
-        href = row.get('href')
-        new_row['url'] = f'https://{href}' if pd.notna(href) and not str(href).startswith('http') else str(href) if pd.notna(href) else None
-        new_row['scraped_at'] = datetime.now().isoformat()
-        rows.append(new_row)
-
-    result = pd.DataFrame(rows, columns=BINA_SCHEMA)
-    print(f"  Rows: {len(result):,}")
-    return result
-
-def transform_myhome_listings(file_path):
-    """Transform myhome_listings_20250929_003143.csv"""
-    print(f"Processing: {file_path}")
-    df = pd.read_csv(file_path)
-
-    rows = []
-    for _, row in df.iterrows():
-        new_row = create_empty_row()
-        new_row['id'] = safe_int(row.get('id'))
-        new_row['area_value'] = safe_float(row.get('area'))
-        new_row['area_units'] = 'm²'
-        new_row['leased'] = False
-        new_row['floor'] = safe_float(row.get('floor'))
-        new_row['floors'] = safe_float(row.get('floor_count'))
-        new_row['rooms'] = safe_float(row.get('room_count'))
-        new_row['city_name'] = str(row.get('city')) if pd.notna(row.get('city')) else None
-        new_row['location_name'] = str(row.get('region')) if pd.notna(row.get('region')) else None
-        new_row['location_full_name'] = str(row.get('address')) if pd.notna(row.get('address')) else None
-        new_row['price_value'] = safe_int(extract_number(row.get('price')), 0)
-        new_row['price_currency'] = 'AZN'
-        new_row['has_mortgage'] = safe_bool(row.get('credit_possible'))
-        new_row['has_repair'] = safe_bool(row.get('is_repaired'))
-        new_row['vipped'] = safe_bool(row.get('is_vip'))
-        new_row['featured'] = safe_bool(row.get('is_premium'))
-        new_row['updated_at'] = str(row.get('formatted_date')) if pd.notna(row.get('formatted_date')) else None
-        new_row['photos_count'] = 0
-        new_row['scraped_at'] = datetime.now().isoformat()
-        rows.append(new_row)
-
-    result = pd.DataFrame(rows, columns=BINA_SCHEMA)
-    print(f"  Rows: {len(result):,}")
-    return result
-
-def transform_unvan_xlsx(file_path):
-    """Transform unvan.xlsx"""
-    print(f"Processing: {file_path}")
-    df = pd.read_excel(file_path)
-
-    rows = []
-    for _, row in df.iterrows():
-        new_row = create_empty_row()
-        new_row['id'] = safe_int(row.get('id'))
-        new_row['area_value'] = safe_float(extract_number(row.get('area')))
-        new_row['area_units'] = 'm²'
-        new_row['leased'] = False
-        new_row['rooms'] = safe_float(extract_number(row.get('room_count')))
-        new_row['location_name'] = str(row.get('address')) if pd.notna(row.get('address')) else None
-        new_row['location_full_name'] = str(row.get('address_2')) if pd.notna(row.get('address_2')) else None
-        new_row['price_value'] = safe_int(extract_number(row.get('price')), 0)
-        new_row['price_currency'] = 'AZN'
-        new_row['company_name'] = str(row.get('owner')) if pd.notna(row.get('owner')) else None
-        new_row['updated_at'] = str(row.get('date')) if pd.notna(row.get('date')) else None
-        new_row['url'] = str(row.get('link')) if pd.notna(row.get('link')) else None
-        new_row['scraped_at'] = datetime.now().isoformat()
-        rows.append(new_row)
-
-    result = pd.DataFrame(rows, columns=BINA_SCHEMA)
-    print(f"  Rows: {len(result):,}")
-    return result
-
-def transform_mulk_data(file_path):
-    """Transform mulk_data_20250929_143644.csv"""
-    print(f"Processing: {file_path}")
-    df = pd.read_csv(file_path)
-
-    rows = []
-    for _, row in df.iterrows():
-        new_row = create_empty_row()
-        new_row['id'] = safe_int(row.get('listing_id'))
-        new_row['area_value'] = safe_float(row.get('area_numeric'))
-        new_row['area_units'] = 'm²'
-        new_row['leased'] = False
-        new_row['floor'] = safe_float(row.get('current_floor'))
-        new_row['floors'] = safe_float(row.get('total_floors'))
-        new_row['rooms'] = safe_float(row.get('rooms_numeric'))
-        new_row['location_name'] = str(row.get('location_district')) if pd.notna(row.get('location_district')) else None
-        new_row['location_full_name'] = str(row.get('full_address')) if pd.notna(row.get('full_address')) else None
-        new_row['price_value'] = safe_int(row.get('price_numeric'), 0)
-        new_row['price_currency'] = 'AZN'
-        new_row['has_bill_of_sale'] = safe_bool(row.get('deed_available') == 'Yes')
-        new_row['updated_at'] = str(row.get('listing_date')) if pd.notna(row.get('listing_date')) else None
-        new_row['url'] = str(row.get('url')) if pd.notna(row.get('url')) else None
-        new_row['photos_count'] = safe_int(row.get('image_count'), 0)
-        new_row['scraped_at'] = str(row.get('scraped_at')) if pd.notna(row.get('scraped_at')) else datetime.now().isoformat()
-        rows.append(new_row)
-
-    result = pd.DataFrame(rows, columns=BINA_SCHEMA)
-    print(f"  Rows: {len(result):,}")
-    return result
+# =============================================================================
+# VECTORIZED COLUMN CONVERSIONS
+# =============================================================================
 
-def transform_emlak_xlsx(file_path):
-    """Transform emlakAz.xlsx"""
-    print(f"Processing: {file_path}")
-    df = pd.read_excel(file_path)
-
-    rows = []
-    for _, row in df.iterrows():
-        new_row = create_empty_row()
-        new_row['id'] = safe_int(row.get('id'))
-        new_row['area_value'] = safe_float(extract_number(row.get('area')))
-        new_row['area_units'] = 'm²'
-        new_row['leased'] = False
-        new_row['floor'] = parse_floor(row.get('flat'))
-        new_row['rooms'] = safe_float(extract_number(row.get('room_count')))
-        new_row['price_value'] = safe_int(extract_number(row.get('price')), 0)
-        new_row['price_currency'] = 'AZN'
-        new_row['has_repair'] = safe_bool(pd.notna(row.get('repair_type')))
-        new_row['has_bill_of_sale'] = safe_bool(pd.notna(row.get('document_type')))
-        new_row['company_name'] = str(row.get('seller_name')) if pd.notna(row.get('seller_name')) else None
-        new_row['updated_at'] = str(row.get('date')) if pd.notna(row.get('date')) else None
-        href = row.get('href')
-        new_row['url'] = f'https://emlak.az{href}' if pd.notna(href) else None
-        new_row['scraped_at'] = datetime.now().isoformat()
-        rows.append(new_row)
-
-    result = pd.DataFrame(rows, columns=BINA_SCHEMA)
-    print(f"  Rows: {len(result):,}")
-    return result
+def column(df, name, default=None):
+    """Column-wise row.get(name, default): the column, or default throughout if df lacks it"""
+    if name in df.columns:
+        return df[name]
+    return pd.Series(default, index=df.index, dtype=object)
+
+def present(df, name):
+    """Column-wise pd.notna(row.get(name)): the column's non-null flags, all False if df lacks it"""
+    if name in df.columns:
+        return df[name].notna().to_numpy()
+    return np.zeros(len(df), dtype=bool)
+
+def safe_numerics(values):
+    """Numbers of a column, text parsed once NUMERIC_NOISE is stripped; NaN where missing or unparsable"""
+    if pd.api.types.is_bool_dtype(values):
+        return values.astype('int64')
+    if pd.api.types.is_numeric_dtype(values):
+        return values
+    text = values.astype(str)
+    for token in NUMERIC_NOISE:
+        text = text.str.replace(token, '', regex=False)
+    return pd.to_numeric(text.str.strip(), errors='coerce')
+
+def safe_floats(values):
+    """Numbers of a column as floats, NaN where there is none"""
+    return safe_numerics(values).astype('float64')
+
+def safe_ints(values, default=None):
+    """Numbers of a column truncated to integers, default (or NaN without one) where there is none"""
+    numbers = safe_numerics(values)
+    if pd.api.types.is_integer_dtype(numbers):
+        return numbers
+    whole = np.trunc(numbers.astype('float64'))
+    if default is not None:
+        whole = whole.fillna(default)
+    # Integer dtype only when nothing is missing, as for a column of ints and None
+    return whole if whole.isna().any() else whole.astype('int64')
+
+def safe_bools(df, column, default=False):
+    """Flags from a column of df: non-zero numbers and BOOL_VALUES text, default otherwise (or if the column is missing)"""
+    if column not in df.columns:
+        return np.full(len(df), default)
+    values = df[column]
+    if pd.api.types.is_numeric_dtype(values):
+        flags = values.ne(0).where(values.notna(), default)
+    else:
+        # Numbers among the text (e.g. Excel cells of 2 or 1.0 next to 'var') are
+        # flags by value as above; only the strings themselves (str(x) == x) are
+        # looked up in BOOL_VALUES
+        text = values.astype(str)
+        is_text = (text == values).to_numpy()
+        numbers = pd.to_numeric(values.where(~is_text), errors='coerce')
+        flags = np.where(is_text, text.str.lower().str.strip().map(BOOL_VALUES).fillna(default),
+                         numbers.ne(0).where(numbers.notna(), default))
+    return np.asarray(flags, dtype=bool)
+
+def extract_numbers(values):
+    """First number in the text of each value, NaN where there is none"""
+    # Columns read as numbers are their own first number, unless the text of a
+    # value has a sign or an exponent the pattern would cut off
+    if pd.api.types.is_numeric_dtype(values) and not pd.api.types.is_bool_dtype(values):
+        numbers = values.astype('float64')
+        if (numbers.isna() | (numbers == 0) | numbers.between(1e-4, 1e16, inclusive='left')).all():
+            return numbers.abs()  # Only turns -0.0 into 0.0
+    return safe_floats(values.astype(str).str.extract(FIRST_NUMBER, expand=False))
+
+def split_floors(values):
+    """Floor and total floors from strings like '5/9' (total floors NaN without a '/')"""
+    # Columns read as numbers hold floors alone
+    if pd.api.types.is_numeric_dtype(values) and not pd.api.types.is_bool_dtype(values):
+        return pd.DataFrame({'floor': values.astype('float64'), 'floors': np.nan}, index=values.index)
+    parts = values.astype(str).str.strip().str.extract(FLOOR_PARTS)
+    return pd.DataFrame({'floor': safe_floats(parts[0]), 'floors': safe_floats(parts[1])})
+
+def texts(values):
+    """Vectorized str(x) if pd.notna(x) else None"""
+    # Timestamps go through object so they print with their time, as str() does
+    text = (values.astype(object) if pd.api.types.is_datetime64_any_dtype(values) else values).astype(str)
+    return text.astype(object).where(values.notna(), None)
+
+def prefixed(prefix, values):
+    """Vectorized prefix + str(x) if pd.notna(x) else None, for URLs built from ids and paths"""
+    return (prefix + texts(values)).where(values.notna(), None)
+
+def bina_frame(cols, size):
+    """Output frame in BINA_SCHEMA order; unset or entirely missing columns hold None, as in a frame of row dicts"""
+    # Built once, already in schema order, around the converted columns without
+    # copying them (an empty source has no values, so all its columns are None)
+    data = {col: cols[col] if col in cols and size and np.any(pd.notna(cols[col])) else None
+            for col in BINA_SCHEMA}
+    return pd.DataFrame(data, index=pd.RangeIndex(size), copy=False)
 
-def transform_ofis_listings(file_path):
-    """Transform ofis_listings.csv"""
-    print(f"Processing: {file_path}")
-    df = pd.read_csv(file_path)
-
-    rows = []
-    for _, row in df.iterrows():
-        new_row = create_empty_row()
-        new_row['id'] = safe_int(row.get('listing_id'))
-        new_row['area_value'] = safe_float(extract_number(row.get('Sahə')))
-        new_row['area_units'] = 'm²'
-        new_row['leased'] = False
-        new_row['floor'] = safe_float(row.get('Mərtəbə'))
-        new_row['floors'] = safe_float(row.get('Mərtəbə sayı'))
-        new_row['rooms'] = safe_float(row.get('Otaq Sayı'))
-        new_row['city_name'] = str(row.get('Şəhər')) if pd.notna(row.get('Şəhər')) else None
-        new_row['location_name'] = str(row.get('Ünvan')) if pd.notna(row.get('Ünvan')) else None
-        new_row['price_value'] = safe_int(extract_number(row.get('price')), 0)
-        new_row['price_currency'] = 'AZN'
-        new_row['is_business'] = True
-        new_row['updated_at'] = str(row.get('date')) if pd.notna(row.get('date')) else None
-        new_row['url'] = str(row.get('url')) if pd.notna(row.get('url')) else None
-        new_row['scraped_at'] = datetime.now().isoformat()
-        rows.append(new_row)
-
-    result = pd.DataFrame(rows, columns=BINA_SCHEMA)
-    print(f"  Rows: {len(result):,}")
-    return result
+# =============================================================================
+# COLUMN MAPPINGS FOR EACH DATASET
+# =============================================================================
 
-def transform_real_estate_feb(file_path):
-    """Transform real_estate_data_25_feb_2025.csv"""
+def map_column(df, rule, floors):
+    """One BINA_SCHEMA column from a mapping rule, see MAPPINGS ('5/9' floor strings are split once per column in `floors`)"""
+    kind, *args = rule
+    if kind == 'value':
+        return args[0]
+    if kind == 'row_number':
+        return np.arange(1, len(df) + 1)
+    if kind == 'has_value':
+        return present(df, args[0])
+    if kind == 'flag':
+        return safe_bools(df, args[0])
+    if kind == 'str':
+        # str() of a missing value is 'nan'
+        return column(df, args[0], args[1]).astype(str).fillna('nan')
+
+    # The rest read the column named by their first argument, missing throughout if df lacks it
+    values = column(df, args[0])
+    if kind == 'text':
+        return texts(values)
+    if kind == 'text_or':
+        return texts(values).fillna(map_column(df, args[1], floors))
+    if kind == 'int':
+        return safe_ints(values, *args[1:])
+    if kind == 'float':
+        return safe_floats(values)
+    if kind == 'first_number':
+        return extract_numbers(values)
+    if kind == 'first_int':
+        return safe_ints(extract_numbers(values), 0)
+    if kind in ('floor', 'floors'):
+        if args[0] not in floors:
+            floors[args[0]] = split_floors(values)
+        return floors[args[0]][kind]
+    if kind == 'equals':
+        return values.eq(args[1]).to_numpy()
+    if kind == 'https':
+        if len(args) > 1 and args[0] not in df.columns:
+            return args[1]
+        text = texts(values)
+        return text.where(text.isna() | text.str.startswith('http', na=False), 'https://' + text)
+    if kind == 'prefixed':
+        return prefixed(args[1], values)
+    raise ValueError(f"Unknown mapping rule: {kind}")
+
+# BINA_SCHEMA columns of each source as rules (kind, *args) for map_column;
+# columns without a rule are left missing:
+#   ('value', v)                     the constant v
+#   ('row_number',)                  1, 2, 3, ...
+#   ('text', name)                   texts of the column
+#   ('text_or', name, rule)          texts of the column, `rule` where it is missing
+#   ('str', name, v)                 str() of each value, v throughout if the column is missing
+#   ('int', name[, default])         safe_ints of the column
+#   ('float', name)                  safe_floats of the column
+#   ('first_number', name)           extract_numbers of the column
+#   ('first_int', name)              that number truncated, 0 where there is none
+#   ('floor', name), ('floors', name)  the parts of split_floors of the column
+#   ('has_value', name)              present of the column
+#   ('equals', name, v)              whether the column equals v
+#   ('flag', name)                   safe_bools of the column
+#   ('https', name[, v])             the text with 'https://' added where it lacks 'http',
+#                                    v throughout if the column is missing
+#   ('prefixed', name, prefix)       prefixed of the column
+# A source column that is missing reads as missing throughout
+IPOTEKA_XLSX = {
+    'id': ('int', 'announcement_id'),
+    'area_value': ('first_number', 'area'),
+    'area_units': ('value', 'm²'),
+    'leased': ('value', False),
+    'floor': ('floor', 'flat'),
+    'floors': ('float', 'baxis_sayi'),
+    'rooms': ('float', 'room_count'),
+    'city_name': ('text', 'area'),
+    'price_value': ('value', 0),
+    'price_currency': ('value', 'AZN'),
+    'has_mortgage': ('value', False),
+    'has_bill_of_sale': ('has_value', 'document_type'),
+    'has_repair': ('has_value', 'repair_type'),
+    'updated_at': ('text', 'update_date'),
+    'url': ('prefixed', 'announcement_id', 'https://ipoteka.az/elan/'),
+    'scraped_at': ('value', SCRAPED_AT),
+}
+
+# The CSV export has the same columns as the workbook
+IPOTEKA_CSV = IPOTEKA_XLSX
+
+BINALAR_LISTINGS = {
+    'id': ('int', 'id'),
+    'area_value': ('float', 'area'),
+    'area_units': ('value', 'm²'),
+    'leased': ('value', False),
+    'floor': ('floor', 'floor'),
+    'floors': ('floors', 'floor'),
+    'rooms': ('float', 'rooms'),
+    'location_name': ('text', 'address'),
+    'price_value': ('int', 'price_raw', 0),
+    'price_currency': ('value', 'AZN'),
+    'updated_at': ('text', 'date'),
+    'url': ('text', 'url'),
+    'scraped_at': ('value', SCRAPED_AT),
+}
+
+YENIEMLAK_XLSX = {
+    'id': ('row_number',),
+    'url': ('https', 'link', ''),
+    'scraped_at': ('value', SCRAPED_AT),
+    'price_currency': ('value', 'AZN'),
+    'area_units': ('value', 'm²'),
+}
+
+YENIEMLAK_CSV = {
+    'id': ('int', 'id'),
+    'area_value': ('float', 'area'),
+    'area_units': ('value', 'm²'),
+    'leased': ('value', False),
+    'floor': ('float', 'flat'),
+    'rooms': ('float', 'room_count'),
+    'location_name': ('text', 'address'),
+    'location_full_name': ('text', 'address_2'),
+    'price_value': ('int', 'price', 0),
+    'price_currency': ('value', 'AZN'),
+    'has_bill_of_sale': ('has_value', 'doc_type'),
+    'updated_at': ('text', 'date'),
+    'url': ('https', 'href'),
+    'scraped_at': ('value', SCRAPED_AT),
+}
+
+MYHOME_LISTINGS = {
+    'id': ('int', 'id'),
+    'area_value': ('float', 'area'),
+    'area_units': ('value', 'm²'),
+    'leased': ('value', False),
+    'floor': ('float', 'floor'),
+    'floors': ('float', 'floor_count'),
+    'rooms': ('float', 'room_count'),
+    'city_name': ('text', 'city'),
+    'location_name': ('text', 'region'),
+    'location_full_name': ('text', 'address'),
+    'price_value': ('first_int', 'price'),
+    'price_currency': ('value', 'AZN'),
+    'has_mortgage': ('flag', 'credit_possible'),
+    'has_repair': ('flag', 'is_repaired'),
+    'vipped': ('flag', 'is_vip'),
+    'featured': ('flag', 'is_premium'),
+    'updated_at': ('text', 'formatted_date'),
+    'photos_count': ('value', 0),
+    'scraped_at': ('value', SCRAPED_AT),
+}
+
+UNVAN_XLSX = {
+    'id': ('int', 'id'),
+    'area_value': ('first_number', 'area'),
+    'area_units': ('value', 'm²'),
+    'leased': ('value', False),
+    'rooms': ('first_number', 'room_count'),
+    'location_name': ('text', 'address'),
+    'location_full_name': ('text', 'address_2'),
+    'price_value': ('first_int', 'price'),
+    'price_currency': ('value', 'AZN'),
+    'company_name': ('text', 'owner'),
+    'updated_at': ('text', 'date'),
+    'url': ('text', 'link'),
+    'scraped_at': ('value', SCRAPED_AT),
+}
+
+MULK_DATA = {
+    'id': ('int', 'listing_id'),
+    'area_value': ('float', 'area_numeric'),
+    'area_units': ('value', 'm²'),
+    'leased': ('value', False),
+    'floor': ('float', 'current_floor'),
+    'floors': ('float', 'total_floors'),
+    'rooms': ('float', 'rooms_numeric'),
+    'location_name': ('text', 'location_district'),
+    'location_full_name': ('text', 'full_address'),
+    'price_value': ('int', 'price_numeric', 0),
+    'price_currency': ('value', 'AZN'),
+    'has_bill_of_sale': ('equals', 'deed_available', 'Yes'),
+    'updated_at': ('text', 'listing_date'),
+    'url': ('text', 'url'),
+    'photos_count': ('int', 'image_count', 0),
+    'scraped_at': ('text_or', 'scraped_at', ('value', SCRAPED_AT)),
+}
+
+EMLAK_XLSX = {
+    'id': ('int', 'id'),
+    'area_value': ('first_number', 'area'),
+    'area_units': ('value', 'm²'),
+    'leased': ('value', False),
+    'floor': ('floor', 'flat'),
+    'rooms': ('first_number', 'room_count'),
+    'price_value': ('first_int', 'price'),
+    'price_currency': ('value', 'AZN'),
+    'has_repair': ('has_value', 'repair_type'),
+    'has_bill_of_sale': ('has_value', 'document_type'),
+    'company_name': ('text', 'seller_name'),
+    'updated_at': ('text', 'date'),
+    'url': ('prefixed', 'href', 'https://emlak.az'),
+    'scraped_at': ('value', SCRAPED_AT),
+}
+
+OFIS_LISTINGS = {
+    'id': ('int', 'listing_id'),
+    'area_value': ('first_number', 'Sahə'),
+    'area_units': ('value', 'm²'),
+    'leased': ('value', False),
+    'floor': ('float', 'Mərtəbə'),
+    'floors': ('float', 'Mərtəbə sayı'),
+    'rooms': ('float', 'Otaq Sayı'),
+    'city_name': ('text', 'Şəhər'),
+    'location_name': ('text', 'Ünvan'),
+    'price_value': ('first_int', 'price'),
+    'price_currency': ('value', 'AZN'),
+    'is_business': ('value', True),
+    'updated_at': ('text', 'date'),
+    'url': ('text', 'url'),
+    'scraped_at': ('value', SCRAPED_AT),
+}
+
+REAL_ESTATE_FEB = {
+    'id': ('int', 'id'),
+    'area_value': ('first_number', 'area'),
+    'area_units': ('value', 'm²'),
+    'leased': ('value', False),
+    'floor': ('float', 'floor'),
+    'floors': ('float', 'total_floors'),
+    'rooms': ('float', 'rooms'),
+    'city_name': ('text', 'district'),
+    'location_name': ('text_or', 'location', ('text', 'address')),
+    'location_full_name': ('text', 'address'),
+    'price_value': ('int', 'price', 0),
+    'price_currency': ('str', 'currency', 'AZN'),
+    'has_repair': ('flag', 'has_repair'),
+    'updated_at': ('text_or', 'updated_at', ('text', 'listing_date')),
+    'url': ('text', 'source_url'),
+    'photos': ('text', 'photos'),
+    'scraped_at': ('text_or', 'created_at', ('value', SCRAPED_AT)),
+}
+
+VILLA_AZ = {
+    'id': ('int', 'listing_id'),
+    'area_value': ('float', 'Sahə, m²'),
+    'area_units': ('value', 'm²'),
+    'leased': ('value', False),
+    'floor': ('floor', 'Mərtəbə'),
+    'rooms': ('float', 'Otaq sayı'),
+    'city_name': ('text', 'Şəhər'),
+    'location_name': ('text', 'address'),
+    'price_value': ('first_int', 'price'),
+    'price_currency': ('value', 'AZN'),
+    'has_bill_of_sale': ('has_value', 'Əmlak sənədi'),
+    'updated_at': ('text', 'date'),
+    'url': ('text', 'url'),
+    'scraped_at': ('value', SCRAPED_AT),
+}
+
+EVV_AZ = {
+    'id': ('int', 'listing_id'),
+    'area_value': ('first_number', 'area'),
+    'area_units': ('value', 'm²'),
+    'leased': ('value', False),
+    'floor': ('floor', 'floor'),
+    'rooms': ('first_number', 'rooms'),
+    'city_name': ('text', 'city'),
+    'location_name': ('text', 'location'),
+    'price_value': ('first_int', 'price'),
+    'price_currency': ('value', 'AZN'),
+    'has_bill_of_sale': ('has_value', 'document'),
+    'has_mortgage': ('has_value', 'mortgage'),
+    'company_name': ('text', 'seller_name'),
+    'updated_at': ('text_or', 'update_date', ('text', 'post_date')),
+    'url': ('text', 'url'),
+    'scraped_at': ('value', SCRAPED_AT),
+}
+
+BINAM_LISTINGS = {
+    'id': ('int', 'listing_code'),
+    'area_value': ('first_number', 'area'),
+    'area_units': ('value', 'm²'),
+    'leased': ('value', False),
+    'floor': ('floor', 'floor'),
+    'rooms': ('first_number', 'rooms'),
+    'city_name': ('text', 'country_city'),
+    'location_name': ('text', 'district'),
+    'location_full_name': ('text', 'address'),
+    'price_value': ('first_int', 'price'),
+    'price_currency': ('value', 'AZN'),
+    'company_name': ('text', 'company_name'),
+    'updated_at': ('text', 'listing_date'),
+    'url': ('text', 'url'),
+    'scraped_at': ('value', SCRAPED_AT),
+}
+
+BINA_XLSX = {
+    'id': ('int', 'item_id'),
+    'area_value': ('first_number', 'area'),
+    'area_units': ('value', 'm²'),
+    'leased': ('value', False),
+    'floor': ('floor', 'floor'),
+    'rooms': ('first_number', 'room count'),
+    'price_value': ('int', 'price', 0),
+    'price_currency': ('str', 'currency', 'AZN'),
+    'has_mortgage': ('has_value', 'mortgage'),
+    'company_name': ('text', 'owner name'),
+    'url': ('text', 'url'),
+    'scraped_at': ('value', SCRAPED_AT),
+}
+
+def transform(file_path, mapping):
+    """Transform one source file to BINA_SCHEMA with its mapping (None: the file already has the schema)"""
     print(f"Processing: {file_path}")
-    df = pd.read_csv(file_path)
-
-    rows = []
-    for _, row in df.iterrows():
-        new_row = create_empty_row()
-        new_row['id'] = safe_int(row.get('id'))
-        new_row['area_value'] = safe_float(extract_number(row.get('area')))
-        new_row['area_units'] = 'm²'
-        new_row['leased'] = False
-        new_row['floor'] = safe_float(row.get('floor'))
-        new_row['floors'] = safe_float(row.get('total_floors'))
-        new_row['rooms'] = safe_float(row.get('rooms'))
-        new_row['city_name'] = str(row.get('district')) if pd.notna(row.get('district')) else None
-        new_row['location_name'] = str(row.get('location')) if pd.notna(row.get('location')) else str(row.get('address')) if pd.notna(row.get('address')) else None
-        new_row['location_full_name'] = str(row.get('address')) if pd.notna(row.get('address')) else None
-        new_row['price_value'] = safe_int(row.get('price'), 0)
-        new_row['price_currency'] = str(row.get('currency', 'AZN'))
-        new_row['has_repair'] = safe_bool(row.get('has_repair'))
-        new_row['updated_at'] = str(row.get('updated_at')) if pd.notna(row.get('updated_at')) else str(row.get('listing_date')) if pd.notna(row.get('listing_date')) else None
-        new_row['url'] = str(row.get('source_url')) if pd.notna(row.get('source_url')) else None
-        new_row['photos'] = str(row.get('photos')) if pd.notna(row.get('photos')) else None
-        new_row['scraped_at'] = str(row.get('created_at')) if pd.notna(row.get('created_at')) else datetime.now().isoformat()
-        rows.append(new_row)
-
-    result = pd.DataFrame(rows, columns=BINA_SCHEMA)
-    print(f"  Rows: {len(result):,}")
-    return result
+    df = read_excel(file_path) if file_path.endswith('.xlsx') else read_csv(file_path)
 
-def transform_villa_az(file_path):
-    """Transform villa_az_complete_dataset.csv"""
-    print(f"Processing: {file_path}")
-    df = pd.read_csv(file_path)
-
-    rows = []
-    for _, row in df.iterrows():
-        new_row = create_empty_row()
-        new_row['id'] = safe_int(row.get('listing_id'))
-        new_row['area_value'] = safe_float(row.get('Sahə, m²'))
-        new_row['area_units'] = 'm²'
-        new_row['leased'] = False
-        new_row['floor'] = parse_floor(row.get('Mərtəbə'))
-        new_row['rooms'] = safe_float(row.get('Otaq sayı'))
-        new_row['city_name'] = str(row.get('Şəhər')) if pd.notna(row.get('Şəhər')) else None
-        new_row['location_name'] = str(row.get('address')) if pd.notna(row.get('address')) else None
-        new_row['price_value'] = safe_int(extract_number(row.get('price')), 0)
-        new_row['price_currency'] = 'AZN'
-        new_row['has_bill_of_sale'] = safe_bool(pd.notna(row.get('Əmlak sənədi')))
-        new_row['updated_at'] = str(row.get('date')) if pd.notna(row.get('date')) else None
-        new_row['url'] = str(row.get('url')) if pd.notna(row.get('url')) else None
-        new_row['scraped_at'] = datetime.now().isoformat()
-        rows.append(new_row)
-
-    result = pd.DataFrame(rows, columns=BINA_SCHEMA)
-    print(f"  Rows: {len(result):,}")
-    return result
+    if mapping is None:
+        # Already in correct format, just ensure column order
+        result = df[BINA_SCHEMA].copy()
+    else:
+        floors = {}
+        result = bina_frame({col: map_column(df, rule, floors) for col, rule in mapping.items()}, len(df))
 
-def transform_evv_az(file_path):
-    """Transform evv_az_listings.csv"""
-    print(f"Processing: {file_path}")
-    df = pd.read_csv(file_path)
-
-    rows = []
-    for _, row in df.iterrows():
-        new_row = create_empty_row()
-        new_row['id'] = safe_int(row.get('listing_id'))
-        new_row['area_value'] = safe_float(extract_number(row.get('area')))
-        new_row['area_units'] = 'm²'
-        new_row['leased'] = False
-        new_row['floor'] = parse_floor(row.get('floor'))
-        new_row['rooms'] = safe_float(extract_number(row.get('rooms')))
-        new_row['city_name'] = str(row.get('city')) if pd.notna(row.get('city')) else None
-        new_row['location_name'] = str(row.get('location')) if pd.notna(row.get('location')) else None
-        new_row['price_value'] = safe_int(extract_number(row.get('price')), 0)
-        new_row['price_currency'] = 'AZN'
-        new_row['has_bill_of_sale'] = safe_bool(pd.notna(row.get('document')))
-        new_row['has_mortgage'] = safe_bool(pd.notna(row.get('mortgage')))
-        new_row['company_name'] = str(row.get('seller_name')) if pd.notna(row.get('seller_name')) else None
-        new_row['updated_at'] = str(row.get('update_date')) if pd.notna(row.get('update_date')) else str(row.get('post_date')) if pd.notna(row.get('post_date')) else None
-        new_row['url'] = str(row.get('url')) if pd.notna(row.get('url')) else None
-        new_row['scraped_at'] = datetime.now().isoformat()
-        rows.append(new_row)
-
-    result = pd.DataFrame(rows, columns=BINA_SCHEMA)
     print(f"  Rows: {len(result):,}")
     return result
 
-def transform_binam_listings(file_path):
-    """Transform binam_listings_1758793717.csv"""
-    print(f"Processing: {file_path}")
-    df = pd.read_csv(file_path)
-
-    rows = []
-    for _, row in df.iterrows():
-        new_row = create_empty_row()
-        new_row['id'] = safe_int(row.get('listing_code'))
-        new_row['area_value'] = safe_float(extract_number(row.get('area')))
-        new_row['area_units'] = 'm²'
-        new_row['leased'] = False
-        new_row['floor'] = parse_floor(row.get('floor'))
-        new_row['rooms'] = safe_float(extract_number(row.get('rooms')))
-        new_row['city_name'] = str(row.get('country_city')) if pd.notna(row.get('country_city')) else None
-        new_row['location_name'] = str(row.get('district')) if pd.notna(row.get('district')) else None
-        new_row['location_full_name'] = str(row.get('address')) if pd.notna(row.get('address')) else None
-        new_row['price_value'] = safe_int(extract_number(row.get('price')), 0)
-        new_row['price_currency'] = 'AZN'
-        new_row['company_name'] = str(row.get('company_name')) if pd.notna(row.get('company_name')) else None
-        new_row['updated_at'] = str(row.get('listing_date')) if pd.notna(row.get('listing_date')) else None
-        new_row['url'] = str(row.get('url')) if pd.notna(row.get('url')) else None
-        new_row['scraped_at'] = datetime.now().isoformat()
-        rows.append(new_row)
-
-    result = pd.DataFrame(rows, columns=BINA_SCHEMA)
-    print(f"  Rows: {len(result):,}")
-    return result
+# Source files and their mappings (None for the Bina-format file), in output order
+SOURCES = [
+    ('data/bina_sale_20251117_213934.csv', None),
+    ('data/ipotekaAz.xlsx', IPOTEKA_XLSX),
+    ('data/ipotekaAz.csv', IPOTEKA_CSV),
+    ('data/binalar_listings.csv', BINALAR_LISTINGS),
+    ('data/yeniemlak.xlsx', YENIEMLAK_XLSX),
+    ('data/yeniemlakAz.csv', YENIEMLAK_CSV),
+    ('data/myhome_listings_20250929_003143.csv', MYHOME_LISTINGS),
+    ('data/unvan.xlsx', UNVAN_XLSX),
+    ('data/mulk_data_20250929_143644.csv', MULK_DATA),
+    ('data/emlakAz.xlsx', EMLAK_XLSX),
+    ('data/ofis_listings.csv', OFIS_LISTINGS),
+    ('data/real_estate_data_25_feb_2025.csv', REAL_ESTATE_FEB),
+    ('data/villa_az_complete_dataset.csv', VILLA_AZ),
+    ('data/evv_az_listings.csv', EVV_AZ),
+    ('data/binam_listings_1758793717.csv', BINAM_LISTINGS),
+    ('data/bina.xlsx', BINA_XLSX),
+]
 
-def transform_bina_xlsx(file_path):
-    """Transform bina.xlsx"""
-    print(f"Processing: {file_path}")
-    df = pd.read_excel(file_path)
-
-    rows = []
-    for _, row in df.iterrows():
-        new_row = create_empty_row()
-        new_row['id'] = safe_int(row.get('item_id'))
-        new_row['area_value'] = safe_float(extract_number(row.get('area')))
-        new_row['area_units'] = 'm²'
-        new_row['leased'] = False
-        new_row['floor'] = parse_floor(row.get('floor'))
-        new_row['rooms'] = safe_float(extract_number(row.get('room count')))
-        new_row['price_value'] = safe_int(row.get('price'), 0)
-        new_row['price_currency'] = str(row.get('currency', 'AZN'))
-        new_row['has_mortgage'] = safe_bool(pd.notna(row.get('mortgage')))
-        new_row['company_name'] = str(row.get('owner name')) if pd.notna(row.get('owner name')) else None
-        new_row['url'] = str(row.get('url')) if pd.notna(row.get('url')) else None
-        new_row['scraped_at'] = datetime.now().isoformat()
-        rows.append(new_row)
-
-    result = pd.DataFrame(rows, columns=BINA_SCHEMA)
-    print(f"  Rows: {len(result):,}")
-    return result
+def run_transform(source):
+    """Pool worker: transform one source file, returning (frame, None, output) or (None, error, output)"""
+    file_path, mapping = source
+    # Progress lines are collected and printed by main(), so the workers never
+    # write to the shared stdout and each source's lines stay together
+    output = io.StringIO()
+    with redirect_stdout(output):
+        try:
+            return transform(file_path, mapping), None, output.getvalue()
+        except Exception as e:
+            print(f"  ERROR: {e}\n")
+            return None, f"{file_path}: {str(e)}", output.getvalue()
 
 # =============================================================================
 # MAIN FUNCTION
@@ -555,63 +507,55 @@ def main():
     print("="*80)
     print()
 
-    datasets = []
-    errors = []
-
-    # Process each dataset
-    file_transforms = [
-        ('data/bina_sale_20251117_213934.csv', transform_bina_sale),
-        ('data/ipotekaAz.xlsx', transform_ipoteka_xlsx),
-        ('data/ipotekaAz.csv', transform_ipoteka_csv),
-        ('data/binalar_listings.csv', transform_binalar_listings),
-        ('data/yeniemlak.xlsx', transform_yeniemlak_xlsx),
-        ('data/yeniemlakAz.csv', transform_yeniemlak_csv),
-        ('data/myhome_listings_20250929_003143.csv', transform_myhome_listings),
-        ('data/unvan.xlsx', transform_unvan_xlsx),
-        ('data/mulk_data_20250929_143644.csv', transform_mulk_data),
-        ('data/emlakAz.xlsx', transform_emlak_xlsx),
-        ('data/ofis_listings.csv', transform_ofis_listings),
-        ('data/real_estate_data_25_feb_2025.csv', transform_real_estate_feb),
-        ('data/villa_az_complete_dataset.csv', transform_villa_az),
-        ('data/evv_az_listings.csv', transform_evv_az),
-        ('data/binam_listings_1758793717.csv', transform_binam_listings),
-        ('data/bina.xlsx', transform_bina_xlsx),
-    ]
-
-    for file_path, transform_func in file_transforms:
-        try:
-            df = transform_func(file_path)
-            datasets.append(df)
-        except Exception as e:
-            errors.append(f"{file_path}: {str(e)}")
-            print(f"  ERROR: {e}\n")
-
-    # Combine all datasets
+    # The transforms are independent, so each runs in its own process
+    with Pool(min(len(SOURCES), os.cpu_count() or 1)) as pool:
+        results = pool.map(run_transform, SOURCES)
+    for df, error, output in results:
+        print(output, end='')
+    datasets = [df for df, error, output in results if error is None]
+    errors = [error for df, error, output in results if error is not None]
+
+    # Combine all datasets: the dtypes pd.concat would give come from the
+    # empty frames alone, so each dataset is written straight to the CSV
+    # instead of being copied into one combined frame first
     print("\n" + "="*80)
     print("COMBINING DATASETS")
     print("="*80)
-    combined_df = pd.concat(datasets, ignore_index=True)
-
-    # Add source identifier based on scraped_at or create sequence
-    # For better tracking, add a record_id
-    combined_df.insert(0, 'record_id', range(1, len(combined_df) + 1))
+    layout = pd.concat([dataset.iloc[:0] for dataset in datasets], ignore_index=True)
 
-    # Save results
+    # Save results, tallying the summary as each dataset goes out
     output_csv = 'data/combined_real_estate_bina_format.csv'
-    output_excel = 'data/combined_real_estate_bina_format.xlsx'
-
     print(f"\nSaving CSV: {output_csv}")
-    combined_df.to_csv(output_csv, index=False)
-
-    print(f"Saving Excel: {output_excel}")
-    combined_df.to_excel(output_excel, index=False, engine='openpyxl')
+    total_records = 0
+    non_null = pd.Series(0, index=BINA_SCHEMA[:20])  # Show first 20
+    with open(output_csv, 'w', newline='') as out:
+        for i, dataset in enumerate(datasets):
+            dataset = dataset.astype(layout.dtypes)
+            # For better tracking, add a record_id running across all datasets
+            dataset.insert(0, 'record_id', range(total_records + 1, total_records + len(dataset) + 1))
+            dataset.to_csv(out, index=False, header=(i == 0))
+
+            total_records += len(dataset)
+            non_null += dataset[BINA_SCHEMA[:20]].notna().sum()
+
+    # Writing the workbook is slow, so the Excel copy is opt-in; only it needs
+    # all rows in one frame, and it is skipped when they cannot fit one sheet
+    output_excel = 'data/combined_real_estate_bina_format.xlsx' if '--excel' in sys.argv[1:] else None
+    if output_excel and total_records >= EXCEL_MAX_ROWS:
+        print(f"Skipping Excel: {total_records:,} records do not fit one sheet")
+        output_excel = None
+    if output_excel:
+        print(f"Saving Excel: {output_excel}")
+        combined_df = pd.concat(datasets, ignore_index=True)
+        combined_df.insert(0, 'record_id', range(1, total_records + 1))
+        write_excel(combined_df, output_excel)
 
     # Print summary
     print("\n" + "="*80)
     print("SUMMARY")
     print("="*80)
-    print(f"Total records: {len(combined_df):,}")
-    print(f"Total columns: {len(combined_df.columns)}")
+    print(f"Total records: {total_records:,}")
+    print(f"Total columns: {len(layout.columns) + 1}")
     print(f"Datasets processed: {len(datasets)}")
     if errors:
         print(f"Errors: {len(errors)}")
@@ -619,14 +563,14 @@ def main():
             print(f"  - {error}")
 
     print(f"\nColumn completeness (non-null values):")
-    for col in BINA_SCHEMA[:20]:  # Show first 20
-        non_null = combined_df[col].notna().sum()
-        pct = (non_null / len(combined_df) * 100) if len(combined_df) > 0 else 0
-        print(f"  {col:30s}: {non_null:>8,} ({pct:5.1f}%)")
+    for col, count in non_null.items():
+        pct = (count / total_records * 100) if total_records > 0 else 0
+        print(f"  {col:30s}: {count:>8,} ({pct:5.1f}%)")
 
     print(f"\nOutput files:")
     print(f"  {output_csv}")
-    print(f"  {output_excel}")
+    if output_excel:
+        print(f"  {output_excel}")
     print("\nDone!")
 
 if __name__ == "__main__":